@@ -0,0 +1,35 @@
+"""vacancy outbox
+
+Revision ID: 5e2a9c7d3b1f
+Revises: 8c1d2e4f5a6b
+Create Date: 2025-04-18 11:02:47.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2a9c7d3b1f'
+down_revision: Union[str, None] = '8c1d2e4f5a6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'vacancy_outbox',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('vacancy_id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id', name=op.f('vacancy_outbox_pkey'))
+    )
+    op.create_index(op.f('vacancy_outbox_vacancy_id_idx'), 'vacancy_outbox', ['vacancy_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('vacancy_outbox_vacancy_id_idx'), table_name='vacancy_outbox')
+    op.drop_table('vacancy_outbox')
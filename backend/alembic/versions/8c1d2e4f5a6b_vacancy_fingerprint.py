@@ -0,0 +1,28 @@
+"""vacancy fingerprint
+
+Revision ID: 8c1d2e4f5a6b
+Revises: f24468d6f7ad
+Create Date: 2025-04-14 10:12:31.514209
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1d2e4f5a6b'
+down_revision: Union[str, None] = 'f24468d6f7ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows get NULL and are rewritten once on the next collection
+    op.add_column('vacancies', sa.Column('fingerprint', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('vacancies', 'fingerprint')
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.auth.domain.entities import AnonymousUser, TokenType
+from src.auth.domain.exceptions import RefreshTokenNotValid
+from src.auth.presentation.dependencies import get_token_auth
+from src.auth.presentation.middlewares import AuthMiddleware, SecurityMiddleware
+
+
+class LegacyJWTRefreshMiddleware(BaseHTTPMiddleware):
+    """Previous refresh middleware (anonymous path), kept for comparison."""
+
+    async def dispatch(self, request: Request, call_next):
+        pre_auth = await get_token_auth(request=request)
+        if await pre_auth.read_token(TokenType.ACCESS) is None:
+            try:
+                await pre_auth.refresh_access_token()
+            except RefreshTokenNotValid:
+                ...
+        response = await call_next(request)
+        post_auth = await get_token_auth(request=request, response=response)
+        if await post_auth.read_token(TokenType.REFRESH):
+            await pre_auth.inject_access_token_from_request(response)
+        return response
+
+
+class LegacyAuthenticationMiddleware(BaseHTTPMiddleware):
+    """Previous authentication middleware (anonymous path), kept for comparison."""
+
+    async def dispatch(self, request: Request, call_next):
+        jwt_auth = await get_token_auth(request=request)
+        await jwt_auth.read_token(TokenType.ACCESS)
+        request.state.user = AnonymousUser()
+        return await call_next(request)
+
+
+class LegacySecurityMiddleware(BaseHTTPMiddleware):
+    """Previous security middleware, kept for comparison."""
+
+    async def dispatch(self, request: Request, call_next):
+        request_path = str(request.url)
+        if "/api" in request_path and "/api/users" not in request_path and not request.state.user.is_superuser:
+            return JSONResponse(status_code=403, content={"message": "Permission Denied"})
+        return await call_next(request)
+
+
+def make_app(middlewares: list[type]) -> FastAPI:
+    """Build an application with a cheap endpoint behind the given middlewares (outermost last)."""
+    app = FastAPI()
+
+    @app.get("/api/users/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    for middleware in middlewares:
+        app.add_middleware(middleware)
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    """Send anonymous requests one by one and return requests per second."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for _ in range(100):
+            await client.get("/api/users/ping")
+        started = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/api/users/ping")
+        return requests / (time.perf_counter() - started)
+
+
+async def main():
+    """Usage: python benchmark_auth_middleware.py [requests]"""
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    bare = await measure(make_app([]), requests)
+    legacy = await measure(
+        make_app([LegacySecurityMiddleware, LegacyAuthenticationMiddleware, LegacyJWTRefreshMiddleware]), requests
+    )
+    pure = await measure(make_app([SecurityMiddleware, AuthMiddleware]), requests)
+    print(f"no middleware:             {bare:8.0f} req/s")
+    print(f"BaseHTTPMiddleware (x3):   {legacy:8.0f} req/s")
+    print(f"pure ASGI (x2):            {pure:8.0f} req/s")
+    print(f"speedup: {pure / legacy:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.integrations.infrastructure.external_api.headhunter.schemas.response import HHVacancyResponse
+
+
+def make_page(per_page: int = 100) -> bytes:
+    """Build a search response body resembling a full HeadHunter page."""
+    items = [
+        {
+            "id": str(i),
+            "name": f"Python developer {i}",
+            "area": {"id": "1", "name": "Москва", "url": "https://api.hh.ru/areas/1"},
+            "salary": {"from": 200000, "to": 350000, "currency": "RUR", "gross": False},
+            "address": {
+                "city": "Москва", "street": "Тверская", "building": "1", "lat": 55.75, "lng": 37.61,
+                "metro_stations": [{"station_name": "Охотный ряд", "line_name": "Сокольническая", "lat": 55.75}]
+            },
+            "employer": {"id": "42", "name": "Employer", "trusted": True, "url": "https://api.hh.ru/employers/42"},
+            "snippet": {"requirement": "Опыт работы с Python " * 5, "responsibility": "Разработка сервисов " * 5},
+            "schedule": {"id": "remote", "name": "Удаленная работа"},
+            "experience": {"id": "between3And6", "name": "От 3 до 6 лет"},
+            "employment": {"id": "full", "name": "Полная занятость"},
+            "professional_roles": [{"id": "96", "name": "Программист, разработчик"}],
+            "published_at": "2025-03-01T10:00:00+0300",
+            "created_at": "2025-03-01T10:00:00+0300",
+            "alternate_url": f"https://hh.ru/vacancy/{i}",
+            "has_test": False,
+            "archived": False,
+        }
+        for i in range(per_page)
+    ]
+    return json.dumps({"found": 2000, "pages": 20, "page": 0, "per_page": per_page, "items": items}).encode()
+
+
+def main():
+    """Usage: python benchmark_hh_json_decoding.py"""
+    body = make_page()
+    number = 200
+    two_pass = timeit.timeit(lambda: HHVacancyResponse.model_validate(json.loads(body)), number=number)
+    one_pass = timeit.timeit(lambda: HHVacancyResponse.model_validate_json(body), number=number)
+    print(f"json.loads + model_validate: {two_pass / number * 1000:.2f} ms per page")
+    print(f"model_validate_json:         {one_pass / number * 1000:.2f} ms per page")
+    print(f"speedup: {two_pass / one_pass:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
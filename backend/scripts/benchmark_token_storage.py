@@ -0,0 +1,71 @@
+import asyncio
+import datetime
+import os
+import sys
+import time
+import uuid
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.auth.domain.entities import TokenData
+from src.auth.infrastructure.services.redis_token_storage import RedisTokenStorage
+from src.core.infrastructure.clients.redis import get_redis_client
+from src.utils.datetimes import get_timezone_now
+
+
+class LegacyRedisTokenStorage(RedisTokenStorage):
+    """Previous implementation (one round trip per command and per revoked JTI), kept for comparison."""
+
+    async def store_token(self, token_data: TokenData) -> None:
+        ttl = int((token_data.exp - get_timezone_now()).total_seconds())
+        await self.redis.setex(f"tokens:{token_data.jti}", ttl, token_data.user_id)
+        await self.redis.sadd(f"user_tokens:{token_data.user_id}", token_data.jti)
+
+    async def revoke_tokens_by_user(self, user_id: str) -> None:
+        token_keys = await self.redis.smembers(f"user_tokens:{user_id}")
+        for jti in token_keys:
+            await self.redis.delete(f"tokens:{jti}")
+        await self.redis.delete(f"user_tokens:{user_id}")
+
+
+def make_tokens(user_id: int, count: int) -> list[TokenData]:
+    """Build access/refresh token pairs resembling `count // 2` logins."""
+    now = get_timezone_now()
+    return [
+        TokenData(
+            user_id=user_id,
+            exp=now + datetime.timedelta(minutes=15 if i % 2 == 0 else 60 * 24 * 30),
+            jti=str(uuid.uuid4())
+        )
+        for i in range(count)
+    ]
+
+
+async def measure(storage: RedisTokenStorage, user_id: int, sessions: int) -> tuple[float, float]:
+    """Return the mean latency of a login (two stored tokens) and of revoking all sessions, in ms."""
+    tokens = make_tokens(user_id, sessions * 2)
+    started = time.perf_counter()
+    for token_data in tokens:
+        await storage.store_token(token_data)
+    login = (time.perf_counter() - started) / sessions * 1000
+    started = time.perf_counter()
+    await storage.revoke_tokens_by_user(str(user_id))
+    revoke = (time.perf_counter() - started) * 1000
+    return login, revoke
+
+
+async def main():
+    """Usage: python benchmark_token_storage.py [sessions] (uses REDIS_URL)"""
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    # Users unlikely to exist, so real sessions aren't touched
+    legacy_user_id, user_id = 10 ** 12, 10 ** 12 + 1
+    legacy_login, legacy_revoke = await measure(LegacyRedisTokenStorage(), legacy_user_id, sessions)
+    login, revoke = await measure(RedisTokenStorage(), user_id, sessions)
+    print(f"{sessions} sessions per user")
+    print(f"login:  {legacy_login:8.3f} ms -> {login:8.3f} ms")
+    print(f"revoke: {legacy_revoke:8.3f} ms -> {revoke:8.3f} ms")
+    await get_redis_client().aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
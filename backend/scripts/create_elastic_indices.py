@@ -9,8 +9,11 @@ from src.vacancies.infrastructure.elastic.indices import create_vacancy_index
 
 async def main():
     """Usage: python create_elastic_indices.py"""
-    result = await create_vacancy_index()
-    print(result)
+    index = await create_vacancy_index()
+    if index is None:
+        print("Vacancy index already exists")
+    else:
+        print(f"Created vacancy index {index}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+import asyncio
+import math
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from redis.asyncio import Redis
+
+from src.auth.infrastructure.services.redis_token_storage import RedisTokenStorage
+from src.core.infrastructure.clients.redis import get_redis_client
+
+# Sets of JTIs per user written before the sorted sets were introduced (they never expire)
+LEGACY_USER_KEY_PATTERN = "user_tokens:*"
+
+
+async def migrate_user_tokens(redis: Redis, legacy_user_key: str) -> int:
+    """
+    Move the still active JTIs of a legacy user set into the user's sorted set and delete the legacy set.
+
+    JTIs are scored by the expiration time of their token keys, and the sorted set expires
+    together with the last of its tokens, the same way `RedisTokenStorage.store_token` does.
+
+    :param redis: Redis client.
+    :param legacy_user_key: Key of the legacy set (`user_tokens:<user_id>`).
+    :return: Number of moved JTIs.
+    """
+    user_id = legacy_user_key.split(":", 1)[1]
+    jtis = list(await redis.smembers(legacy_user_key))
+    async with redis.pipeline(transaction=False) as pipe:
+        for jti in jtis:
+            pipe.pttl(RedisTokenStorage._get_token_key(jti))
+        ttls = await pipe.execute()
+
+    now = time.time()
+    # Expired (-2) and revoked tokens are dropped
+    active = {jti: now + ttl / 1000 for jti, ttl in zip(jtis, ttls) if ttl > 0}
+    user_key = RedisTokenStorage._get_user_key(user_id)
+    async with redis.pipeline(transaction=True) as pipe:
+        if active:
+            ttl = math.ceil(max(active.values()) - now)
+            pipe.zadd(user_key, active)
+            pipe.expire(user_key, ttl, nx=True)
+            pipe.expire(user_key, ttl, gt=True)
+        pipe.unlink(legacy_user_key)
+        await pipe.execute()
+    return len(active)
+
+
+async def main():
+    """Usage: python migrate_legacy_user_tokens.py (uses REDIS_URL, safe to run repeatedly)"""
+    redis = get_redis_client()
+    users, tokens = 0, 0
+    async for legacy_user_key in redis.scan_iter(match=LEGACY_USER_KEY_PATTERN, count=1000):
+        tokens += await migrate_user_tokens(redis, legacy_user_key)
+        users += 1
+    print(f"Migrated {tokens} active tokens of {users} users")
+    await redis.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
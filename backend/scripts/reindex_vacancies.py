@@ -0,0 +1,21 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.vacancies.presentation.tasks import reindex_vacancies_task
+
+
+def main():
+    """Usage: python reindex_vacancies.py [--source database|index] [--keep-old]"""
+    parser = argparse.ArgumentParser(description="Rebuild the vacancy search index without downtime")
+    parser.add_argument("--source", choices=["database", "index"], default="database")
+    parser.add_argument("--keep-old", action="store_true", help="Don't delete previous indices")
+    args = parser.parse_args()
+    result = reindex_vacancies_task(source=args.source, delete_old=not args.keep_old)
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
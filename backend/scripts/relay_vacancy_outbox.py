@@ -0,0 +1,16 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.vacancies.presentation.tasks import relay_vacancy_outbox_task
+
+
+def main():
+    """Usage: python relay_vacancy_outbox.py"""
+    result = relay_vacancy_outbox_task()
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
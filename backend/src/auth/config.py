@@ -24,6 +24,9 @@ class AuthConfig(BaseSettings):
         JWT_HEADER_TYPE: Prefix in the Authorization header (e.g., "Bearer").
         JWT_ACCESS_HEADER_NAME: Header name for access token.
         JWT_REFRESH_HEADER_NAME: Header name for refresh token.
+        JWT_CACHE_MAX_SIZE: Maximum number of verified tokens kept in the in-process cache.
+        JWT_CACHE_TTL_SECONDS: Maximum lifetime of a cached verified token (0 disables the cache);
+            a token is never cached beyond its own expiration.
     """
     JWT_ALGORITHM: str = "ES256"
     JWT_PRIVATE_KEY_PATH: str = "./secrets/ec_private.pem"
@@ -37,6 +40,8 @@ class AuthConfig(BaseSettings):
     JWT_HEADER_TYPE: str = "Bearer"
     JWT_ACCESS_HEADER_NAME: str = "Authorization"
     JWT_REFRESH_HEADER_NAME: str = "X-Refresh-Token"
+    JWT_CACHE_MAX_SIZE: int = 10_000
+    JWT_CACHE_TTL_SECONDS: int = 60 * 15
 
     @cached_property
     def JWT_PRIVATE_KEY(self) -> SecretStr:
@@ -27,6 +27,20 @@ class TokenData(CustomModel):
     iss: str | None = None
 
 
+class AuthContext(CustomModel):
+    """
+    Authentication state shared by everything processing a single request.
+
+    Kept in `request.state.auth_context` and filled lazily, so middlewares, dependencies
+    and permission checks decode a presented token and check it in the token storage
+    at most once per request.
+
+    Attributes:
+        tokens: Validation result by raw token (None for invalid or revoked tokens).
+    """
+    tokens: dict[str, TokenData | None] = {}
+
+
 class AnonymousUser(CustomModel):
     """
     Represents a guest or unauthenticated user.
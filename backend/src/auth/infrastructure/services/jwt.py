@@ -1,12 +1,14 @@
+import hashlib
 import uuid6
 from datetime import timedelta
 from typing import Any
 from jose import jwt, JWTError
+from prometheus_client import Counter
 from pydantic import SecretStr
 from starlette.requests import Request
 from starlette.responses import Response
 
-from src.auth.domain.entities import TokenData, TokenType
+from src.auth.domain.entities import AuthContext, TokenData, TokenType
 from src.auth.config import auth_config
 from src.auth.domain.exceptions import RefreshTokenNotValid
 from src.auth.domain.interfaces.token_auth import ITokenAuth
@@ -14,10 +16,21 @@ from src.auth.domain.interfaces.token_provider import ITokenProvider
 from src.auth.domain.interfaces.token_storage import ITokenStorage
 from src.auth.infrastructure.transports.base import IAuthTransport
 from src.users.domain.entities import User
+from src.utils.cache import TTLCache
 from src.utils.datetimes import get_timezone_now
 
 SecretType = str | SecretStr
 
+# Tokens whose signature and claims have been verified, shared by all providers of the process:
+# sha256 of the token -> decoded token data (kept no longer than the token is valid)
+_verified_tokens_cache: TTLCache[bytes, TokenData] = TTLCache(max_size=auth_config.JWT_CACHE_MAX_SIZE)
+
+verified_tokens_cache_requests = Counter(
+    "jwt_verified_tokens_cache_requests_total",
+    "Lookups of verified JWT tokens in the in-process cache",
+    ["result"]
+)
+
 
 class JWTProvider(ITokenProvider):
     """
@@ -78,21 +91,36 @@ class JWTProvider(ITokenProvider):
         """
         Decode and validate a JWT token.
 
+        The signature is verified only the first time a token is seen: the decoded data is
+        cached by the token digest until the token expires. Revocation is not cached and
+        is still checked by the token storage on every read.
+
         :param token: Encoded JWT token string.
         :return: TokenData if valid and contains user_id, else None.
         """
         if token is None:
             return None
 
+        cache_key = hashlib.sha256(token.encode()).digest()
+        if (cached := _verified_tokens_cache.get(cache_key)) is not None:
+            verified_tokens_cache_requests.labels(result="hit").inc()
+            return cached
+        verified_tokens_cache_requests.labels(result="miss").inc()
+
         try:
             data = self._decode_jwt(token, auth_config.JWT_PUBLIC_KEY, algorithms=[auth_config.JWT_ALGORITHM])
             user_id = data.get("user_id")
             if user_id is None:
                 return None
-            return TokenData(**data)
+            token_data = TokenData(**data)
         except JWTError:
             return None
 
+        ttl = min((token_data.exp - get_timezone_now()).total_seconds(), auth_config.JWT_CACHE_TTL_SECONDS)
+        if ttl > 0:
+            _verified_tokens_cache.set(cache_key, token_data, ttl=ttl)
+        return token_data
+
     def _decode_jwt(
         self,
         encoded_jwt: str,
@@ -183,8 +211,10 @@ class JWTAuth(ITokenAuth):
         for transport in self._get_transports(token_type):
             transport.set_token(self.response, token)
 
+        token_data = self.token_provider.read_token(token)
         if self.token_storage:
-            await self.token_storage.store_token(self.token_provider.read_token(token))
+            await self.token_storage.store_token(token_data)
+        self._remember_token(token, token_data)
 
     async def unset_tokens(self) -> None:
         """
@@ -192,6 +222,9 @@ class JWTAuth(ITokenAuth):
         """
         if self.token_storage:
             await self.token_storage.revoke_tokens_by_user(self.request.state.user.id)
+        # Tokens validated earlier in the request aren't active anymore
+        if (auth_context := self._get_auth_context()) is not None:
+            auth_context.tokens.clear()
 
         for token_type, transports in self.transports.items():
             for transport in transports:
@@ -209,7 +242,9 @@ class JWTAuth(ITokenAuth):
             access_token = self.request.state.access_token
             self.response = response
 
-            await self.set_token(access_token, TokenType.ACCESS)
+            # The token has already been stored by `refresh_access_token`
+            for transport in self._get_transports(TokenType.ACCESS):
+                transport.set_token(self.response, access_token)
 
     async def refresh_access_token(self) -> None:
         """
@@ -229,8 +264,10 @@ class JWTAuth(ITokenAuth):
         # Optimized self.set_token functionality for use via API/middleware
         self.request.state.access_token = access_token
 
+        access_data = self.token_provider.read_token(access_token)
         if self.token_storage:
-            await self.token_storage.store_token(self.token_provider.read_token(access_token))
+            await self.token_storage.store_token(access_data)
+        self._remember_token(access_token, access_data)
 
         # Since we have auto-update via middleware, this is extra work.
         # It is only useful when updating directly via the endpoint
@@ -242,12 +279,44 @@ class JWTAuth(ITokenAuth):
         """
         Retrieve and validate token data for a given token type.
 
+        The result is remembered in the request auth context, so the token signature and
+        its revocation status are checked only once per request.
+
         :param token_type: Type of token (access or refresh).
         :return: TokenData if valid and active, else None.
         """
         token = self._get_access_token() if token_type == TokenType.ACCESS else self._get_refresh_token()
-        token_data = self.token_provider.read_token(token)
-        return await self._validate_token_or_none(token_data)
+        if token is None:
+            return None
+
+        auth_context = self._get_auth_context()
+        if auth_context is not None and token in auth_context.tokens:
+            return auth_context.tokens[token]
+        token_data = await self._validate_token_or_none(self.token_provider.read_token(token))
+        self._remember_token(token, token_data)
+        return token_data
+
+    def _get_auth_context(self) -> AuthContext | None:
+        """
+        Get the authentication context of the current request, creating it on first use.
+
+        :return: AuthContext or None outside of a request.
+        """
+        if self.request is None:
+            return None
+        if not hasattr(self.request.state, "auth_context"):
+            self.request.state.auth_context = AuthContext()
+        return self.request.state.auth_context
+
+    def _remember_token(self, token: str, token_data: TokenData | None) -> None:
+        """
+        Remember the validation result of a token for the rest of the request.
+
+        :param token: Raw token.
+        :param token_data: Decoded token data or None if the token is not valid.
+        """
+        if (auth_context := self._get_auth_context()) is not None:
+            auth_context.tokens[token] = token_data
 
     async def _validate_token_or_none(self, token_data: TokenData) -> TokenData | None:
         """
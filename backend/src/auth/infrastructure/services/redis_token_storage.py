@@ -9,7 +9,12 @@ class RedisTokenStorage(ITokenStorage):
     Redis-based implementation of ITokenStorage.
 
     Stores JWT token metadata for validation and revocation.
-    Each token is stored by its JTI and associated with a user for mass revocation.
+    Each token is stored by its JTI (`tokens:<jti>`) and associated with a user for mass revocation
+    in a sorted set of the user's JTIs scored by their expiration time (`user_jtis:<user_id>`).
+    Expired JTIs are pruned from the set on every store, and the set itself expires together
+    with the last of its tokens.
+
+    Every operation costs a fixed number of round trips regardless of the number of sessions.
     """
 
     def __init__(self):
@@ -17,29 +22,55 @@ class RedisTokenStorage(ITokenStorage):
 
     async def store_token(self, token_data: TokenData) -> None:
         """
-        Store the token metadata in Redis.
+        Store the token metadata in Redis (a single round trip).
 
         :param token_data: The decoded token data including expiration and JTI.
         """
-        key = f"tokens:{token_data.jti}"
-        ttl = int((token_data.exp - get_timezone_now()).total_seconds())
-
-        # Store the token with TTL
-        await self.redis.setex(key, ttl, token_data.user_id)
+        now = get_timezone_now()
+        ttl = int((token_data.exp - now).total_seconds())
+        if ttl <= 0:
+            return
+        user_key = self._get_user_key(token_data.user_id)
 
-        # Add token JTI to the user's token set
-        await self.redis.sadd(f"user_tokens:{token_data.user_id}", token_data.jti)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            # Store the token with TTL
+            pipe.setex(self._get_token_key(token_data.jti), ttl, token_data.user_id)
+            # Add token JTI to the user's tokens and prune the expired ones
+            pipe.zadd(user_key, {token_data.jti: token_data.exp.timestamp()})
+            pipe.zremrangebyscore(user_key, "-inf", now.timestamp())
+            # The set lives as long as its longest-living token (NX/GT options require Redis 7+)
+            pipe.expire(user_key, ttl, nx=True)
+            pipe.expire(user_key, ttl, gt=True)
+            await pipe.execute()
 
     async def revoke_tokens_by_user(self, user_id: str) -> None:
         """
-        Revoke all tokens associated with a specific user.
+        Revoke all tokens associated with a specific user (two round trips).
+
+        Only the revoked JTIs are removed from the user's set, so a token issued concurrently
+        stays revocable.
 
         :param user_id: The ID of the user whose tokens should be revoked.
         """
-        token_keys = await self.redis.smembers(f"user_tokens:{user_id}")
-        for jti in token_keys:
-            await self.redis.delete(f"tokens:{jti}")
-        await self.redis.delete(f"user_tokens:{user_id}")
+        user_key = self._get_user_key(user_id)
+        legacy_user_key = f"user_tokens:{user_id}"
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zrange(user_key, 0, -1)
+            # Tokens stored before the sorted sets were introduced
+            # (until they are moved by scripts/migrate_legacy_user_tokens.py)
+            pipe.smembers(legacy_user_key)
+            jtis, legacy_jtis = await pipe.execute()
+
+        jtis = list(jtis)
+        token_keys = [self._get_token_key(jti) for jti in {*jtis, *legacy_jtis}]
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if token_keys:
+                pipe.unlink(*token_keys)
+            if jtis:
+                pipe.zrem(user_key, *jtis)
+            pipe.unlink(legacy_user_key)
+            await pipe.execute()
 
     async def is_token_active(self, jti: str) -> bool:
         """
@@ -48,4 +79,12 @@ class RedisTokenStorage(ITokenStorage):
         :param jti: JWT ID of the token.
         :return: True if the token is active, False otherwise.
         """
-        return await self.redis.exists(f"tokens:{jti}") == 1
+        return await self.redis.exists(self._get_token_key(jti)) == 1
+
+    @staticmethod
+    def _get_token_key(jti: str) -> str:
+        return f"tokens:{jti}"
+
+    @staticmethod
+    def _get_user_key(user_id: int | str) -> str:
+        return f"user_jtis:{user_id}"
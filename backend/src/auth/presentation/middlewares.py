@@ -1,93 +1,146 @@
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from src.auth.domain.entities import AnonymousUser, TokenType
+from src.auth.domain.entities import AnonymousUser, TokenData, TokenType
 from src.auth.domain.exceptions import RefreshTokenNotValid
+from src.auth.domain.interfaces.token_auth import ITokenAuth
 from src.auth.presentation.dependencies import get_token_auth
+from src.users.domain.entities import User
+from src.users.domain.exceptions import UserNotFound
+from src.users.infrastructure.cache.user_cache import get_user_cache
 from src.users.infrastructure.db.unit_of_work import PGUserUnitOfWork
 
 
-class JWTRefreshMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """
-    Middleware to automatically refresh an access token using a valid refresh token.
+    Pure ASGI middleware authenticating the request and refreshing an expired access token.
 
-    If an access token is missing or invalid, it attempts to refresh it.
-    The refreshed access token is set in the response if a valid refresh token exists.
+    - If an access token is missing or invalid, it attempts to refresh it using a valid refresh token
+      (falling back to an anonymous request if that isn't possible).
+    - The authenticated user (or AnonymousUser) is injected into `request.state.user`.
+    - The refreshed access token is set in the response if the refresh token is still valid
+      once the request has been handled.
+
+    Unlike `BaseHTTPMiddleware` subclasses, the middleware doesn't run the application
+    in a separate task and doesn't proxy the response body stream.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        pre_auth = await get_token_auth(request=request)
-        access_data = await pre_auth.read_token(TokenType.ACCESS)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        auth = await get_token_auth(request=request)
+        access_data = await auth.read_token(TokenType.ACCESS)
         if access_data is None:
             try:
-                await pre_auth.refresh_access_token()
+                await auth.refresh_access_token()
+                access_data = await auth.read_token(TokenType.ACCESS)
             except RefreshTokenNotValid:
                 # Token couldn't be refreshed – fallback to anonymous request
                 ...
-        response = await call_next(request)
-        # Ensure refresh token is still valid before updating response with new access
-        post_auth = await get_token_auth(request=request, response=response)
-        refresh_data = await post_auth.read_token(TokenType.REFRESH)
-        if refresh_data:
-            await pre_auth.inject_access_token_from_request(response)
+        request.state.user = await self._get_user(access_data)
 
-        return response
+        if not hasattr(request.state, "access_token"):
+            await self.app(scope, receive, send)
+            return
 
+        async def send_with_access_token(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Ensure refresh token is still valid (e.g. the handler hasn't logged the user out)
+                # before updating response with new access
+                refresh_data = await auth.read_token(TokenType.REFRESH)
+                if refresh_data:
+                    await self._inject_access_token(auth, message)
+            await send(message)
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware that injects the authenticated user into `request.state.user`.
+        await self.app(scope, receive, send_with_access_token)
 
-    If no valid access token is found, the user is treated as anonymous.
-    """
+    @staticmethod
+    async def _get_user(token_data: TokenData | None) -> User | AnonymousUser:
+        """
+        Load the user the access token was issued to.
 
-    def __init__(self, app):
-        super().__init__(app)
+        The user is served from the user cache when possible, in which case neither a database
+        query nor a connection checkout happens.
 
-    async def dispatch(self, request: Request, call_next):
-        jwt_auth = await get_token_auth(request=request)
-        token_data = await jwt_auth.read_token(TokenType.ACCESS)
+        :param token_data: Decoded access token or None.
+        :return: User or AnonymousUser if the token is missing or the user doesn't exist.
+        """
         if not token_data:
-            request.state.user = AnonymousUser()
-        else:
-            async with PGUserUnitOfWork() as uow:
+            return AnonymousUser()
+        async with PGUserUnitOfWork(user_cache=get_user_cache()) as uow:
+            try:
                 user = await uow.users.get_by_pk(token_data.user_id)
-                request.state.user = user or AnonymousUser()
+            except UserNotFound:
+                return AnonymousUser()
+            return user or AnonymousUser()
 
-        response = await call_next(request)
-        return response
+    @staticmethod
+    async def _inject_access_token(auth: ITokenAuth, message: Message) -> None:
+        """
+        Add the refreshed access token (cookies and/or headers) to the response start message.
 
+        Transports work with Starlette responses, so the token is set on a blank response
+        whose headers are then copied into the message.
 
-class SecurityMiddleware(BaseHTTPMiddleware):
+        :param auth: Token auth service of the request.
+        :param message: `http.response.start` message.
+        """
+        token_response = Response()
+        initial_headers = set(token_response.raw_headers)
+        await auth.inject_access_token_from_request(token_response)
+        headers = MutableHeaders(scope=message)
+        for key, value in token_response.raw_headers:
+            if (key, value) in initial_headers:
+                continue
+            if key == b"set-cookie":
+                headers.append(key.decode("latin-1"), value.decode("latin-1"))
+            else:
+                headers[key.decode("latin-1")] = value.decode("latin-1")
+
+
+class SecurityMiddleware:
     """
-    Middleware to restrict access to secure paths.
+    Pure ASGI middleware to restrict access to secure paths.
 
     If the current user is not a superuser and tries to access a protected path
     that is not explicitly allowed, a 403 response is returned.
     """
 
-    def __init__(self, app, secure_paths: list | None = None, allowed_paths: list | None = None):
+    def __init__(self, app: ASGIApp, secure_paths: list | None = None, allowed_paths: list | None = None):
         """
-        :param app: FastAPI application
+        :param app: ASGI application
         :param secure_paths: List of base paths considered protected.
         :param allowed_paths: List of paths that are publicly accessible even within protected zones.
         """
-        super().__init__(app)
+        self.app = app
         self.secure_paths = secure_paths or ["/api", "/admin", "/docs", "/redoc"]
         self.allowed_paths = allowed_paths or ["/api/auth", "/api/users"]
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         request_path = str(request.url)
 
         is_protected_path = any(path in request_path for path in self.secure_paths)
         is_allowed_path = any(path in request_path for path in self.allowed_paths)
 
         if is_protected_path and not is_allowed_path and not request.state.user.is_superuser:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=403,
                 content={"message": "Permission Denied"}
             )
+            await response(scope, receive, send)
+            return
 
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
@@ -1,12 +1,38 @@
 import datetime
-from typing import Any
+import types
+from typing import Annotated, Any, ClassVar, Iterable, Union, get_args, get_origin
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel, model_validator, Field
 
 
+def _may_hold_datetime(annotation: Any) -> bool:
+    """
+    Check whether a field with the given annotation may hold a datetime value.
+
+    :param annotation: Field annotation.
+    :return: True for datetime, Any and unions including them.
+    """
+    if annotation is Any:
+        return True
+    if isinstance(annotation, type):
+        return issubclass(annotation, datetime.datetime)
+    if get_origin(annotation) in (Union, types.UnionType, Annotated):
+        return any(_may_hold_datetime(arg) for arg in get_args(annotation))
+    return False
+
+
 class CustomModel(BaseModel):
     """Custom Base pydantic model"""
+    # Fields inspected by `normalize_datetimes`, computed once per model class
+    _datetime_fields: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._datetime_fields = tuple(
+            field_name for field_name, field in cls.model_fields.items() if _may_hold_datetime(field.annotation)
+        )
 
     @model_validator(mode="after")
     def normalize_datetimes(self) -> "CustomModel":
@@ -17,9 +43,12 @@ class CustomModel(BaseModel):
         - If no timezone is present, Europe/Moscow will be assigned.
         - Microseconds will be removed.
         """
+        if not self._datetime_fields:
+            return self
         tz_moscow = ZoneInfo("Europe/Moscow")
 
-        for field_name, value in self.__dict__.items():
+        for field_name in self._datetime_fields:
+            value = self.__dict__.get(field_name)
             if isinstance(value, datetime.datetime):
                 if value.tzinfo:
                     value = value.astimezone(tz_moscow)
@@ -40,6 +69,9 @@ class BulkResult(BaseModel):
         failed (int | list[Any]): Number of failed items or a list with failure details.
         skipped (int | None): Number of skipped items, if applicable.
         total (int | None): Total number of items processed.
+        created (int | None): Number of created items, if the storage distinguishes them.
+        updated (int | None): Number of updated items, if the storage distinguishes them.
+        unchanged (int | None): Number of items left intact because their content didn't change.
         meta (dict[str, Any] | None): Optional metadata or additional context about the operation.
     """
     success: int = Field(..., description="Количество успешно обработанных записей")
@@ -55,7 +87,57 @@ class BulkResult(BaseModel):
         default=None,
         description="Общее количество обработанных записей"
     )
+    created: int | None = Field(
+        default=None,
+        description="Количество созданных записей, если применимо"
+    )
+    updated: int | None = Field(
+        default=None,
+        description="Количество обновлённых записей, если применимо"
+    )
+    unchanged: int | None = Field(
+        default=None,
+        description="Количество записей без изменений, если применимо"
+    )
     meta: dict[str, Any] | None = Field(
         default=None,
         description="Дополнительная информация по выполненной операции"
     )
+
+    @classmethod
+    def merge(cls, results: Iterable["BulkResult"]) -> "BulkResult":
+        """
+        Combine several partial results (e.g. per batch or per chunk) into a single one.
+
+        Failed counts are summed; failure details are concatenated when every result carries them.
+
+        :param results: Partial bulk results.
+        :return: Aggregated BulkResult.
+        """
+        results = list(results)
+        if not results:
+            return cls(success=0, failed=0, total=0)
+        failures = [result.failed for result in results]
+        if failures and all(isinstance(failed, list) for failed in failures):
+            failed = [item for failed in failures for item in failed]
+        else:
+            failed = sum(len(failed) if isinstance(failed, list) else failed for failed in failures)
+        return cls(
+            success=sum(result.success for result in results),
+            failed=failed,
+            **{
+                field: cls._sum_optional(getattr(result, field) for result in results)
+                for field in ("skipped", "total", "created", "updated", "unchanged")
+            }
+        )
+
+    @staticmethod
+    def _sum_optional(values: Iterable[int | None]) -> int | None:
+        """
+        Sum optional counters, None if no result provides the counter.
+
+        :param values: Counter values of the partial results.
+        :return: Sum of the provided values or None.
+        """
+        values = [value for value in values if value is not None]
+        return sum(values) if values else None
@@ -30,5 +30,15 @@ celery_app.autodiscover_tasks(["src.vacancies.presentation.tasks"])
 #     "fetch_vacancies_every_10_min": {
 #         "task": "src.vacancies.presentation.tasks.collect_vacancies_task",
 #         "schedule": 600.0  # каждые 10 мин
+#     },
+#     "sync_new_vacancies_every_5_min": {
+#         "task": "src.vacancies.presentation.tasks.collect_new_vacancies_task",
+#         "kwargs": {"profile": "python_backend_moscow"},
+#         "schedule": 300.0
+#     },
+#     # Collection tasks schedule the relay themselves, this catches up after failures
+#     "relay_vacancy_outbox_every_min": {
+#         "task": "src.vacancies.presentation.tasks.relay_vacancy_outbox_task",
+#         "schedule": 60.0
 #     }
 # }
@@ -0,0 +1,52 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings
+
+
+class HttpClientConfig(BaseSettings):
+    """
+    Configuration of outgoing HTTP requests to external APIs.
+
+    Attributes:
+        HTTP_SESSION_TIMEOUT_SECONDS: Upper bound of a whole request including the body read (session level).
+        HTTP_CONNECT_TIMEOUT_SECONDS: Timeout for acquiring a connection (session level).
+        HTTP_REQUEST_TIMEOUT_SECONDS: Timeout of a single attempt until the response headers are received.
+        HTTP_RETRY_MAX_ATTEMPTS: Maximum number of attempts per request (1 disables retries).
+        HTTP_RETRY_BACKOFF_BASE_SECONDS: Base delay of the exponential backoff.
+        HTTP_RETRY_BACKOFF_MAX_SECONDS: Maximum delay between attempts (also caps `Retry-After`).
+        HTTP_CIRCUIT_FAILURE_THRESHOLD: Consecutive failures after which the circuit of a host is opened.
+        HTTP_CIRCUIT_RECOVERY_SECONDS: Time after which an opened circuit lets a probe request through.
+        HTTP_CACHE_BACKEND: Storage of cached responses of external APIs (`none` disables caching).
+            Disabled by default: `memory` keeps whole response bodies in every worker process
+            (a HeadHunter search page of 100 vacancies is about 100-200 KB, so the default
+            `HTTP_CACHE_MAX_ENTRIES` may take tens of MB per process); `redis` shares them instead.
+        HTTP_CACHE_MAX_ENTRIES: Maximum number of responses in the in-process cache.
+        HTTP_CACHE_STALE_SECONDS: How long stale responses with validators are kept for revalidation.
+    """
+    HTTP_SESSION_TIMEOUT_SECONDS: float = 60
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 10
+    HTTP_REQUEST_TIMEOUT_SECONDS: float = 30
+    HTTP_RETRY_MAX_ATTEMPTS: int = 5
+    HTTP_RETRY_BACKOFF_BASE_SECONDS: float = 0.5
+    HTTP_RETRY_BACKOFF_MAX_SECONDS: float = 30
+    HTTP_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    HTTP_CIRCUIT_RECOVERY_SECONDS: float = 30
+    HTTP_CACHE_BACKEND: Literal["none", "memory", "redis"] = "none"
+    HTTP_CACHE_MAX_ENTRIES: int = 256
+    HTTP_CACHE_STALE_SECONDS: float = 60 * 60 * 24
+
+
+class HeadHunterConfig(BaseSettings):
+    """
+    Configuration of the HeadHunter adapter.
+
+    Attributes:
+        HH_DETAILS_CACHE_MAX_SIZE: Maximum number of vacancies whose details are kept in the in-process cache.
+        HH_DETAILS_CACHE_TTL_SECONDS: How long fetched vacancy details are kept in the in-process cache.
+    """
+    HH_DETAILS_CACHE_MAX_SIZE: int = 10_000
+    HH_DETAILS_CACHE_TTL_SECONDS: float = 60 * 60 * 24
+
+
+http_config = HttpClientConfig()
+hh_config = HeadHunterConfig()
@@ -1,20 +1,44 @@
 import asyncio
+import datetime
+import logging
 import math
 import os
+from collections import deque
+from contextlib import aclosing
+from typing import AsyncIterator, Collection, Sequence
 
 from src.core.config import settings
+from src.integrations.config import hh_config
+from src.integrations.infrastructure.http.cache import IHttpCache
 from src.integrations.infrastructure.http.interfaces import IAsyncHttpClient
 from src.integrations.infrastructure.http.services.api_client import AuthType, APIClientService
+from src.integrations.infrastructure.external_api.headhunter.constants import HH_MAX_PER_PAGE, HH_MAX_RESULTS
 from src.integrations.infrastructure.external_api.headhunter.schemas.request import (
     HHAccessApplicationTokenParams,
     HHVacancySearchParams
 )
-from src.integrations.infrastructure.external_api.headhunter.schemas.response import HHVacancyResponse, HHVacancy
+from src.integrations.infrastructure.external_api.headhunter.schemas.response import (
+    HHVacancy,
+    HHVacancyDetail,
+    HHVacancyResponse
+)
+from src.integrations.infrastructure.external_api.headhunter.sharding import HHSearchShardPlanner
 from src.integrations.infrastructure.http.aiohttp_client import AiohttpClient
+from src.integrations.infrastructure.external_api.mappers.helpers import HHVacancyToDomainMapper
 from src.integrations.infrastructure.external_api.mappers.vacancies import VacancyExternalToDomainMapper
-from src.vacancies.domain.entities import Vacancy
+from src.utils.cache import TTLCache
+from src.utils.hashing import get_content_fingerprint
+from src.vacancies.domain.entities import VACANCY_DETAIL_FIELDS, Vacancy, VacancyPage, VacancySource
 from src.vacancies.domain.interfaces.vacancy_source_client import IVacancySourceClient
 
+logger = logging.getLogger(__name__)
+
+# Enriched fields of vacancies shared by all adapters of the process:
+# vacancy id -> (fingerprint of the search result, enriched fields)
+_vacancy_details_cache: TTLCache[str, tuple[str, dict]] = TTLCache(
+    max_size=hh_config.HH_DETAILS_CACHE_MAX_SIZE, ttl=hh_config.HH_DETAILS_CACHE_TTL_SECONDS
+)
+
 
 class HeadHunterAdapter(
     APIClientService,
@@ -27,22 +51,41 @@ class HeadHunterAdapter(
     an abstraction over key endpoints such as:
     - Access token retrieval
     - Application information
-    - Vacancy search (single-page or full pagination)
+    - Vacancy search (single-page, full pagination or page-by-page streaming)
 
     Args:
         client (IAsyncHttpClient): An async HTTP client (default: AiohttpClient).
         source_url (str): Base API URL (default: "https://api.hh.ru").
         auth_type (AuthType): Authorization type to use (default: Bearer).
         token (str | None): Optional token to include in requests.
+        max_concurrency (int): Maximum number of pages fetched simultaneously (default: 5).
+        requests_per_second (float): Sustained request rate allowed towards the API (default: 5).
+            The limiter is shared by all adapters within the event loop and backs off on HTTP 429.
+        cache (IHttpCache | None): Optional cache of GET responses (conditional requests for repeated pages).
+        detail_concurrency (int | None): Maximum number of vacancy details fetched simultaneously
+            during enrichment (default: `max_concurrency`).
+        shard_large_queries (bool): Whether queries exceeding the 2000 results cap are split
+            into date-window shards (default: True).
     """
     def __init__(
         self,
         client: IAsyncHttpClient = AiohttpClient,
         source_url: str = 'https://api.hh.ru',
         auth_type: AuthType = AuthType.BEARER_TOKEN,
-        token: str | None = os.environ.get("HEADHUNTER_TOKEN")
+        token: str | None = os.environ.get("HEADHUNTER_TOKEN"),
+        max_concurrency: int = 5,
+        requests_per_second: float = 5,
+        shard_large_queries: bool = True,
+        cache: IHttpCache | None = None,
+        detail_concurrency: int | None = None
     ):
-        super(HeadHunterAdapter, self).__init__(client=client, source_url=source_url, auth_type=auth_type, token=token)
+        super(HeadHunterAdapter, self).__init__(
+            client=client, source_url=source_url, auth_type=auth_type, token=token,
+            requests_per_second=requests_per_second, cache=cache
+        )
+        self.max_concurrency = max_concurrency
+        self.detail_concurrency = detail_concurrency or max_concurrency
+        self.shard_large_queries = shard_large_queries
 
     async def get_access_token(self) -> dict:
         """
@@ -94,31 +137,276 @@ class HeadHunterAdapter(
         Retrieve all vacancies matching the provided search parameters.
 
         This method handles pagination automatically and is useful when a full
-        data set is needed.
-        Note that the HeadHunter API may have internal
-        pagination limits (e.g., 2000 records), which can affect the result.
+        data set is needed. Pages are fetched concurrently (see `iter_vacancies`),
+        and the result preserves page order.
+        The HeadHunter API doesn't return more than 2000 records per query,
+        so larger queries are split into date-window shards (see `HHSearchShardPlanner`).
 
         :param search_params: Query parameters for the search.
         :return list[Vacancy]: A complete list of matching vacancies.
         """
-        # Get the total number of vacancies
-        search_params.page = 0
-        search_params.per_page = 1
+        vacancies: list[Vacancy] = []
+        async for page in self.iter_vacancies(search_params):
+            vacancies.extend(page)
+        return vacancies
 
-        vacancy_response = await self._get_vacancy_response(search_params)
-        # Calculate the number of pages
-        max_pages = math.ceil(vacancy_response.found / 100)
-        # Fetch all pages separately
-        vacancies: list[HHVacancy] = []
-        search_params.per_page = 100
-        for page_num in range(max_pages):
-            search_params.page = page_num
-            _vacancy_response = await self._get_vacancy_response(search_params)
-            if _vacancy_response.items:
-                vacancies.extend(_vacancy_response.items)
-            # Added a delay just in case, since the API rate limits are unknown and I want to avoid spamming.
-            await asyncio.sleep(1)
-        return VacancyExternalToDomainMapper().map(vacancies)
+    async def iter_vacancies(
+        self,
+        search_params: HHVacancySearchParams,
+        published_since: datetime.datetime | None = None
+    ) -> AsyncIterator[list[Vacancy]]:
+        """
+        Stream all vacancies matching the provided search parameters page by page.
+
+        The first page doubles as a probe: its `found`/`pages` metadata defines how many
+        pages are scheduled. If the query exceeds the pagination cap and sharding is enabled,
+        the query is split into shards and the pages of all shards are scheduled instead.
+        Up to `max_concurrency` upcoming pages are prefetched (under the token-bucket
+        rate limiter) while the consumer processes the current one, so at most
+        `max_concurrency` pages are held in memory. Pages are yielded in order.
+
+        With `published_since` the query is limited by `date_from` and ordered by publication time,
+        and pagination stops as soon as a page reaches vacancies published before that moment.
+
+        :param search_params: Query parameters for the search (not modified).
+        :param published_since: Optional lower bound of the publication date (incremental mode).
+        :return AsyncIterator[list[Vacancy]]: Domain vacancies of each page.
+        """
+        if published_since:
+            search_params = search_params.model_copy(update={
+                "date_from": published_since.isoformat(timespec="seconds"),
+                "period": None,
+                "order_by": "publication_time"
+            })
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        page_requests, first_response = await self._plan_page_requests(search_params, semaphore)
+        # Without the reusable probe the query has been split into shards
+        sharded = first_response is None
+        vacancy_responses = self._iter_page_responses(page_requests, semaphore, first_response)
+
+        async with aclosing(vacancy_responses):
+            async for vacancy_response in vacancy_responses:
+                vacancies = self._map_vacancy_response(vacancy_response)
+                if published_since is None:
+                    yield vacancies
+                    continue
+
+                fresh_vacancies = [
+                    vacancy for vacancy in vacancies
+                    if not vacancy.published_datetime or vacancy.published_datetime >= published_since
+                ]
+                if fresh_vacancies:
+                    yield fresh_vacancies
+                # Pages are ordered by publication time, the rest has already been seen.
+                # Shards are ordered by their date windows instead, so they are only filtered.
+                if len(fresh_vacancies) < len(vacancies) and not sharded:
+                    return
+
+    async def iter_vacancy_pages(
+        self,
+        search_params: HHVacancySearchParams,
+        completed_pages: Collection[str] = ()
+    ) -> AsyncIterator[VacancyPage]:
+        """
+        Stream all vacancies matching the provided search parameters as keyed pages.
+
+        Pages are scheduled the same way as in `iter_vacancies`. The key of a page is derived
+        from the parameters of its shard and the page number, so pages listed in `completed_pages`
+        are not requested again. Keys stay stable as long as the date window of the query is fixed
+        (pass an explicit `date_to`), otherwise re-planned shards get new keys and are fetched again.
+
+        :param search_params: Query parameters for the search (not modified).
+        :param completed_pages: Keys of the pages which must be skipped.
+        :return AsyncIterator[VacancyPage]: Keyed domain vacancies of each page.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        page_requests, first_response = await self._plan_page_requests(search_params, semaphore)
+        page_keys = [self._get_page_key(*page_request) for page_request in page_requests]
+        if page_keys and page_keys[0] in completed_pages:
+            first_response = None
+        pending_pages = [
+            (page_key, page_request) for page_key, page_request in zip(page_keys, page_requests)
+            if page_key not in completed_pages
+        ]
+
+        vacancy_responses = self._iter_page_responses(
+            [page_request for _, page_request in pending_pages], semaphore, first_response
+        )
+        async with aclosing(vacancy_responses):
+            page_keys = iter(page_key for page_key, _ in pending_pages)
+            async for vacancy_response in vacancy_responses:
+                yield VacancyPage(key=next(page_keys), vacancies=self._map_vacancy_response(vacancy_response))
+
+    async def enrich_vacancies(self, vacancies: list[Vacancy]) -> list[Vacancy]:
+        """
+        Complete vacancies from search results with their full description and key skills.
+
+        Details are fetched concurrently from `/vacancies/{id}` (bounded by `detail_concurrency`
+        and the shared rate limiter). Collectors only pass vacancies whose persisted details are missing
+        or outdated (see `complete_vacancy_details`); on top of that, details fetched by the process
+        are reused from an in-process cache while the search result of the vacancy doesn't change.
+        A vacancy whose details can't be fetched is returned as is.
+
+        :param vacancies: Vacancies from search results.
+        :return list[Vacancy]: Vacancies in the same order, enriched where possible.
+        """
+        semaphore = asyncio.Semaphore(self.detail_concurrency)
+        mapper = HHVacancyToDomainMapper()
+
+        async def enrich(vacancy: Vacancy) -> Vacancy:
+            fingerprint = get_content_fingerprint(
+                vacancy.model_dump(mode="json", exclude=VACANCY_DETAIL_FIELDS)
+            )
+            cached = _vacancy_details_cache.get(vacancy.source_id)
+            if cached and cached[0] == fingerprint:
+                return vacancy.model_copy(update=cached[1])
+            try:
+                async with semaphore:
+                    detail = await self._get_vacancy_detail(vacancy.source_id)
+            except Exception as exc:
+                logger.warning(f"HeadHunter vacancy {vacancy.source_id} details can't be fetched: {exc!r}")
+                return vacancy
+            enriched = mapper.map_detail(vacancy, detail)
+            _vacancy_details_cache.set(
+                vacancy.source_id, (fingerprint, {field: getattr(enriched, field) for field in VACANCY_DETAIL_FIELDS})
+            )
+            return enriched
+
+        return list(await asyncio.gather(*[enrich(vacancy) for vacancy in vacancies]))
+
+    async def _plan_page_requests(
+        self, search_params: HHVacancySearchParams, semaphore: asyncio.Semaphore
+    ) -> tuple[list[tuple[HHVacancySearchParams, int]], HHVacancyResponse | None]:
+        """
+        Probe the query with its first page and schedule all pages to fetch.
+
+        If the query exceeds the pagination cap and sharding is enabled,
+        the pages of all shards are scheduled instead of the pages of the query.
+
+        :param search_params: Query parameters for the search (not modified).
+        :param semaphore: Semaphore bounding the number of simultaneous requests.
+        :return: Pairs of search parameters and page numbers, and the response of the first pair
+            if it's the already fetched probe (None for sharded queries).
+        """
+        search_params = search_params.model_copy(update={"page": 0, "per_page": HH_MAX_PER_PAGE})
+        first_response = await self._get_page_response(search_params, 0, semaphore)
+        if self.shard_large_queries and (first_response.found or 0) > HH_MAX_RESULTS:
+            planner = HHSearchShardPlanner(lambda params: self._count_found(params, semaphore))
+            shards = await planner.plan(search_params, found=first_response.found)
+            return [(shard.params, page_num) for shard in shards for page_num in range(shard.pages)], None
+        return [(search_params, page_num) for page_num in range(self._count_pages(first_response))], first_response
+
+    async def _iter_page_responses(
+        self,
+        page_requests: Sequence[tuple[HHVacancySearchParams, int]],
+        semaphore: asyncio.Semaphore,
+        first_response: HHVacancyResponse | None = None
+    ) -> AsyncIterator[HHVacancyResponse]:
+        """
+        Fetch the requested pages with a sliding prefetch window and yield them in order.
+
+        :param page_requests: Pairs of search parameters and page numbers to fetch.
+        :param semaphore: Semaphore bounding the number of simultaneous requests.
+        :param first_response: Already fetched response of the first page request (it's not requested again).
+        :return AsyncIterator[HHVacancyResponse]: Validated responses in the requested order.
+        """
+        page_requests = iter(page_requests)
+        if first_response is not None:
+            next(page_requests, None)
+            yield first_response
+
+        pending: deque[asyncio.Task[HHVacancyResponse]] = deque()
+        try:
+            while True:
+                # Keep the prefetch window full
+                while len(pending) < self.max_concurrency and (page_request := next(page_requests, None)):
+                    pending.append(asyncio.create_task(self._get_page_response(*page_request, semaphore)))
+                if not pending:
+                    break
+                yield await pending.popleft()
+        finally:
+            # The consumer may stop early or fail, don't leave orphan requests behind
+            for task in pending:
+                task.cancel()
+
+    async def _count_found(self, search_params: HHVacancySearchParams, semaphore: asyncio.Semaphore) -> int:
+        """
+        Request the number of vacancies matching the parameters using a minimal page.
+
+        :param search_params: Query parameters for the search (not modified).
+        :param semaphore: Semaphore bounding the number of simultaneous requests.
+        :return int: Number of vacancies found.
+        """
+        vacancy_response = await self._get_page_response(
+            search_params.model_copy(update={"per_page": 1}), 0, semaphore
+        )
+        return vacancy_response.found or 0
+
+    async def _get_page_response(
+        self, search_params: HHVacancySearchParams, page_num: int, semaphore: asyncio.Semaphore
+    ) -> HHVacancyResponse:
+        """
+        Fetch a single page of the search results under the concurrency limit.
+
+        The rate limit, retries and the circuit breaker are applied by `request`.
+
+        :param search_params: Query parameters for the search (not modified).
+        :param page_num: Number of the page to fetch.
+        :param semaphore: Semaphore bounding the number of simultaneous requests.
+        :return HHVacancyResponse: Validated response for the requested page.
+        """
+        async with semaphore:
+            return await self._get_vacancy_response(search_params.model_copy(update={"page": page_num}))
+
+    @staticmethod
+    def _get_page_key(search_params: HHVacancySearchParams, page_num: int) -> str:
+        """
+        Build a key identifying a page of a query across runs.
+
+        :param search_params: Query parameters of the page (the `page` field is ignored).
+        :param page_num: Number of the page.
+        :return: Page key.
+        """
+        params = search_params.model_dump(mode="json", exclude={"page"}, exclude_none=True)
+        return f"{get_content_fingerprint(params)[:16]}:{page_num}"
+
+    @staticmethod
+    def _count_pages(vacancy_response: HHVacancyResponse) -> int:
+        """
+        Calculate how many pages can be requested for a query.
+
+        Relies on the probe's `pages` and `found` fields and respects the API depth limit.
+
+        :param vacancy_response: Response of the first page.
+        :return int: Number of pages available for fetching.
+        """
+        per_page = vacancy_response.per_page or HH_MAX_PER_PAGE
+        found = min(vacancy_response.found or 0, HH_MAX_RESULTS)
+        pages = math.ceil(found / per_page)
+        if vacancy_response.pages is not None:
+            pages = min(pages, vacancy_response.pages)
+        return pages
+
+    @staticmethod
+    def _map_vacancy_response(vacancy_response: HHVacancyResponse) -> list[Vacancy]:
+        """
+        Convert the items of a search response to domain vacancies.
+
+        :param vacancy_response: Validated search response.
+        :return list[Vacancy]: Domain vacancies of the page (may be empty).
+        """
+        return VacancyExternalToDomainMapper(VacancySource.HEADHUNTER).map(vacancy_response.items or [])
+
+    async def _get_vacancy_detail(self, vacancy_id: str) -> HHVacancyDetail:
+        """
+        Retrieve the full vacancy from the API.
+
+        :param vacancy_id: HeadHunter vacancy identifier.
+        :return HHVacancyDetail: Validated vacancy with its description and key skills.
+        """
+        headers = {"HH-User-Agent": f"JobScope/1.0 {settings.EMAIL_FROM}"}
+        response = await self.request(method='GET', endpoint=f'/vacancies/{vacancy_id}', headers=headers)
+        return HHVacancyDetail.model_validate_json(await response.read())
 
     async def _get_vacancy_response(self, search_params: HHVacancySearchParams) -> HHVacancyResponse:
         """
@@ -126,6 +414,8 @@ class HeadHunterAdapter(
 
         This includes pagination metadata, cluster information, and the list of
         vacancy items, all wrapped in a validated `HHVacancyResponse`.
+        The raw body is validated directly by pydantic's JSON parser, without building
+        intermediate Python dicts (see `scripts/benchmark_hh_json_decoding.py`).
 
         :param search_params: Query parameters for the request.
         :return HHVacancyResponse: Validated response with vacancy items and metadata.
@@ -135,5 +425,4 @@ class HeadHunterAdapter(
             method='GET', endpoint='/vacancies', headers=headers,
             params=search_params.model_dump(mode="json", exclude_none=True, exclude_unset=True)
         )
-        result = await response.json()
-        return HHVacancyResponse.model_validate(result)
+        return HHVacancyResponse.model_validate_json(await response.read())
@@ -0,0 +1,5 @@
+# HeadHunter returns at most 100 items per page and no more than 2000 items per query
+HH_MAX_PER_PAGE = 100
+HH_MAX_RESULTS = 2000
+# Vacancies are searchable for 30 days after publication
+HH_SEARCH_PERIOD_DAYS = 30
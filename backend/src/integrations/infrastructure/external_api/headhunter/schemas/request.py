@@ -80,8 +80,12 @@ class HHVacancySearchParams(CustomModel):
     label: list[str] | None = Field(None, description="Фильтр по меткам вакансий")
     only_with_salary: bool = Field(False, description="Показывать вакансии только с указанной зарплатой")
     period: int | None = Field(None, description="Количество дней поиска вакансий")
-    date_from: str | None = Field(None, description="Дата начала поиска (YYYY-MM-DD)")
-    date_to: str | None = Field(None, description="Дата окончания поиска (YYYY-MM-DD)")
+    date_from: str | None = Field(
+        None, description="Дата начала поиска (YYYY-MM-DD или ISO 8601 YYYY-MM-DDThh:mm:ss±hh:mm)"
+    )
+    date_to: str | None = Field(
+        None, description="Дата окончания поиска (YYYY-MM-DD или ISO 8601 YYYY-MM-DDThh:mm:ss±hh:mm)"
+    )
     top_lat: float | None = Field(None, description="Верхняя граница широты")
     bottom_lat: float | None = Field(None, description="Нижняя граница широты")
     left_lng: float | None = Field(None, description="Левая граница долготы")
@@ -120,6 +120,16 @@ class HHVacancy(CustomModel):
     professional_roles: list[HHProfessionalRole] | None = None
 
 
+class HHKeySkill(CustomModel):
+    name: str | None = None
+
+
+class HHVacancyDetail(HHVacancy):
+    """Full vacancy returned by `/vacancies/{id}` (the description is HTML)"""
+    description: str | None = None
+    key_skills: list[HHKeySkill] | None = None
+
+
 class HHVacancyResponse(CustomModel):
     arguments: list[HHArgument] | None = None
     clusters: dict | None = None
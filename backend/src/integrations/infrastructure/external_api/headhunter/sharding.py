@@ -0,0 +1,190 @@
+import asyncio
+import datetime
+import logging
+import math
+from typing import Awaitable, Callable, Literal
+from zoneinfo import ZoneInfo
+
+from src.core.domain.entities import CustomModel
+from src.integrations.infrastructure.external_api.headhunter.constants import (
+    HH_MAX_PER_PAGE,
+    HH_MAX_RESULTS,
+    HH_SEARCH_PERIOD_DAYS
+)
+from src.integrations.infrastructure.external_api.headhunter.schemas.request import HHVacancySearchParams
+from src.utils.datetimes import get_timezone_now
+
+logger = logging.getLogger(__name__)
+
+ShardField = Literal["area", "professional_role"]
+
+
+class HHSearchShard(CustomModel):
+    """
+    A part of a search query whose result set fits under the API pagination cap.
+
+    Attributes:
+        params: Search parameters of the shard.
+        found: Number of vacancies reported by the API for the shard.
+    """
+    params: HHVacancySearchParams
+    found: int
+
+    @property
+    def pages(self) -> int:
+        """Number of pages required to fetch the shard."""
+        per_page = self.params.per_page or HH_MAX_PER_PAGE
+        return math.ceil(min(self.found, HH_MAX_RESULTS) / per_page)
+
+
+class HHSearchShardPlanner:
+    """
+    Sharded collection planner for HeadHunter vacancy search.
+
+    HeadHunter does not return more than 2000 vacancies per query. The planner
+    recursively splits the `date_from`/`date_to` window in halves until the number
+    of vacancies found in every shard fits under the cap. When the window cannot be
+    narrowed any further, list filters such as `area` or `professional_role`
+    are split as well.
+
+    Args:
+        count_found: Coroutine function returning `found` for the given search parameters.
+        max_results: Maximum number of results a single shard may contain.
+        min_window: The narrowest date window the planner is allowed to produce.
+        split_fields: List filters that may be split once the date window is exhausted.
+    """
+
+    def __init__(
+        self,
+        count_found: Callable[[HHVacancySearchParams], Awaitable[int]],
+        max_results: int = HH_MAX_RESULTS,
+        min_window: datetime.timedelta = datetime.timedelta(minutes=1),
+        split_fields: tuple[ShardField, ...] = ("area", "professional_role")
+    ):
+        self.count_found = count_found
+        self.max_results = max_results
+        self.min_window = min_window
+        self.split_fields = split_fields
+
+    async def plan(self, search_params: HHVacancySearchParams, found: int | None = None) -> list[HHSearchShard]:
+        """
+        Split the search into shards which can be fully paginated.
+
+        :param search_params: Original search parameters (not modified).
+        :param found: Number of vacancies for the original query, if already known.
+        :return: Non-empty shards ordered by the date window.
+        """
+        return await self._split(self._with_date_window(search_params), found)
+
+    async def _split(self, search_params: HHVacancySearchParams, found: int | None = None) -> list[HHSearchShard]:
+        """
+        Recursively split the parameters until each part fits under the cap.
+
+        :param search_params: Parameters with an explicit date window.
+        :param found: Number of vacancies for the parameters, if already known.
+        :return: List of shards.
+        """
+        if found is None:
+            found = await self.count_found(search_params)
+        if found <= self.max_results:
+            return [HHSearchShard(params=search_params, found=found)] if found else []
+
+        parts = self._split_date_window(search_params) or self._split_list_filter(search_params)
+        if not parts:
+            logger.warning(
+                f"HeadHunter shard can't be split any further, {found - self.max_results} vacancies will be lost: "
+                f"{search_params.model_dump(exclude_none=True, exclude_unset=True)}"
+            )
+            return [HHSearchShard(params=search_params, found=found)]
+
+        shards = await asyncio.gather(*[self._split(part) for part in parts])
+        return [shard for part_shards in shards for shard in part_shards]
+
+    def _split_date_window(self, search_params: HHVacancySearchParams) -> list[HHVacancySearchParams]:
+        """
+        Split the date window in two halves.
+
+        :param search_params: Parameters with an explicit date window.
+        :return: Two parameter sets or an empty list if the window is already too narrow.
+        """
+        date_from = self._parse_date(search_params.date_from)
+        date_to = self._parse_date(search_params.date_to)
+        if date_to - date_from < self.min_window * 2:
+            return []
+
+        middle = (date_from + (date_to - date_from) / 2).replace(microsecond=0)
+        return [
+            search_params.model_copy(update={
+                "date_from": self._format_date(date_from), "date_to": self._format_date(middle)
+            }),
+            search_params.model_copy(update={
+                "date_from": self._format_date(middle + datetime.timedelta(seconds=1)),
+                "date_to": self._format_date(date_to)
+            }),
+        ]
+
+    def _split_list_filter(self, search_params: HHVacancySearchParams) -> list[HHVacancySearchParams]:
+        """
+        Split the first list filter containing more than one value in two halves.
+
+        :param search_params: Search parameters.
+        :return: Two parameter sets or an empty list if no filter can be split.
+        """
+        for field in self.split_fields:
+            values = getattr(search_params, field)
+            if values and len(values) > 1:
+                middle = len(values) // 2
+                return [
+                    search_params.model_copy(update={field: values[:middle]}),
+                    search_params.model_copy(update={field: values[middle:]}),
+                ]
+        return []
+
+    def _with_date_window(self, search_params: HHVacancySearchParams) -> HHVacancySearchParams:
+        """
+        Make the date window of the query explicit.
+
+        A missing `date_from` is derived from `period` (or the whole search period),
+        a missing `date_to` means "now". `period` is dropped since the API doesn't allow
+        combining it with explicit dates.
+
+        :param search_params: Original search parameters.
+        :return: Copy of the parameters with `date_from` and `date_to` set.
+        """
+        now = get_timezone_now().replace(microsecond=0)
+        date_to = self._parse_date(search_params.date_to, end_of_day=True) if search_params.date_to else now
+        if search_params.date_from:
+            date_from = self._parse_date(search_params.date_from)
+        else:
+            date_from = date_to - datetime.timedelta(days=search_params.period or HH_SEARCH_PERIOD_DAYS)
+        return search_params.model_copy(update={
+            "date_from": self._format_date(date_from),
+            "date_to": self._format_date(date_to),
+            "period": None
+        })
+
+    @staticmethod
+    def _parse_date(value: str, end_of_day: bool = False) -> datetime.datetime:
+        """
+        Parse a date (YYYY-MM-DD) or an ISO 8601 datetime into an aware datetime.
+
+        :param value: Date or datetime string.
+        :param end_of_day: Whether a bare date should point to the last second of the day.
+        :return: Timezone-aware datetime.
+        """
+        parsed = datetime.datetime.fromisoformat(value)
+        if len(value) == 10 and end_of_day:
+            parsed = parsed.replace(hour=23, minute=59, second=59)
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=ZoneInfo("Europe/Moscow"))
+        return parsed
+
+    @staticmethod
+    def _format_date(value: datetime.datetime) -> str:
+        """
+        Format a datetime the way the HeadHunter API accepts it.
+
+        :param value: Timezone-aware datetime.
+        :return: ISO 8601 string with seconds precision.
+        """
+        return value.isoformat(timespec="seconds")
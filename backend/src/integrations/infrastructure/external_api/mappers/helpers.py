@@ -1,8 +1,9 @@
 from src.integrations.infrastructure.external_api.headhunter.schemas.response import (
     HHVacancy, HHMetroStation, HHAddress, HHArea, HHEmployer,
     HHEmployment, HHExperience, HHSalary, HHSchedule,
-    HHType, HHProfessionalRole
+    HHType, HHProfessionalRole, HHVacancyDetail
 )
+from src.utils.strings import strip_html_tags
 from src.vacancies.domain.entities import (
     Vacancy, Address, Area, Employer, Employment, Experience, Salary,
     Schedule, Type, ProfessionalRole, MetroStation, VacancySource
@@ -40,6 +41,19 @@ class HHVacancyToDomainMapper:
             professional_roles=self._map_roles(vacancy.professional_roles),
         )
 
+    def map_detail(self, vacancy: Vacancy, detail: HHVacancyDetail) -> Vacancy:
+        """
+        Enrich a domain vacancy (mapped from the search results) with its full details.
+
+        :param vacancy: Domain vacancy.
+        :param detail: Full HH vacancy.
+        :return: Copy of the vacancy with the full description and key skills.
+        """
+        return vacancy.model_copy(update={
+            "full_description": strip_html_tags(detail.description),
+            "key_skills": [skill.name for skill in detail.key_skills or [] if skill.name] or None,
+        })
+
     def _map_area(self, area: HHArea | None) -> Area | None:
         if not area:
             return None
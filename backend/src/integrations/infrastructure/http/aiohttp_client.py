@@ -5,6 +5,7 @@ from socket import AF_INET
 import aiohttp
 from aiohttp.client import _RequestOptions
 
+from src.integrations.config import http_config
 from src.integrations.infrastructure.http.interfaces import IAsyncHttpClient
 
 SIZE_POOL_AIOHTTP = 100
@@ -39,7 +40,11 @@ class AiohttpClient(IAsyncHttpClient):
         """
         if cls.aiohttp_client is None:
             cls.log.debug("Initialize AiohttpClient session.")
-            timeout = aiohttp.ClientTimeout(total=2)
+            # Per-attempt timeouts are applied by APIClientService, this is an upper bound
+            timeout = aiohttp.ClientTimeout(
+                total=http_config.HTTP_SESSION_TIMEOUT_SECONDS,
+                connect=http_config.HTTP_CONNECT_TIMEOUT_SECONDS
+            )
             connector = aiohttp.TCPConnector(
                 family=AF_INET,
                 limit_per_host=SIZE_POOL_AIOHTTP,
@@ -0,0 +1,180 @@
+import abc
+import json
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping
+
+from multidict import CIMultiDict, CIMultiDictProxy
+from pydantic import BaseModel, ConfigDict
+
+from src.core.infrastructure.clients.redis import get_redis_client
+from src.utils.cache import TTLCache
+
+_MAX_AGE_PATTERN = re.compile(r"(?:^|,)\s*(?:s-)?max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+class HttpCacheEntry(BaseModel):
+    """
+    Cached HTTP response with its validators.
+
+    Attributes:
+        status: Response status.
+        headers: Response headers.
+        body: Raw response body.
+        fresh_until: Unix time until which the entry can be served without revalidation.
+    """
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    fresh_until: float
+
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry may be served without asking the upstream."""
+        return time.time() < self.fresh_until
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers allowing the upstream to answer 304 Not Modified."""
+        headers = CIMultiDict(self.headers)
+        validators = {}
+        if etag := headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        return validators
+
+    def to_response(self) -> "CachedResponse":
+        """Build a response object from the entry."""
+        return CachedResponse(status=self.status, headers=self.headers, body=self.body)
+
+
+class CachedResponse:
+    """
+    Fully read HTTP response.
+
+    Mirrors the part of `aiohttp.ClientResponse` used by API clients (status, headers,
+    `read`/`text`/`json`, `raise_for_status`, `release`), so cached and fresh responses
+    are interchangeable for the callers.
+
+    Args:
+        status (int): Response status.
+        headers (Mapping[str, str]): Response headers.
+        body (bytes): Raw response body.
+    """
+
+    def __init__(self, status: int, headers: Mapping[str, str], body: bytes):
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.body = body
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        return self.body.decode(encoding)
+
+    async def json(self, **kwargs) -> Any:
+        return json.loads(self.body)
+
+    def raise_for_status(self) -> None:
+        # Only successful responses are cached
+        pass
+
+    def release(self) -> None:
+        pass
+
+
+class IHttpCache(abc.ABC):
+    """
+    Storage interface for cached HTTP responses.
+    """
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> HttpCacheEntry | None:
+        """
+        Get a cached response (fresh or stale).
+
+        :param key: Cache key.
+        :return: Cache entry or None.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def set(self, key: str, entry: HttpCacheEntry, ttl: float) -> None:
+        """
+        Store a response.
+
+        :param key: Cache key.
+        :param entry: Cache entry.
+        :param ttl: Storage lifetime in seconds (may exceed the freshness lifetime to allow revalidation).
+        """
+        pass
+
+
+class InMemoryHttpCache(IHttpCache):
+    """
+    In-process LRU implementation of IHttpCache.
+
+    Args:
+        max_size (int): Maximum number of cached responses.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self._cache: TTLCache[str, HttpCacheEntry] = TTLCache(max_size=max_size)
+
+    async def get(self, key: str) -> HttpCacheEntry | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, entry: HttpCacheEntry, ttl: float) -> None:
+        self._cache.set(key, entry, ttl=ttl)
+
+
+class RedisHttpCache(IHttpCache):
+    """
+    Redis implementation of IHttpCache shared by all processes.
+
+    Entries are stored as JSON (the body is base64-encoded) under `http_cache:<key>`.
+    """
+
+    def __init__(self):
+        self.redis = get_redis_client()
+
+    async def get(self, key: str) -> HttpCacheEntry | None:
+        value = await self.redis.get(self._get_key(key))
+        return HttpCacheEntry.model_validate_json(value) if value else None
+
+    async def set(self, key: str, entry: HttpCacheEntry, ttl: float) -> None:
+        await self.redis.set(self._get_key(key), entry.model_dump_json(), ex=max(1, int(ttl)))
+
+    @staticmethod
+    def _get_key(key: str) -> str:
+        return f"http_cache:{key}"
+
+
+def get_freshness_lifetime(headers: Mapping[str, str], default: float = 0) -> float | None:
+    """
+    Calculate for how long a response may be served from the cache without revalidation.
+
+    :param headers: Response headers.
+    :param default: Lifetime used when the upstream doesn't specify one.
+    :return: Lifetime in seconds or None if the response must not be stored at all.
+    """
+    headers = CIMultiDict(headers)
+    cache_control = headers.get("Cache-Control", "")
+    directives = {directive.strip().split("=")[0].lower() for directive in cache_control.split(",")}
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    if match := _MAX_AGE_PATTERN.search(cache_control):
+        return float(match.group(1))
+    if expires := headers.get("Expires"):
+        try:
+            return max(0.0, parsedate_to_datetime(expires).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return 0
+    return default
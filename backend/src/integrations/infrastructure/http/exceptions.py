@@ -0,0 +1,7 @@
+from src.core.domain.exceptions import statuses
+from src.core.domain.exceptions.exceptions import AppException
+
+
+class CircuitOpenError(AppException):
+    status_code = statuses.HTTP_503_SERVICE_UNAVAILABLE
+    detail = "External service is temporarily unavailable"
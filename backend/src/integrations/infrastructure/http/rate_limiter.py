@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+
+class TokenBucketRateLimiter:
+    """
+    Asynchronous token-bucket rate limiter.
+
+    The bucket is refilled continuously at `rate` tokens per second up to `capacity`.
+    Each call to `acquire` consumes one token and waits until a token becomes available,
+    which allows short bursts while keeping the long-term request rate bounded.
+
+    Args:
+        rate (float): Number of tokens added to the bucket per second.
+        capacity (int | None): Maximum number of tokens in the bucket (default: `ceil(rate)`).
+    """
+
+    def __init__(self, rate: float, capacity: int | None = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate + 0.999))
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and consume it.
+        """
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def _refill(self) -> None:
+        """
+        Add tokens accumulated since the last refill, respecting the bucket capacity.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class AdaptiveTokenBucketRateLimiter(TokenBucketRateLimiter):
+    """
+    Token-bucket rate limiter adjusting its rate to the upstream feedback (AIMD).
+
+    The rate is halved every time the upstream throttles requests (e.g. HTTP 429)
+    and grows back additively with every successful request, up to the initial rate.
+
+    Args:
+        rate (float): Maximum number of tokens added to the bucket per second.
+        capacity (int | None): Maximum number of tokens in the bucket (default: `ceil(rate)`).
+        min_rate (float | None): The rate is never decreased below this value (default: `rate / 10`).
+        increase_step (float | None): Rate increment per successful request (default: `rate / 20`).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int | None = None,
+        min_rate: float | None = None,
+        increase_step: float | None = None
+    ):
+        super().__init__(rate, capacity)
+        self.max_rate = rate
+        self.min_rate = min_rate or rate / 10
+        self.increase_step = increase_step or rate / 20
+
+    def on_success(self) -> None:
+        """
+        Additively increase the rate after a successful request.
+        """
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttled(self) -> None:
+        """
+        Multiplicatively decrease the rate and drop the accumulated burst after throttling.
+        """
+        self._refill()
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, 0)
+
+    def limit_max_rate(self, rate: float) -> None:
+        """
+        Lower the maximum rate, scaling the bounds derived from it and keeping the current backoff.
+
+        :param rate: New maximum rate (ignored if it isn't lower than the current one).
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        if rate >= self.max_rate:
+            return
+        self._refill()
+        ratio = rate / self.max_rate
+        self.max_rate = rate
+        self.min_rate *= ratio
+        self.increase_step *= ratio
+        self.rate = min(rate, self.rate * ratio)
+        self.capacity = max(1, int(self.capacity * ratio + 0.999))
+        self._tokens = min(self._tokens, self.capacity)
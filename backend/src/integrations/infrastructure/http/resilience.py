@@ -0,0 +1,216 @@
+import asyncio
+import datetime
+import email.utils
+import logging
+import random
+import time
+import weakref
+
+import aiohttp
+
+from src.integrations.config import http_config
+from src.integrations.infrastructure.http.exceptions import CircuitOpenError
+from src.integrations.infrastructure.http.rate_limiter import AdaptiveTokenBucketRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """
+    Retry policy with exponential backoff and full jitter.
+
+    A failed attempt is retried if the request method is idempotent and the response status
+    (or the raised exception) is considered transient. The delay before the next attempt is
+    a random value between zero and `backoff_base * 2 ** (attempt - 1)` capped by `backoff_max`;
+    a `Retry-After` header sent by the upstream takes precedence.
+
+    Args:
+        max_attempts (int): Maximum number of attempts including the first one.
+        backoff_base (float): Base delay in seconds.
+        backoff_max (float): Maximum delay in seconds.
+        retry_statuses (frozenset[int]): Response statuses worth retrying.
+        retry_methods (frozenset[str]): Methods which are safe to repeat.
+        retry_exceptions (tuple[type[BaseException], ...]): Transient errors (timeouts, dropped connections).
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = http_config.HTTP_RETRY_MAX_ATTEMPTS,
+        backoff_base: float = http_config.HTTP_RETRY_BACKOFF_BASE_SECONDS,
+        backoff_max: float = http_config.HTTP_RETRY_BACKOFF_MAX_SECONDS,
+        retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+        retry_methods: frozenset[str] = frozenset({"GET", "PUT", "DELETE"}),
+        retry_exceptions: tuple[type[BaseException], ...] = (
+            TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError
+        )
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.retry_methods = retry_methods
+        self.retry_exceptions = retry_exceptions
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """
+        Check whether another attempt is allowed.
+
+        :param method: HTTP method of the request.
+        :param attempt: Number of the attempt which has just failed (starting from 1).
+        :return: True if the request may be repeated.
+        """
+        return method in self.retry_methods and attempt < self.max_attempts
+
+    def should_retry_status(self, method: str, status: int, attempt: int) -> bool:
+        """
+        Check whether a response with the given status should be retried.
+
+        :param method: HTTP method of the request.
+        :param status: Response status.
+        :param attempt: Number of the attempt which has just failed (starting from 1).
+        :return: True if the request should be repeated.
+        """
+        return status in self.retry_statuses and self.can_retry(method, attempt)
+
+    def get_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Calculate the delay before the next attempt.
+
+        :param attempt: Number of the attempt which has just failed (starting from 1).
+        :param retry_after: Value of the `Retry-After` header, if any.
+        :return: Delay in seconds.
+        """
+        retry_after_delay = self._parse_retry_after(retry_after)
+        if retry_after_delay is not None:
+            return min(retry_after_delay, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> float | None:
+        """
+        Parse `Retry-After` given either in seconds or as an HTTP date.
+
+        :param value: Header value.
+        :return: Delay in seconds or None if the header is missing or malformed.
+        """
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding an upstream host.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests fail fast
+    with `CircuitOpenError`. Once `recovery_timeout` has passed, a single probe request is let
+    through (half-open state): its success closes the circuit, its failure opens it again.
+
+    Args:
+        failure_threshold (int): Number of consecutive failures opening the circuit.
+        recovery_timeout (float): Seconds before an opened circuit lets a probe through.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = http_config.HTTP_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float = http_config.HTTP_CIRCUIT_RECOVERY_SECONDS
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_started_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently rejected."""
+        return self._opened_at is not None
+
+    def before_request(self) -> None:
+        """
+        Check that a request may be sent.
+
+        :raises CircuitOpenError: If the circuit is open and no probe is allowed yet.
+        """
+        if self._opened_at is None:
+            return
+        now = time.monotonic()
+        probe_in_flight = self._probe_started_at is not None and now - self._probe_started_at < self.recovery_timeout
+        if now - self._opened_at < self.recovery_timeout or probe_in_flight:
+            raise CircuitOpenError()
+        self._probe_started_at = now
+
+    def record_success(self) -> None:
+        """
+        Register a successful request and close the circuit.
+        """
+        self._failures = 0
+        self._opened_at = None
+        self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        """
+        Register a failed request, opening the circuit if the threshold is reached.
+        """
+        self._failures += 1
+        self._probe_started_at = None
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+# Limiters and breakers are shared by all clients talking to the same host.
+# asyncio primitives can't be shared between event loops (e.g. Celery tasks run
+# each one in a new loop), so the registries are scoped to the running loop.
+_rate_limiters: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, AdaptiveTokenBucketRateLimiter]
+] = weakref.WeakKeyDictionary()
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+# (host, rate) pairs whose mismatch with the shared limiter has already been reported
+# (only used to avoid repeating the warning, the rate is applied in every loop)
+_rate_mismatches: set[tuple[str, float]] = set()
+
+
+def get_host_rate_limiter(host: str, rate: float) -> AdaptiveTokenBucketRateLimiter:
+    """
+    Get the rate limiter shared by all requests to the host within the running event loop.
+
+    The limit is a budget of the host rather than of a client, so clients requesting different
+    rates share a single limiter: a lower rate than the current one narrows it for everyone
+    (the stricter quota wins) in every event loop, and the mismatch is logged once per process.
+
+    :param host: Host (with port, if any) of the upstream.
+    :param rate: Maximum rate in requests per second requested by the client.
+    :return: Shared adaptive rate limiter.
+    """
+    limiters = _rate_limiters.setdefault(asyncio.get_running_loop(), {})
+    if host not in limiters:
+        limiters[host] = AdaptiveTokenBucketRateLimiter(rate=rate)
+    limiter = limiters[host]
+    if rate != limiter.max_rate and (host, rate) not in _rate_mismatches:
+        _rate_mismatches.add((host, rate))
+        logger.warning(
+            f"Rate limit of {host} requested as {rate} req/s while it is {limiter.max_rate} req/s, "
+            f"using {min(rate, limiter.max_rate)} req/s"
+        )
+    if rate < limiter.max_rate:
+        limiter.limit_max_rate(rate)
+    return limiter
+
+
+def get_host_circuit_breaker(host: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker shared by all requests to the host.
+
+    :param host: Host (with port, if any) of the upstream.
+    :return: Shared circuit breaker.
+    """
+    if host not in _circuit_breakers:
+        _circuit_breakers[host] = CircuitBreaker()
+    return _circuit_breakers[host]
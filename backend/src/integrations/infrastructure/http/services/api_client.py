@@ -1,9 +1,31 @@
+import asyncio
+import logging
+import time
 from base64 import b64encode
 from enum import Enum
 from typing import Literal
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
+from multidict import CIMultiDict
+
+from src.integrations.config import http_config
+from src.integrations.infrastructure.http.cache import (
+    CachedResponse,
+    HttpCacheEntry,
+    IHttpCache,
+    get_freshness_lifetime
+)
 from src.integrations.infrastructure.http.interfaces import IAsyncHttpClient
+from src.integrations.infrastructure.http.rate_limiter import AdaptiveTokenBucketRateLimiter
+from src.integrations.infrastructure.http.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    get_host_circuit_breaker,
+    get_host_rate_limiter
+)
+from src.utils.hashing import get_content_fingerprint
+
+logger = logging.getLogger(__name__)
 
 
 class AuthType(Enum):
@@ -82,6 +104,17 @@ class APIClientService(AuthMixin):
     It supports various authentication types (e.g., Bearer, Basic)
     and uses an injected asynchronous HTTP client that conforms to the IAsyncHttpClient interface.
 
+    Every request goes through a resilience layer:
+    - an adaptive token-bucket limiter shared by all clients of the same host (if a rate is set),
+    - a timeout of each attempt, independent of the session timeout of the HTTP client,
+    - retries of transient failures (429, 5xx, timeouts) with exponential backoff, jitter and `Retry-After`,
+    - a circuit breaker per host which fails fast while the upstream is down.
+
+    If a cache is configured, GET responses are cached by URL, query parameters and credentials.
+    Fresh entries (`Cache-Control: max-age`, `Expires` or `cache_ttl`) are served without a request,
+    stale ones are revalidated with `If-None-Match`/`If-Modified-Since`, and a 304 answer
+    refreshes the entry without downloading the body again.
+
     Args:
         client: Asynchronous HTTP client implementation (e.g., AiohttpClient).
         source_url: Base URL of the external API.
@@ -90,6 +123,13 @@ class APIClientService(AuthMixin):
         username: Username for basic authentication.
         password: Password for basic authentication.
         token: Access token (for Bearer or Token schemes).
+        requests_per_second: Sustained request rate towards the host (None disables rate limiting).
+        request_timeout: Timeout of a single attempt in seconds (None disables it).
+        retry_policy: Retry policy (default: `RetryPolicy()` configured from settings).
+        circuit_breaker: Circuit breaker (default: the one shared by the host).
+        cache: HTTP response cache (None disables caching).
+        cache_ttl: Freshness lifetime of responses which don't specify their own.
+        cache_stale_ttl: How long stale responses are kept for revalidation.
 
     Methods:
         request(...): Send an HTTP request using the configured method and parameters.
@@ -102,7 +142,14 @@ class APIClientService(AuthMixin):
         auth_type: AuthType = AuthType.NO,
         username: str | None = None,
         password: str | None = None,
-        token: str | None = None
+        token: str | None = None,
+        requests_per_second: float | None = None,
+        request_timeout: float | None = http_config.HTTP_REQUEST_TIMEOUT_SECONDS,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        cache: IHttpCache | None = None,
+        cache_ttl: float = 0,
+        cache_stale_ttl: float = http_config.HTTP_CACHE_STALE_SECONDS
     ):
         self.auth_type = auth_type
         self.username = username
@@ -113,6 +160,21 @@ class APIClientService(AuthMixin):
         self.source_url = source_url
         self.headers = {**(headers or {}), **self.auth_headers}
 
+        self.requests_per_second = requests_per_second
+        self.request_timeout = request_timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or get_host_circuit_breaker(urlsplit(source_url).netloc)
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.cache_stale_ttl = cache_stale_ttl
+
+    @property
+    def rate_limiter(self) -> AdaptiveTokenBucketRateLimiter | None:
+        """Rate limiter shared by the clients of the host, None if rate limiting is disabled"""
+        if self.requests_per_second is None:
+            return None
+        return get_host_rate_limiter(urlsplit(self.source_url).netloc, self.requests_per_second)
+
     async def request(
         self,
         method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"],
@@ -125,6 +187,9 @@ class APIClientService(AuthMixin):
         """
         Execute an HTTP request using the configured method and parameters.
 
+        Transient failures are retried according to the retry policy, GET requests
+        are served from the cache when possible (see the class docstring).
+
         :param method: HTTP method to use (GET, POST, PUT, DELETE, PATCH).
         :param endpoint: Relative path to the resource on the external API.
         :param json_data: Optional JSON body.
@@ -133,6 +198,7 @@ class APIClientService(AuthMixin):
         :param kwargs: Extra keyword arguments passed to the HTTP client.
         :return: HTTP response from the external service.
         :raises ValueError: If the provided method is unsupported.
+        :raises CircuitOpenError: If the upstream host is considered unavailable.
         """
         headers = headers or {}
         request_params = {
@@ -140,6 +206,141 @@ class APIClientService(AuthMixin):
             "headers": {**self.headers, **headers},
             "json": json_data, "params": params, **kwargs
         }
+        if self.cache is None or method != "GET":
+            return await self._request_with_retries(method, request_params)
+        return await self._cached_request(request_params)
+
+    async def _cached_request(self, request_params: dict):
+        """
+        Execute a GET request through the response cache.
+
+        :param request_params: Keyword arguments of the HTTP client call.
+        :return: Cached or fresh HTTP response (successful bodies are already read).
+        """
+        key = self._get_cache_key(request_params)
+        entry = await self.cache.get(key)
+        if entry and entry.is_fresh:
+            return entry.to_response()
+        if entry:
+            request_params = {**request_params, "headers": {**request_params["headers"], **entry.validators}}
+
+        response = await self._request_with_retries("GET", request_params)
+        if response.status == 304 and entry:
+            response.release()
+            # Validators and freshness of the 304 answer supersede the stored ones
+            headers = CIMultiDict(entry.headers)
+            for header in ("Cache-Control", "Expires", "ETag", "Last-Modified"):
+                if header in response.headers:
+                    headers[header] = response.headers[header]
+            entry.headers = dict(headers)
+            await self._store_cache_entry(key, entry)
+            return entry.to_response()
+        if response.status != 200:
+            return response
+
+        entry = HttpCacheEntry(
+            status=response.status, headers=dict(response.headers), body=await response.read(), fresh_until=0
+        )
+        await self._store_cache_entry(key, entry)
+        return entry.to_response()
+
+    async def _store_cache_entry(self, key: str, entry: HttpCacheEntry) -> None:
+        """
+        Store a response in the cache according to its caching headers.
+
+        :param key: Cache key.
+        :param entry: Response to store.
+        """
+        freshness = get_freshness_lifetime(entry.headers, default=self.cache_ttl)
+        if freshness is None:
+            return
+        has_validators = bool(entry.validators)
+        if not freshness and not has_validators:
+            # Nothing to gain: the entry can neither be served nor revalidated
+            return
+        entry.fresh_until = time.time() + freshness
+        await self.cache.set(key, entry, ttl=freshness + (self.cache_stale_ttl if has_validators else 0))
+
+    def _get_cache_key(self, request_params: dict) -> str:
+        """
+        Build a cache key from the URL, query parameters and credentials of a request.
+
+        :param request_params: Keyword arguments of the HTTP client call.
+        :return: Cache key.
+        """
+        headers = request_params["headers"]
+        return get_content_fingerprint({
+            "url": request_params["url"],
+            "params": request_params.get("params"),
+            # Responses may depend on the caller, never share them between credentials
+            "auth": headers.get("Authorization"),
+        })
+
+    async def _request_with_retries(self, method: str, request_params: dict):
+        """
+        Execute a request with rate limiting, timeouts, retries and circuit breaking.
+
+        :param method: HTTP method.
+        :param request_params: Keyword arguments of the HTTP client call.
+        :return: HTTP response from the external service.
+        """
+        rate_limiter = self.rate_limiter
+        attempt = 0
+        while True:
+            attempt += 1
+            self.circuit_breaker.before_request()
+            if rate_limiter:
+                await rate_limiter.acquire()
+            try:
+                async with asyncio.timeout(self.request_timeout):
+                    response = await self._send(method, request_params)
+            except self.retry_policy.retry_exceptions as exc:
+                self.circuit_breaker.record_failure()
+                if not self.retry_policy.can_retry(method, attempt):
+                    raise
+                delay = self.retry_policy.get_delay(attempt)
+                logger.warning(f"{method} {request_params['url']} failed ({exc!r}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            self._record_response(response.status, rate_limiter)
+            if not self.retry_policy.should_retry_status(method, response.status, attempt):
+                response.raise_for_status()
+                return response
+            delay = self.retry_policy.get_delay(attempt, response.headers.get("Retry-After"))
+            logger.warning(
+                f"{method} {request_params['url']} responded {response.status}, retrying in {delay:.2f}s"
+            )
+            response.release()
+            await asyncio.sleep(delay)
+
+    def _record_response(self, status: int, rate_limiter: AdaptiveTokenBucketRateLimiter | None) -> None:
+        """
+        Feed the response status to the circuit breaker and the adaptive rate limiter.
+
+        Throttling and client errors mean the upstream is alive, only 5xx count as failures.
+
+        :param status: Response status.
+        :param rate_limiter: Rate limiter used for the request, if any.
+        """
+        if status >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        if rate_limiter:
+            if status == 429:
+                rate_limiter.on_throttled()
+            elif status < 400:
+                rate_limiter.on_success()
+
+    async def _send(self, method: str, request_params: dict):
+        """
+        Dispatch a single attempt to the HTTP client.
+
+        :param method: HTTP method.
+        :param request_params: Keyword arguments of the HTTP client call.
+        :return: HTTP response from the external service.
+        """
         if method == "GET":
             response = await self.client.get(**request_params)
         elif method == "POST":
@@ -152,5 +353,4 @@ class APIClientService(AuthMixin):
             response = await self.client.patch(**request_params)
         else:
             raise ValueError("Method not supported")
-        response.raise_for_status()
         return response
@@ -1,4 +1,24 @@
+from functools import lru_cache
+
+from src.integrations.config import http_config
 from src.integrations.infrastructure.external_api.headhunter.adapter import HeadHunterAdapter
+from src.integrations.infrastructure.http.cache import IHttpCache, InMemoryHttpCache, RedisHttpCache
+
+
+@lru_cache
+def get_http_cache() -> IHttpCache | None:
+    """
+    Dependency provider for the cache of external API responses.
+
+    The instance is cached, so the in-process cache is shared by all API clients of the process.
+
+    :return: An instance of IHttpCache according to `HTTP_CACHE_BACKEND` or None if caching is disabled.
+    """
+    if http_config.HTTP_CACHE_BACKEND == "redis":
+        return RedisHttpCache()
+    if http_config.HTTP_CACHE_BACKEND == "memory":
+        return InMemoryHttpCache(max_size=http_config.HTTP_CACHE_MAX_ENTRIES)
+    return None
 
 
 def get_headhunter_adapter() -> HeadHunterAdapter:
@@ -9,4 +29,4 @@ def get_headhunter_adapter() -> HeadHunterAdapter:
 
     :return: An instance of HeadHunterClient.
     """
-    return HeadHunterAdapter()
+    return HeadHunterAdapter(cache=get_http_cache())
@@ -12,7 +12,7 @@ from src.core.config import settings
 from src.core.domain.exceptions.exceptions import AppException
 import src.core.infrastructure.logging_setup
 
-from src.auth.presentation.middlewares import SecurityMiddleware, AuthenticationMiddleware, JWTRefreshMiddleware
+from src.auth.presentation.middlewares import AuthMiddleware, SecurityMiddleware
 from src.auth.presentation.api import auth_api_router
 from src.auth.presentation.views import auth_view_router
 from src.users.presentation.api import UserCRUDRouter, user_api_router
@@ -54,10 +54,9 @@ async def app_exception_handler(request: Request, exc: AppException):
 
 
 # Middlewares are processed in reverse order
-# JWTRefreshMiddleware -> AuthenticationMiddleware -> SecurityMiddleware
+# AuthMiddleware -> SecurityMiddleware
 app.add_middleware(SecurityMiddleware)
-app.add_middleware(AuthenticationMiddleware)
-app.add_middleware(JWTRefreshMiddleware)
+app.add_middleware(AuthMiddleware)
 
 Instrumentator().instrument(app).expose(app, endpoint='/__internal_metrics__')
 
@@ -0,0 +1,22 @@
+from pydantic_settings import BaseSettings
+
+
+class UserCacheConfig(BaseSettings):
+    """
+    Configuration of the user cache.
+
+    Attributes:
+        USER_CACHE_MAX_SIZE: Maximum number of users cached in process.
+        USER_CACHE_TTL_SECONDS: Lifetime of an in-process entry, i.e. for how long another process
+            may serve a user changed elsewhere (0 disables the in-process cache).
+        USER_CACHE_REDIS_ENABLED: Whether users are also cached in Redis, shared by all processes.
+        USER_CACHE_REDIS_TTL_SECONDS: Lifetime of an entry in Redis, which also bounds how long a user
+            cached by a lookup racing with a change may stay stale.
+    """
+    USER_CACHE_MAX_SIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: float = 30
+    USER_CACHE_REDIS_ENABLED: bool = False
+    USER_CACHE_REDIS_TTL_SECONDS: int = 60 * 5
+
+
+user_cache_config = UserCacheConfig()
@@ -0,0 +1,43 @@
+import abc
+
+from src.users.domain.entities import User
+
+
+class IUserCache(abc.ABC):
+    """
+    Cache interface for users looked up by primary key.
+
+    Lets frequent lookups (e.g. resolving the authenticated user of every request)
+    skip the database. Entries must be invalidated whenever a user is changed or deleted.
+
+    Users are cached without their password hash (`hashed_password` of a cached user is empty),
+    so credentials must be verified against users loaded from the database.
+    """
+
+    @abc.abstractmethod
+    async def get(self, user_id: int) -> User | None:
+        """
+        Get a cached user.
+
+        :param user_id: Primary key of the user.
+        :return: User or None if it isn't cached.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def set(self, user: User) -> None:
+        """
+        Cache a user.
+
+        :param user: User entity.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def delete(self, user_id: int) -> None:
+        """
+        Invalidate a cached user.
+
+        :param user_id: Primary key of the user.
+        """
+        pass
@@ -0,0 +1,73 @@
+from src.users.domain.entities import User, UserCreate, UserUpdate
+from src.users.domain.interfaces.user_cache import IUserCache
+from src.users.domain.interfaces.user_repo import IUserRepository
+from src.users.infrastructure.cache.user_cache import strip_credentials
+
+
+class CachedUserRepository(IUserRepository):
+    """
+    IUserRepository decorator serving lookups by primary key from a cache.
+
+    Changed and deleted users are remembered and invalidated by the unit of work once
+    the transaction is committed, so a lookup within the transaction can't put the old state
+    back into the cache between the change and the commit.
+
+    A lookup running concurrently in another transaction may still read the row before the commit
+    and cache it after the invalidation; such a stale entry lives no longer than the cache TTL
+    (`USER_CACHE_TTL_SECONDS` in process, `USER_CACHE_REDIS_TTL_SECONDS` in Redis).
+
+    Users returned by `get_by_pk` never carry the password hash, whether they come from the cache
+    or not; credentials are verified with `get_by_email`, which always reads the database.
+
+    Attributes:
+        repository: Wrapped repository.
+        cache: User cache.
+        changed_ids: Users changed or deleted in the current transaction.
+    """
+
+    def __init__(self, repository: IUserRepository, cache: IUserCache):
+        """
+        :param repository: Repository to wrap.
+        :param cache: User cache.
+        """
+        self.repository = repository
+        self.cache = cache
+        self.changed_ids: set[int] = set()
+
+    async def add(self, user: UserCreate) -> User:
+        return await self.repository.add(user)
+
+    async def get_by_email(self, email: str) -> User:
+        return await self.repository.get_by_email(email)
+
+    async def get_by_pk(self, pk: int) -> User:
+        """
+        Retrieve a user by primary key, from the cache if possible.
+
+        :param pk: Primary key (ID) of the user.
+        :return: The corresponding User entity without the password hash.
+        """
+        if (user := await self.cache.get(pk)) is not None:
+            return user
+        user = strip_credentials(await self.repository.get_by_pk(pk))
+        if pk not in self.changed_ids:
+            await self.cache.set(user)
+        return user
+
+    async def update(self, user_data: UserUpdate) -> User:
+        self.changed_ids.add(user_data.id)
+        await self.cache.delete(user_data.id)
+        return await self.repository.update(user_data)
+
+    async def delete(self, pk: int) -> None:
+        self.changed_ids.add(pk)
+        await self.cache.delete(pk)
+        await self.repository.delete(pk)
+
+    async def invalidate_changed(self) -> None:
+        """
+        Invalidate users changed in the committed transaction.
+        """
+        for user_id in self.changed_ids:
+            await self.cache.delete(user_id)
+        self.changed_ids.clear()
@@ -0,0 +1,130 @@
+import json
+from functools import lru_cache
+
+from src.core.infrastructure.clients.redis import get_redis_client
+from src.users.config import user_cache_config
+from src.users.domain.entities import User
+from src.users.domain.interfaces.user_cache import IUserCache
+from src.utils.cache import TTLCache
+
+# Value of the password hash in cached users (the hash itself is never cached)
+NO_PASSWORD_HASH = ""
+
+
+def strip_credentials(user: User) -> User:
+    """
+    Copy a user without the password hash, as it's kept by user caches.
+
+    :param user: User entity.
+    :return: User with `hashed_password` replaced by NO_PASSWORD_HASH.
+    """
+    return user.model_copy(update={"hashed_password": NO_PASSWORD_HASH})
+
+
+class InMemoryUserCache(IUserCache):
+    """
+    In-process LRU implementation of IUserCache.
+
+    Invalidation only affects the current process, so the TTL bounds for how long
+    other processes may serve a user changed elsewhere.
+
+    Args:
+        max_size (int): Maximum number of cached users.
+        ttl (float): Lifetime of an entry in seconds.
+    """
+
+    def __init__(
+        self,
+        max_size: int = user_cache_config.USER_CACHE_MAX_SIZE,
+        ttl: float = user_cache_config.USER_CACHE_TTL_SECONDS
+    ):
+        self._cache: TTLCache[int, User] = TTLCache(max_size=max_size, ttl=ttl)
+
+    async def get(self, user_id: int) -> User | None:
+        return self._cache.get(user_id)
+
+    async def set(self, user: User) -> None:
+        self._cache.set(user.id, strip_credentials(user))
+
+    async def delete(self, user_id: int) -> None:
+        self._cache.delete(user_id)
+
+
+class RedisUserCache(IUserCache):
+    """
+    Redis implementation of IUserCache shared by all processes.
+
+    Users are stored as JSON under `user_cache:<user_id>`, without the password hash.
+
+    Args:
+        ttl (int): Lifetime of an entry in seconds.
+    """
+
+    def __init__(self, ttl: int = user_cache_config.USER_CACHE_REDIS_TTL_SECONDS):
+        self.redis = get_redis_client()
+        self.ttl = ttl
+
+    async def get(self, user_id: int) -> User | None:
+        value = await self.redis.get(self._get_key(user_id))
+        if not value:
+            return None
+        return User.model_validate({**json.loads(value), "hashed_password": NO_PASSWORD_HASH})
+
+    async def set(self, user: User) -> None:
+        value = user.model_dump_json(exclude={"hashed_password"})
+        await self.redis.set(self._get_key(user.id), value, ex=self.ttl)
+
+    async def delete(self, user_id: int) -> None:
+        await self.redis.delete(self._get_key(user_id))
+
+    @staticmethod
+    def _get_key(user_id: int) -> str:
+        return f"user_cache:{user_id}"
+
+
+class TieredUserCache(IUserCache):
+    """
+    Chain of caches looked up from the fastest one.
+
+    A user found in a slower cache is copied into the faster ones,
+    writes and invalidations go to every cache.
+
+    Args:
+        caches (IUserCache): Caches ordered from the fastest one.
+    """
+
+    def __init__(self, *caches: IUserCache):
+        self.caches = caches
+
+    async def get(self, user_id: int) -> User | None:
+        for i, cache in enumerate(self.caches):
+            if (user := await cache.get(user_id)) is not None:
+                for faster_cache in self.caches[:i]:
+                    await faster_cache.set(user)
+                return user
+        return None
+
+    async def set(self, user: User) -> None:
+        for cache in self.caches:
+            await cache.set(user)
+
+    async def delete(self, user_id: int) -> None:
+        for cache in self.caches:
+            await cache.delete(user_id)
+
+
+@lru_cache
+def get_user_cache() -> IUserCache | None:
+    """
+    Get the user cache shared by the process, configured by UserCacheConfig.
+
+    :return: IUserCache instance or None if caching is disabled.
+    """
+    caches = []
+    if user_cache_config.USER_CACHE_TTL_SECONDS > 0:
+        caches.append(InMemoryUserCache())
+    if user_cache_config.USER_CACHE_REDIS_ENABLED:
+        caches.append(RedisUserCache())
+    if not caches:
+        return None
+    return caches[0] if len(caches) == 1 else TieredUserCache(*caches)
@@ -4,6 +4,7 @@ from urllib.request import Request
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
+from src.users.infrastructure.cache.user_cache import get_user_cache
 from src.users.infrastructure.services.password_hasher import BcryptPasswordHasher
 from src.users.infrastructure.db import orm
 from src.crud.base import CRUDBase
@@ -14,7 +15,8 @@ class UserService(CRUDBase, model=orm.UserDB):
     Service for managing user-related database operations.
 
     Inherits from CRUDBase and provides user-specific implementations
-    for creating and retrieving user records.
+    for creating and retrieving user records. Updated and deleted users
+    are invalidated in the user cache.
     """
 
     async def create(self, data: dict[str, Any], request: Request | None = None) -> orm.UserDB:
@@ -51,3 +53,33 @@ class UserService(CRUDBase, model=orm.UserDB):
             result = await session.execute(stmt)
             obj = result.scalars().first()
             return obj
+
+    async def update_by_pk(self, pk: Any, data: dict[str, Any], request: Request) -> orm.UserDB:
+        """
+        Update a user record and invalidate the cached user.
+
+        :param pk: Primary key of the user.
+        :param data: Dictionary of fields to update.
+        :param request: FastAPI request object used for lifecycle hooks.
+        :return: The updated UserDB instance.
+        """
+        obj = await super().update_by_pk(pk, data, request)
+        await self._invalidate_cached_user(pk)
+        return obj
+
+    async def delete_by_pk(self, pk: Any, request: Request) -> orm.UserDB:
+        """
+        Delete a user record and invalidate the cached user.
+
+        :param pk: Primary key of the user.
+        :param request: FastAPI request object used for lifecycle hooks.
+        :return: The deleted UserDB instance.
+        """
+        obj = await super().delete_by_pk(pk, request)
+        await self._invalidate_cached_user(pk)
+        return obj
+
+    @staticmethod
+    async def _invalidate_cached_user(pk: Any) -> None:
+        if user_cache := get_user_cache():
+            await user_cache.delete(int(pk))
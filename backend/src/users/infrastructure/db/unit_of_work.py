@@ -1,7 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.engine import async_session_maker
+from src.users.domain.interfaces.user_cache import IUserCache
+from src.users.domain.interfaces.user_repo import IUserRepository
 from src.users.domain.interfaces.user_uow import IUserUnitOfWork
+from src.users.infrastructure.cache.repositories import CachedUserRepository
 from src.users.infrastructure.db.repositories import PGUserRepository
 
 
@@ -15,16 +18,20 @@ class PGUserUnitOfWork(IUserUnitOfWork):
     Attributes:
         session_factory (Callable): A factory to create new async database sessions.
         session (AsyncSession): The current active session.
-        users (PGUserRepository): Repository for user operations.
+        users (IUserRepository): Repository for user operations (cached if a user cache is given).
+        user_cache (IUserCache | None): Cache of users looked up by primary key.
     """
 
-    def __init__(self, session_factory=async_session_maker):
+    def __init__(self, session_factory=async_session_maker, user_cache: IUserCache | None = None):
         """
         Initialize the unit of work with a session factory.
 
         :param session_factory: Callable that returns a new AsyncSession.
+        :param user_cache: Optional cache of users looked up by primary key. Users changed
+            in the unit of work are invalidated on commit.
         """
         self.session_factory = session_factory
+        self.user_cache = user_cache
 
     async def __aenter__(self):
         """
@@ -33,7 +40,9 @@ class PGUserUnitOfWork(IUserUnitOfWork):
         Creates a new session and initializes the user repository.
         """
         self.session: AsyncSession = self.session_factory()
-        self.users = PGUserRepository(self.session)
+        self.users: IUserRepository = PGUserRepository(self.session)
+        if self.user_cache:
+            self.users = CachedUserRepository(self.users, self.user_cache)
         return await super().__aenter__()
 
     async def __aexit__(self, *args):
@@ -47,9 +56,11 @@ class PGUserUnitOfWork(IUserUnitOfWork):
 
     async def _commit(self):
         """
-        Commit the current transaction.
+        Commit the current transaction and invalidate the cached users it has changed.
         """
         await self.session.commit()
+        if isinstance(self.users, CachedUserRepository):
+            await self.users.invalidate_changed()
 
     async def rollback(self):
         """
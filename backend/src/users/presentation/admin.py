@@ -1,7 +1,19 @@
+from typing import Any
+
 from sqladmin import ModelView
+from starlette.requests import Request
 
+from src.users.infrastructure.cache.user_cache import get_user_cache
 from src.users.infrastructure.db.orm import UserDB
 
 
 class UserAdmin(ModelView, model=UserDB):
     column_list = [UserDB.id, UserDB.email]
+
+    async def after_model_change(self, data: dict, model: Any, is_created: bool, request: Request) -> None:
+        if not is_created and (user_cache := get_user_cache()):
+            await user_cache.delete(model.id)
+
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        if user_cache := get_user_cache():
+            await user_cache.delete(model.id)
@@ -3,6 +3,7 @@ from typing import Annotated
 from fastapi import Depends
 
 from src.users.domain.interfaces.user_uow import IUserUnitOfWork
+from src.users.infrastructure.cache.user_cache import get_user_cache
 from src.users.infrastructure.db.unit_of_work import PGUserUnitOfWork
 
 
@@ -13,10 +14,11 @@ def get_user_uow() -> IUserUnitOfWork:
     This allows the presentation layer to remain decoupled from the actual implementation.
     By default, it returns a PostgreSQL-based unit of work (PGUserUnitOfWork), but the implementation
     can be easily overridden for testing or different environments.
+    Lookups by primary key go through the process user cache, which is invalidated on commit.
 
     :return: IUserUnitOfWork instance.
     """
-    return PGUserUnitOfWork()
+    return PGUserUnitOfWork(user_cache=get_user_cache())
 
 
 UserUoWDep = Annotated[IUserUnitOfWork, Depends(get_user_uow)]
@@ -0,0 +1,93 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    In-process LRU cache with per-entry expiration.
+
+    When the cache is full, the least recently used entry is evicted.
+    Expired entries are dropped lazily on access. Not thread-safe, intended
+    to be used from a single event loop.
+
+    Args:
+        max_size (int): Maximum number of entries.
+        ttl (float | None): Default lifetime of an entry in seconds (None means no expiration).
+
+    Attributes:
+        hits (int): Number of successful lookups.
+        misses (int): Number of lookups of missing or expired keys.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = None):
+        if max_size <= 0:
+            raise ValueError("Cache size must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """
+        Get a value and mark it as recently used.
+
+        :param key: Cache key.
+        :param default: Value returned if the key is missing or expired.
+        :return: Cached value or `default`.
+        """
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING or self._is_expired(item[1]):
+            if item is not _MISSING:
+                del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return item[0]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """
+        Put a value into the cache, evicting the least recently used entry if needed.
+
+        :param key: Cache key.
+        :param value: Value to cache.
+        :param ttl: Lifetime of the entry in seconds (default: the cache TTL).
+        """
+        ttl = self.ttl if ttl is None else ttl
+        self._data[key] = (value, time.monotonic() + ttl if ttl is not None else None)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """
+        Remove a key from the cache if present.
+
+        :param key: Cache key.
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the statistics.
+        """
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        item = self._data.get(key, _MISSING)
+        return item is not _MISSING and not self._is_expired(item[1])
+
+    @staticmethod
+    def _is_expired(expires_at: float | None) -> bool:
+        return expires_at is not None and expires_at <= time.monotonic()
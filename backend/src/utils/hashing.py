@@ -0,0 +1,17 @@
+import hashlib
+import json
+from typing import Any
+
+
+def get_content_fingerprint(data: Any) -> str:
+    """
+    Compute a stable fingerprint of JSON-serializable content.
+
+    Keys are sorted and whitespace is removed before hashing, so equal content
+    always produces the same fingerprint regardless of the key order.
+
+    :param data: JSON-serializable data (values like dates are converted with `str`).
+    :return: Hex-encoded SHA-256 digest (64 characters).
+    """
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
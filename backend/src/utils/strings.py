@@ -1,9 +1,15 @@
+import html
 import random
+import re
 import string
 from typing import Optional
 
 ALPHA_NUM = string.ascii_letters + string.digits
 
+_BLOCK_TAG_PATTERN = re.compile(r"<\s*(?:br|/p|/li|/div|/h[1-6]|/ul|/ol)\s*/?>", re.IGNORECASE)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_BLANK_LINES_PATTERN = re.compile(r"\n\s*\n+")
+
 
 def generate_random_alphanum(length: int = 20) -> str:
     """
@@ -35,3 +41,21 @@ def string_list_to_int_list(string_list: list | str | None) -> Optional[list[int
         return [int(number) for number in string_list.split(',')]
     elif isinstance(string_list, list):
         return [int(number) for number in string_list[0].split(',')]
+
+
+def strip_html_tags(value: str | None) -> str | None:
+    """
+    Convert an HTML fragment into plain text.
+
+    Line breaks are kept for block elements (paragraphs, list items, headers),
+    other tags are removed and HTML entities are unescaped.
+
+    :param value: HTML fragment.
+    :return: Plain text or None if the input is empty.
+    """
+    if not value:
+        return None
+    text = _BLOCK_TAG_PATTERN.sub("\n", value)
+    text = html.unescape(_TAG_PATTERN.sub("", text))
+    text = _BLANK_LINES_PATTERN.sub("\n\n", text)
+    return "\n".join(line.strip() for line in text.splitlines()).strip()
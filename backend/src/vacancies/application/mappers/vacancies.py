@@ -1,5 +1,6 @@
 from pydantic import AnyUrl
 
+from src.utils.hashing import get_content_fingerprint
 from src.vacancies.domain.entities import Vacancy
 from src.vacancies.domain.dtos import VacancyCreateDTO
 
@@ -34,7 +35,7 @@ class VacancyDomainToDTOMapper:
         :param vacancy: Domain model.
         :return: DTO for DB insertion.
         """
-        return VacancyCreateDTO(
+        dto = VacancyCreateDTO(
             source_name=vacancy.source_name,
             source_id=int(vacancy.source_id),
             url=AnyUrl(vacancy.alternate_url),
@@ -56,3 +57,5 @@ class VacancyDomainToDTOMapper:
             type=vacancy.type.name if vacancy.type else None,
             meta=vacancy.model_dump(mode="json")
         )
+        dto.fingerprint = get_content_fingerprint(dto.model_dump(mode="json", exclude={"fingerprint"}))
+        return dto
@@ -0,0 +1,119 @@
+import asyncio
+import uuid
+from contextlib import aclosing
+from typing import Any, Callable
+
+from src.core.domain.entities import BulkResult
+from src.utils.datetimes import get_timezone_now
+from src.vacancies.application.use_cases.vacancy_collector import (
+    collect_vacancies_to_db,
+    collect_vacancies_to_search,
+    complete_vacancy_details,
+    get_stored_vacancies
+)
+from src.vacancies.domain.entities import CollectionJob, CollectionJobStatus
+from src.vacancies.domain.interfaces.collection_job_storage import ICollectionJobStorage
+from src.vacancies.domain.interfaces.vacancy_search_repo import IVacancySearchRepository
+from src.vacancies.domain.interfaces.vacancy_source_client import TSearchParams, IVacancySourceClient
+from src.vacancies.domain.interfaces.vacancy_uow import IVacancyUnitOfWork
+
+
+async def create_collection_job(
+    search_params: dict[str, Any],
+    job_storage: ICollectionJobStorage
+) -> CollectionJob:
+    """
+    Register a new collection job.
+
+    :param search_params: Serialized search parameters of the source client.
+    :param job_storage: Storage of collection jobs.
+    :return: Created job in the pending state.
+    """
+    job = CollectionJob(search_params=search_params)
+    await job_storage.save(job)
+    return job
+
+
+async def run_collection_job(
+    job_id: uuid.UUID,
+    client: IVacancySourceClient,
+    uow: IVacancyUnitOfWork,
+    search_repo: IVacancySearchRepository | None,
+    job_storage: ICollectionJobStorage,
+    search_params_factory: Callable[[dict[str, Any]], TSearchParams]
+) -> CollectionJob:
+    """
+    Run (or resume) a collection job.
+
+    Each page is saved to the database and search storage, and only then checkpointed in the job,
+    so a page is never marked as completed before it's persisted. Pages completed by previous
+    attempts are skipped, writes are idempotent upserts, so re-processing a page
+    that failed between saving and checkpointing is harmless.
+
+    :param job_id: Identifier of the job.
+    :param client: External API client implementing IVacancySourceClient.
+    :param uow: Unit of Work to manage transactional operations with the database.
+    :param search_repo: Search engine repository (e.g. Elasticsearch) implementing IVacancySearchRepository,
+        or None to leave indexing to the outbox relay.
+    :param job_storage: Storage of collection jobs.
+    :param search_params_factory: Builds client search parameters from the serialized ones.
+    :return: Completed job.
+    :raises CollectionJobNotFound: If the job doesn't exist.
+    """
+    job = await job_storage.get(job_id)
+    if job.status == CollectionJobStatus.COMPLETED:
+        return job
+
+    job.status = CollectionJobStatus.RUNNING
+    job.attempts += 1
+    job.error = None
+    await _save_checkpoint(job, job_storage)
+    try:
+        completed_pages = await job_storage.get_completed_pages(job.id)
+        pages = client.iter_vacancy_pages(search_params_factory(job.search_params), completed_pages)
+        async with aclosing(pages):
+            async for page in pages:
+                if page.vacancies:
+                    vacancies = await complete_vacancy_details(
+                        page.vacancies, await get_stored_vacancies(page.vacancies, uow)
+                    )
+                    db_result, search_db_result = await asyncio.gather(
+                        collect_vacancies_to_db(vacancies, uow),
+                        collect_vacancies_to_search(vacancies, search_repo)
+                    )
+                    _add_statistics(job, {"database": db_result, "search_db": search_db_result})
+                job.completed_pages_count += 1
+                job.updated_at = get_timezone_now()
+                await job_storage.complete_page(job, page.key)
+    except Exception as exc:
+        job.status = CollectionJobStatus.FAILED
+        job.error = repr(exc)
+        await _save_checkpoint(job, job_storage)
+        raise
+
+    job.status = CollectionJobStatus.COMPLETED
+    await _save_checkpoint(job, job_storage)
+    return job
+
+
+def _add_statistics(job: CollectionJob, statistics: dict[str, BulkResult]) -> None:
+    """
+    Add the results of a page to the aggregated job statistics.
+
+    :param job: Collection job.
+    :param statistics: Bulk results of the page per storage layer.
+    """
+    for storage, result in statistics.items():
+        previous = job.statistics.get(storage)
+        job.statistics[storage] = BulkResult.merge([previous, result]) if previous else result
+
+
+async def _save_checkpoint(job: CollectionJob, job_storage: ICollectionJobStorage) -> None:
+    """
+    Persist the current state of the job.
+
+    :param job: Collection job.
+    :param job_storage: Storage of collection jobs.
+    """
+    job.updated_at = get_timezone_now()
+    await job_storage.save(job)
@@ -1,5 +1,10 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable
+
 from src.core.domain.entities import BulkResult
-from src.vacancies.domain.entities import Vacancy
+from src.utils.hashing import get_content_fingerprint
+from src.vacancies.domain.entities import VACANCY_DETAIL_FIELDS, Vacancy, VacancySource
+from src.vacancies.domain.interfaces.vacancy_repo import VacancyWriteMode
 from src.vacancies.domain.interfaces.vacancy_search_repo import IVacancySearchRepository
 from src.vacancies.domain.interfaces.vacancy_source_client import TSearchParams, IVacancySourceClient
 from src.vacancies.domain.interfaces.vacancy_uow import IVacancyUnitOfWork
@@ -9,7 +14,8 @@ async def collect_all_vacancies(
     search_params: TSearchParams,
     client: IVacancySourceClient,
     uow: IVacancyUnitOfWork,
-    search_repo: IVacancySearchRepository
+    search_repo: IVacancySearchRepository | None,
+    write_mode: VacancyWriteMode = "upsert"
 ) -> dict[str, BulkResult]:
     """
     Collect all vacancies from the external API and save them to both the database and search storage.
@@ -18,12 +24,15 @@ async def collect_all_vacancies(
     :param search_params: Search parameters to pass to the external API.
     :param client: External API client implementing IVacancySourceClient.
     :param uow: Unit of Work to manage transactional operations with the database.
-    :param search_repo: Search engine repository (e.g. Elasticsearch) implementing IVacancySearchRepository.
+    :param search_repo: Search engine repository (e.g. Elasticsearch) implementing IVacancySearchRepository,
+        or None to leave indexing to the outbox relay.
+    :param write_mode: How vacancies are written to the database (`copy` for massive imports).
     :return: Dictionary containing bulk operation results for database and search storage.
     """
     vacancies: list[Vacancy] = await client.get_all_vacancies(search_params)
+    vacancies = await complete_vacancy_details(vacancies, await get_stored_vacancies(vacancies, uow))
 
-    db_result = await collect_vacancies_to_db(vacancies, uow)
+    db_result = await collect_vacancies_to_db(vacancies, uow, write_mode)
     search_db_result = await collect_vacancies_to_search(vacancies, search_repo)
 
     statistics = {
@@ -33,11 +42,107 @@ async def collect_all_vacancies(
     return statistics
 
 
+async def collect_vacancies_streaming(
+    search_params: TSearchParams,
+    client: IVacancySourceClient,
+    uow: IVacancyUnitOfWork,
+    search_repo: IVacancySearchRepository | None,
+    batch_size: int = 500,
+    enrich: bool = False,
+    write_mode: VacancyWriteMode = "upsert"
+) -> dict[str, BulkResult]:
+    """
+    Collect all vacancies from the external API as a stream and save them batch by batch.
+
+    Pages are re-grouped into fixed-size batches; each batch is upserted into the database
+    and indexed in the search storage while the next pages are being fetched. Peak memory
+    depends on `batch_size` rather than on the size of the result set.
+
+    :param search_params: Search parameters to pass to the external API.
+    :param client: External API client implementing IVacancySourceClient.
+    :param uow: Unit of Work to manage transactional operations with the database.
+    :param search_repo: Search engine repository (e.g. Elasticsearch) implementing IVacancySearchRepository,
+        or None to leave indexing to the outbox relay.
+    :param batch_size: Number of vacancies written to the storages at once.
+    :param enrich: Whether vacancies are completed with their details before saving.
+    :param write_mode: How vacancies are written to the database (`copy` for massive imports).
+    :return: Dictionary containing aggregated bulk operation results for database and search storage.
+    """
+    return await store_vacancy_stream(
+        client.iter_vacancies(search_params), uow, search_repo, batch_size,
+        enrich=client.enrich_vacancies if enrich else None,
+        write_mode=write_mode
+    )
+
+
+async def store_vacancy_stream(
+    pages: AsyncIterator[list[Vacancy]],
+    uow: IVacancyUnitOfWork,
+    search_repo: IVacancySearchRepository | None,
+    batch_size: int = 500,
+    enrich: Callable[[list[Vacancy]], Awaitable[list[Vacancy]]] | None = None,
+    write_mode: VacancyWriteMode = "upsert"
+) -> dict[str, BulkResult]:
+    """
+    Save a stream of vacancy pages to both the database and search storage batch by batch.
+
+    Storage writes of the current batch run while the producer keeps consuming the stream
+    (and enriching the next batch, if an enrichment stage is given).
+    Vacancies left without details keep the ones stored by previous collections (see `complete_vacancy_details`).
+
+    :param pages: Async iterator of vacancy pages (e.g. `IVacancySourceClient.iter_vacancies`).
+    :param uow: Unit of Work to manage transactional operations with the database.
+    :param search_repo: Search engine repository (e.g. Elasticsearch) implementing IVacancySearchRepository,
+        or None to leave indexing to the outbox relay.
+    :param batch_size: Number of vacancies written to the storages at once.
+    :param enrich: Optional enrichment stage (e.g. `IVacancySourceClient.enrich_vacancies`).
+    :param write_mode: How vacancies are written to the database (`copy` for massive imports).
+    :return: Dictionary containing aggregated bulk operation results for database and search storage.
+    """
+    # A single buffered batch is enough to overlap network I/O with storage writes
+    queue: asyncio.Queue[list[Vacancy] | None] = asyncio.Queue(maxsize=1)
+    db_results: list[BulkResult] = []
+    search_db_results: list[BulkResult] = []
+    # The unit of work holds a single session, the producer's lookups mustn't overlap the consumer's writes
+    uow_lock = asyncio.Lock()
+
+    async def produce() -> None:
+        async for batch in _iter_batches(pages, batch_size):
+            async with uow_lock:
+                stored = await get_stored_vacancies(batch, uow)
+            batch = await complete_vacancy_details(batch, stored, enrich)
+            await queue.put(batch)
+        await queue.put(None)
+
+    async def store_to_db(batch: list[Vacancy]) -> BulkResult:
+        async with uow_lock:
+            return await collect_vacancies_to_db(batch, uow, write_mode)
+
+    async def consume() -> None:
+        while (batch := await queue.get()) is not None:
+            db_result, search_db_result = await asyncio.gather(
+                store_to_db(batch),
+                collect_vacancies_to_search(batch, search_repo)
+            )
+            db_results.append(db_result)
+            search_db_results.append(search_db_result)
+
+    async with asyncio.TaskGroup() as task_group:
+        task_group.create_task(produce())
+        task_group.create_task(consume())
+
+    statistics = {
+        "database": BulkResult.merge(db_results),
+        "search_db": BulkResult.merge(search_db_results)
+    }
+    return statistics
+
+
 async def collect_vacancies(
     search_params: TSearchParams,
     client: IVacancySourceClient,
     uow: IVacancyUnitOfWork,
-    search_repo: IVacancySearchRepository
+    search_repo: IVacancySearchRepository | None
 ) -> dict[str, BulkResult]:
     """
     Collect vacancies from the external API and save them to both the database and search storage.
@@ -45,10 +150,12 @@ async def collect_vacancies(
     :param search_params: Search parameters to pass to the external API.
     :param client: External API client implementing IVacancySourceClient.
     :param uow: Unit of Work to manage transactional operations with the database.
-    :param search_repo: Search engine repository (e.g. Elasticsearch) implementing IVacancySearchRepository.
+    :param search_repo: Search engine repository (e.g. Elasticsearch) implementing IVacancySearchRepository,
+        or None to leave indexing to the outbox relay.
     :return: Dictionary containing bulk operation results for database and search storage.
     """
     vacancies: list[Vacancy] = await client.get_vacancies(search_params)
+    vacancies = await complete_vacancy_details(vacancies, await get_stored_vacancies(vacancies, uow))
 
     db_result = await collect_vacancies_to_db(vacancies, uow)
     search_db_result = await collect_vacancies_to_search(vacancies, search_repo)
@@ -60,33 +167,164 @@ async def collect_vacancies(
     return statistics
 
 
-async def collect_vacancies_to_db(
+async def get_stored_vacancies(
     vacancies: list[Vacancy],
     uow: IVacancyUnitOfWork
+) -> dict[tuple[VacancySource, str], Vacancy]:
+    """
+    Load the stored versions of the vacancies which come without their details.
+
+    :param vacancies: Vacancies from search results.
+    :param uow: Unit of Work to manage transactional operations with the database.
+    :return: Stored vacancies by (source_name, source_id).
+    """
+    source_ids: dict[VacancySource, list[str]] = {}
+    for vacancy in vacancies:
+        if vacancy.full_description is None:
+            source_ids.setdefault(vacancy.source_name, []).append(vacancy.source_id)
+    if not source_ids:
+        return {}
+
+    stored: dict[tuple[VacancySource, str], Vacancy] = {}
+    async with uow:
+        for source_name, ids in source_ids.items():
+            for vacancy in await uow.vacancies.get_by_source_ids(source_name, ids):
+                stored[(vacancy.source_name, vacancy.source_id)] = vacancy
+    return stored
+
+
+async def complete_vacancy_details(
+    vacancies: list[Vacancy],
+    stored: dict[tuple[VacancySource, str], Vacancy],
+    enrich: Callable[[list[Vacancy]], Awaitable[list[Vacancy]]] | None = None
+) -> list[Vacancy]:
+    """
+    Complete vacancies from search results with their details before saving.
+
+    Search results don't contain the full description and key skills. Only vacancies that are new,
+    modified since they were stored (their search result changed) or stored without details
+    are passed to the enrichment stage, the rest reuse the persisted details, so repeated collections
+    don't fetch details again regardless of the process they run in.
+
+    Vacancies left without details (not enriched, or their details couldn't be fetched) keep the ones
+    stored by previous collections, otherwise every collector would overwrite them and change
+    the fingerprint of the vacancy, re-writing and re-indexing it back and forth between enriched
+    and non-enriched runs. Details of a modified vacancy are refreshed by the next enriched collection.
+
+    :param vacancies: Vacancies from search results.
+    :param stored: Stored versions of the vacancies (see `get_stored_vacancies`).
+    :param enrich: Optional enrichment stage (e.g. `IVacancySourceClient.enrich_vacancies`).
+    :return: Vacancies in the same order.
+    """
+    vacancies = list(vacancies)
+    if enrich:
+        pending = [
+            index for index, vacancy in enumerate(vacancies)
+            if not _has_actual_details(vacancy, stored.get((vacancy.source_name, vacancy.source_id)))
+        ]
+        if pending:
+            enriched = await enrich([vacancies[index] for index in pending])
+            for index, vacancy in zip(pending, enriched):
+                vacancies[index] = vacancy
+    return [_restore_details(vacancy, stored.get((vacancy.source_name, vacancy.source_id))) for vacancy in vacancies]
+
+
+async def collect_vacancies_to_db(
+    vacancies: list[Vacancy],
+    uow: IVacancyUnitOfWork,
+    write_mode: VacancyWriteMode = "upsert"
 ) -> BulkResult:
     """
     Store vacancies in the relational database using the given Unit of Work.
 
     :param vacancies: List of domain vacancy models to be saved.
     :param uow: Unit of Work to manage the transactional context for database operations.
+    :param write_mode: `upsert` for regular batches, `copy` for massive imports (e.g. full-market backfills).
     :return: Result of bulk insert/update operation.
     """
     async with uow:
-        result = await uow.vacancies.bulk_add_or_update(vacancies)
+        if write_mode == "copy":
+            result = await uow.vacancies.bulk_load(vacancies)
+        else:
+            result = await uow.vacancies.bulk_add_or_update(vacancies)
         await uow.commit()
     return result
 
 
 async def collect_vacancies_to_search(
     vacancies: list[Vacancy],
-    search_repo: IVacancySearchRepository
+    search_repo: IVacancySearchRepository | None
 ) -> BulkResult:
     """
     Store vacancies in the search database (e.g., Elasticsearch).
 
+    Without a search repository indexing is deferred: the vacancies are reported as skipped
+    and get indexed by the outbox relay (`relay_vacancy_outbox`) once committed to the database.
+
     :param vacancies: List of domain vacancy models to be indexed.
-    :param search_repo: Repository for managing search engine operations.
+    :param search_repo: Repository for managing search engine operations, or None to defer indexing.
     :return: Result of bulk indexing operation.
     """
+    if search_repo is None:
+        return BulkResult(success=0, failed=0, total=len(vacancies), skipped=len(vacancies))
     result = await search_repo.bulk_add(vacancies)
     return result
+
+
+def _has_actual_details(vacancy: Vacancy, stored_vacancy: Vacancy | None) -> bool:
+    """
+    Check whether a vacancy doesn't need to be enriched.
+
+    :param vacancy: Vacancy from search results.
+    :param stored_vacancy: Stored version of the vacancy, if any.
+    :return: True if the vacancy has details or its stored details are up to date.
+    """
+    if vacancy.full_description is not None:
+        return True
+    if stored_vacancy is None or stored_vacancy.full_description is None:
+        return False
+    return _get_search_fingerprint(vacancy) == _get_search_fingerprint(stored_vacancy)
+
+
+def _get_search_fingerprint(vacancy: Vacancy) -> str:
+    """
+    Calculate the fingerprint of the vacancy's search result (the vacancy without its details).
+
+    :param vacancy: Domain vacancy.
+    :return: Content fingerprint.
+    """
+    return get_content_fingerprint(vacancy.model_dump(mode="json", exclude=VACANCY_DETAIL_FIELDS))
+
+
+def _restore_details(vacancy: Vacancy, stored_vacancy: Vacancy | None) -> Vacancy:
+    """
+    Copy the stored details to a vacancy which comes without them.
+
+    :param vacancy: Vacancy to save.
+    :param stored_vacancy: Stored version of the vacancy, if any.
+    :return: Vacancy with details where available.
+    """
+    if vacancy.full_description is not None or stored_vacancy is None or stored_vacancy.full_description is None:
+        return vacancy
+    return vacancy.model_copy(update={field: getattr(stored_vacancy, field) for field in VACANCY_DETAIL_FIELDS})
+
+
+async def _iter_batches(
+    pages: AsyncIterator[list[Vacancy]],
+    batch_size: int
+) -> AsyncIterator[list[Vacancy]]:
+    """
+    Re-group a stream of vacancy pages into batches of a fixed size.
+
+    :param pages: Async iterator of vacancy pages of arbitrary size.
+    :param batch_size: Size of the produced batches (the last one may be smaller).
+    :return: Async iterator of vacancy batches.
+    """
+    batch: list[Vacancy] = []
+    async for page in pages:
+        batch.extend(page)
+        while len(batch) >= batch_size:
+            yield batch[:batch_size]
+            batch = batch[batch_size:]
+    if batch:
+        yield batch
@@ -0,0 +1,42 @@
+from src.core.domain.entities import BulkResult
+from src.vacancies.domain.exceptions import SearchIndexingFailed
+from src.vacancies.domain.interfaces.vacancy_search_repo import IVacancySearchRepository
+from src.vacancies.domain.interfaces.vacancy_uow import IVacancyUnitOfWork
+
+
+async def relay_vacancy_outbox(
+    uow: IVacancyUnitOfWork,
+    search_repo: IVacancySearchRepository,
+    batch_size: int = 1000,
+    max_batches: int | None = None
+) -> BulkResult:
+    """
+    Relay vacancy changes recorded in the outbox to the search storage.
+
+    The outbox is drained batch by batch. Every batch is claimed within a transaction,
+    indexed (repeated changes of a vacancy are coalesced into a single document) and
+    its events are deleted on commit. If indexing fails, the transaction is rolled back
+    and the events are kept for the next attempt; already indexed vacancies are cheap
+    to resend since the search repository skips unchanged documents.
+
+    :param uow: Unit of Work to manage transactional operations with the database.
+    :param search_repo: Search engine repository (e.g. Elasticsearch) implementing IVacancySearchRepository.
+    :param batch_size: Maximum number of outbox events processed at once.
+    :param max_batches: Maximum number of batches processed by the call (unlimited by default).
+    :return: Aggregated result of the indexing operations.
+    :raises SearchIndexingFailed: If some vacancies of a batch couldn't be indexed.
+    """
+    results: list[BulkResult] = []
+    while max_batches is None or len(results) < max_batches:
+        async with uow:
+            batch = await uow.outbox.claim_batch(batch_size)
+            if not batch.event_ids:
+                break
+            result = await search_repo.bulk_add(batch.vacancies)
+            failed = len(result.failed) if isinstance(result.failed, list) else result.failed
+            if failed:
+                raise SearchIndexingFailed(failed=failed, total=result.total)
+            await uow.outbox.delete(batch.event_ids)
+            await uow.commit()
+        results.append(result)
+    return BulkResult.merge(results)
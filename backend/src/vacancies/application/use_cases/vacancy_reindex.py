@@ -0,0 +1,30 @@
+import datetime
+
+from src.core.domain.entities import BulkResult
+from src.vacancies.domain.interfaces.vacancy_search_repo import IVacancySearchRepository
+from src.vacancies.domain.interfaces.vacancy_uow import IVacancyUnitOfWork
+
+
+async def reindex_vacancies(
+    uow: IVacancyUnitOfWork,
+    search_repo: IVacancySearchRepository,
+    batch_size: int = 1000,
+    updated_since: datetime.datetime | None = None
+) -> BulkResult:
+    """
+    Index vacancies stored in the database in the search storage.
+
+    A full reindex (without `updated_since`) streams every vacancy in the bulk load mode,
+    a partial one catches up with the changes made since the given moment.
+
+    :param uow: Unit of Work to manage transactional operations with the database.
+    :param search_repo: Search engine repository (e.g. Elasticsearch) writing to the target index.
+    :param batch_size: Number of vacancies read from the database at once.
+    :param updated_since: Only vacancies created or updated since this moment, if given.
+    :return: Aggregated result of the indexing operation.
+    """
+    async with uow:
+        return await search_repo.bulk_index(
+            uow.vacancies.iter_vacancies(batch_size, updated_since),
+            bulk_load=updated_since is None
+        )
@@ -0,0 +1,64 @@
+import datetime
+from typing import AsyncIterator
+
+from src.core.domain.entities import BulkResult
+from src.vacancies.application.use_cases.vacancy_collector import store_vacancy_stream
+from src.vacancies.domain.entities import Vacancy
+from src.vacancies.domain.interfaces.sync_state_storage import ISyncStateStorage
+from src.vacancies.domain.interfaces.vacancy_search_repo import IVacancySearchRepository
+from src.vacancies.domain.interfaces.vacancy_source_client import TSearchParams, IVacancySourceClient
+from src.vacancies.domain.interfaces.vacancy_uow import IVacancyUnitOfWork
+
+
+async def collect_new_vacancies(
+    profile: str,
+    search_params: TSearchParams,
+    client: IVacancySourceClient,
+    uow: IVacancyUnitOfWork,
+    search_repo: IVacancySearchRepository | None,
+    state_storage: ISyncStateStorage,
+    overlap: datetime.timedelta = datetime.timedelta(minutes=10),
+    batch_size: int = 500,
+    enrich: bool = False
+) -> dict[str, BulkResult]:
+    """
+    Incrementally collect vacancies published since the previous run of the search profile.
+
+    The latest seen publication date (high-water mark) is stored per profile. The next run only
+    requests vacancies published after it minus a small overlap window, which covers vacancies
+    indexed by the source with a delay. The first run of a profile collects everything.
+    The high-water mark is only moved forward after the vacancies have been stored.
+
+    :param profile: Name of the search profile (the key of the high-water mark).
+    :param search_params: Search parameters to pass to the external API.
+    :param client: External API client implementing IVacancySourceClient.
+    :param uow: Unit of Work to manage transactional operations with the database.
+    :param search_repo: Search engine repository (e.g. Elasticsearch) implementing IVacancySearchRepository,
+        or None to leave indexing to the outbox relay.
+    :param state_storage: Storage of high-water marks.
+    :param overlap: Window subtracted from the high-water mark to tolerate late publications.
+    :param batch_size: Number of vacancies written to the storages at once.
+    :param enrich: Whether vacancies are completed with their details before saving.
+    :return: Dictionary containing aggregated bulk operation results for database and search storage.
+    """
+    high_water_mark = await state_storage.get_high_water_mark(profile)
+    published_since = high_water_mark - overlap if high_water_mark else None
+    latest_published = high_water_mark
+
+    async def track_latest_published(pages: AsyncIterator[list[Vacancy]]) -> AsyncIterator[list[Vacancy]]:
+        nonlocal latest_published
+        async for page in pages:
+            for vacancy in page:
+                published_at = vacancy.published_datetime
+                if published_at and (latest_published is None or published_at > latest_published):
+                    latest_published = published_at
+            yield page
+
+    pages = client.iter_vacancies(search_params, published_since=published_since)
+    statistics = await store_vacancy_stream(
+        track_latest_published(pages), uow, search_repo, batch_size,
+        enrich=client.enrich_vacancies if enrich else None
+    )
+    if latest_published and latest_published != high_water_mark:
+        await state_storage.set_high_water_mark(profile, latest_published)
+    return statistics
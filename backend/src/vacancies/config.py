@@ -0,0 +1,27 @@
+from pydantic_settings import BaseSettings
+
+
+class VacancyStorageConfig(BaseSettings):
+    """
+    Configuration of vacancy storage.
+
+    Attributes:
+        VACANCY_UPSERT_CHUNK_SIZE: Maximum number of rows per INSERT ... ON CONFLICT statement
+            (additionally capped by the PostgreSQL bind parameter limit).
+        VACANCY_INDEX_CHUNK_SIZE: Maximum number of documents per Elasticsearch bulk request.
+        VACANCY_INDEX_MAX_CHUNK_BYTES: Maximum size of a bulk request body in bytes.
+        VACANCY_INDEX_CONCURRENCY: Number of bulk requests sent to Elasticsearch in parallel.
+        VACANCY_INDEX_MAX_RETRIES: Retries of documents rejected with 429 Too Many Requests.
+        VACANCY_SUGGEST_CACHE_SIZE: Maximum number of autocomplete prefixes cached in process.
+        VACANCY_SUGGEST_CACHE_TTL_SECONDS: Lifetime of cached autocomplete suggestions.
+    """
+    VACANCY_UPSERT_CHUNK_SIZE: int = 1000
+    VACANCY_INDEX_CHUNK_SIZE: int = 500
+    VACANCY_INDEX_MAX_CHUNK_BYTES: int = 10 * 1024 * 1024
+    VACANCY_INDEX_CONCURRENCY: int = 4
+    VACANCY_INDEX_MAX_RETRIES: int = 3
+    VACANCY_SUGGEST_CACHE_SIZE: int = 10_000
+    VACANCY_SUGGEST_CACHE_TTL_SECONDS: float = 60
+
+
+vacancy_storage_config = VacancyStorageConfig()
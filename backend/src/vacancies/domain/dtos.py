@@ -79,6 +79,7 @@ class VacancyCreateDTO(CustomModel):
     is_archived: bool = False
     type: str | None = None
     meta: dict
+    fingerprint: str | None = None
     # Dates
     created_at: datetime.datetime | None = None
     published_at: datetime.datetime | None = None
@@ -1,10 +1,12 @@
 import datetime
+import uuid
 from enum import Enum
 from typing import Literal
 
 from pydantic import Field
 
-from src.core.domain.entities import CustomModel
+from src.core.domain.entities import BulkResult, CustomModel
+from src.utils.datetimes import get_timezone_now
 
 
 class VacancySource(str, Enum):
@@ -79,6 +81,10 @@ class ProfessionalRole(CustomModel):
     name: str | None = None
 
 
+# Fields of a vacancy missing from search results (completed by `IVacancySourceClient.enrich_vacancies`)
+VACANCY_DETAIL_FIELDS = {"full_description", "key_skills"}
+
+
 class Vacancy(CustomModel):
     """
     Domain model representing a job vacancy.
@@ -114,15 +120,38 @@ class Vacancy(CustomModel):
     type: Type | None = None
     url: str | None = None
     professional_roles: list[ProfessionalRole] | None = None
+    full_description: str | None = None
+    key_skills: list[str] | None = None
 
     @property
     def description(self) -> str | None:
-        """Vacancy description"""
+        """Vacancy description (the full one if the vacancy has been enriched, otherwise built from the snippet)"""
+        if self.full_description:
+            return self.full_description
         requirement = self.requirement or ''
         responsibility = self.responsibility or ''
         description = f"{requirement}\n\n{responsibility}".strip()
         return description
 
+    @property
+    def published_datetime(self) -> datetime.datetime | None:
+        """Publication date as an aware datetime (sources provide it as an ISO 8601 string)"""
+        if not self.published_at:
+            return None
+        return datetime.datetime.fromisoformat(self.published_at)
+
+
+class VacancyPage(CustomModel):
+    """
+    A page of vacancies received from a source.
+
+    Attributes:
+        key: Identifier of the page, stable across runs of the same query (used for checkpoints).
+        vacancies: Vacancies of the page.
+    """
+    key: str
+    vacancies: list[Vacancy]
+
 
 class VacancySearchQuery(CustomModel):
     query: str | None = Field(None, description="Поисковый запрос по названию вакансии")
@@ -139,3 +168,95 @@ class VacancySearchQuery(CustomModel):
     sort_order: Literal["asc", "desc"] = "desc"
     page: int = 0
     size: int = 10
+    paginate_by: Literal["offset", "cursor"] = Field(
+        "offset", description="Постраничная навигация по номеру страницы или курсором (для глубокой выгрузки)"
+    )
+    cursor: str | None = Field(None, description="Курсор следующей страницы из заголовка X-Next-Cursor")
+
+
+class VacancyFacetQuery(VacancySearchQuery):
+    facet_size: int = Field(20, ge=1, le=100, description="Максимальное количество значений в каждом фасете")
+    salary_interval: int = Field(50000, ge=1000, description="Ширина интервала гистограммы зарплат")
+
+
+class VacancySuggestQuery(CustomModel):
+    prefix: str = Field(..., min_length=1, max_length=100, description="Начало названия вакансии или работодателя")
+    field: Literal["name", "employer"] = Field("name", description="Подсказывать названия вакансий или работодателей")
+    size: int = Field(10, ge=1, le=20, description="Количество подсказок")
+
+
+class FacetBucket(CustomModel):
+    """
+    Number of matching vacancies with a value of a facet.
+
+    Attributes:
+        value: Facet value (a term or the lower bound of a histogram interval).
+        count: Number of vacancies.
+    """
+    value: str | int | float
+    count: int
+
+
+class VacancyFacetedResult(CustomModel):
+    """
+    Page of search results together with facet counts over all matching vacancies.
+
+    Attributes:
+        total: Number of matching vacancies.
+        hits: Page of matching vacancies as returned by the search storage.
+        facets: Buckets per facet (area, employer, experience, employment, schedule, salary_from, salary_to).
+    """
+    total: int
+    hits: list[dict]
+    facets: dict[str, list[FacetBucket]]
+
+
+class CollectionJobStatus(str, Enum):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+
+class CollectionJob(CustomModel):
+    """
+    Long-running vacancy collection with checkpoints.
+
+    Every page is checkpointed once it has been saved to all storages,
+    so a restarted job skips the pages completed by the previous attempts.
+    The keys of the completed pages are kept by the job storage apart from the job itself
+    (see `ICollectionJobStorage.get_completed_pages`), so the job stays small however many pages it has.
+
+    Attributes:
+        id: Job identifier.
+        search_params: Search parameters of the source client.
+        status: Current job status.
+        attempts: Number of started attempts.
+        completed_pages_count: Number of pages already saved to all storages.
+        statistics: Aggregated bulk results per storage layer.
+        error: Error of the last failed attempt.
+    """
+    id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    search_params: dict
+    status: CollectionJobStatus = CollectionJobStatus.PENDING
+    attempts: int = 0
+    completed_pages_count: int = 0
+    statistics: dict[str, BulkResult] = Field(default_factory=dict)
+    error: str | None = None
+    created_at: datetime.datetime = Field(default_factory=get_timezone_now)
+    updated_at: datetime.datetime = Field(default_factory=get_timezone_now)
+
+
+class VacancyOutboxBatch(CustomModel):
+    """
+    A batch of pending search index updates claimed from the outbox.
+
+    Repeated changes of the same vacancy are coalesced: the batch contains every
+    claimed event, but each changed vacancy only once, in its current state.
+
+    Attributes:
+        event_ids: Identifiers of the claimed outbox events.
+        vacancies: Current state of the changed vacancies.
+    """
+    event_ids: list[int] = Field(default_factory=list)
+    vacancies: list[Vacancy] = Field(default_factory=list)
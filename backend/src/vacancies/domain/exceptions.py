@@ -0,0 +1,15 @@
+from src.core.domain.exceptions import statuses
+from src.core.domain.exceptions.exceptions import AppException, BadRequest, NotFound
+
+
+class CollectionJobNotFound(NotFound):
+    detail = "Collection job not found"
+
+
+class SearchIndexingFailed(AppException):
+    status_code = statuses.HTTP_503_SERVICE_UNAVAILABLE
+    detail = "Vacancies could not be indexed in the search storage"
+
+
+class InvalidSearchCursor(BadRequest):
+    detail = "Search cursor is invalid or expired"
@@ -0,0 +1,50 @@
+import abc
+import uuid
+
+from src.vacancies.domain.entities import CollectionJob
+
+
+class ICollectionJobStorage(abc.ABC):
+    """
+    Storage interface for the state and checkpoints of vacancy collection jobs.
+    """
+
+    @abc.abstractmethod
+    async def get(self, job_id: uuid.UUID) -> CollectionJob:
+        """
+        Get a collection job by its identifier.
+
+        :param job_id: Job identifier.
+        :return: Collection job.
+        :raises CollectionJobNotFound: If the job doesn't exist (or has expired).
+        """
+        pass
+
+    @abc.abstractmethod
+    async def save(self, job: CollectionJob) -> None:
+        """
+        Create or overwrite the state of a collection job.
+
+        :param job: Collection job.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def get_completed_pages(self, job_id: uuid.UUID) -> set[str]:
+        """
+        Get the keys of the pages completed by a collection job.
+
+        :param job_id: Job identifier.
+        :return: Keys of the completed pages.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def complete_page(self, job: CollectionJob, page_key: str) -> None:
+        """
+        Checkpoint a completed page and overwrite the state of its collection job.
+
+        :param job: Collection job (with the counters already updated).
+        :param page_key: Key of the completed page.
+        """
+        pass
@@ -0,0 +1,31 @@
+import abc
+import datetime
+
+
+class ISyncStateStorage(abc.ABC):
+    """
+    Storage interface for the state of incremental vacancy synchronization.
+
+    Keeps a high-water mark (the latest seen publication date) per named search profile,
+    so that the next run only requests vacancies published after it.
+    """
+
+    @abc.abstractmethod
+    async def get_high_water_mark(self, profile: str) -> datetime.datetime | None:
+        """
+        Get the latest publication date processed for the profile.
+
+        :param profile: Name of the search profile.
+        :return: High-water mark or None if the profile has never been synchronized.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def set_high_water_mark(self, profile: str, value: datetime.datetime) -> None:
+        """
+        Persist the latest publication date processed for the profile.
+
+        :param profile: Name of the search profile.
+        :param value: New high-water mark.
+        """
+        pass
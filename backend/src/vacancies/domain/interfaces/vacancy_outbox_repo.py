@@ -0,0 +1,36 @@
+import abc
+
+from src.vacancies.domain.entities import VacancyOutboxBatch
+
+
+class IVacancyOutboxRepository(abc.ABC):
+    """
+    Repository interface for the outbox of vacancy changes.
+
+    The primary storage records an event for every created or updated vacancy
+    in the same transaction as the change itself; the events are later relayed
+    to the search storage.
+    """
+
+    @abc.abstractmethod
+    async def claim_batch(self, limit: int) -> VacancyOutboxBatch:
+        """
+        Claim the oldest pending events for processing within the current transaction.
+
+        Events claimed by concurrent transactions are skipped, so several relays can run in parallel.
+        Events of a vacancy being relayed by a concurrent transaction are skipped as well,
+        so an older state of a vacancy is never indexed after a newer one.
+
+        :param limit: Maximum number of events to claim.
+        :return: Claimed events with the current state of the changed vacancies.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def delete(self, event_ids: list[int]) -> None:
+        """
+        Delete processed events.
+
+        :param event_ids: Identifiers of the processed events.
+        """
+        pass
@@ -1,7 +1,13 @@
 import abc
+import datetime
+from typing import AsyncIterator, Literal
 
 from src.core.domain.entities import BulkResult
-from src.vacancies.domain.entities import Vacancy
+from src.vacancies.domain.entities import Vacancy, VacancySource
+
+# How vacancies are written to the persistent store:
+# `upsert` - batched INSERT ... ON CONFLICT, `copy` - bulk load for massive imports
+VacancyWriteMode = Literal["upsert", "copy"]
 
 
 class IVacancyRepository(abc.ABC):
@@ -20,3 +26,39 @@ class IVacancyRepository(abc.ABC):
         :return: Result summary of the bulk operation.
         """
         pass
+
+    @abc.abstractmethod
+    async def bulk_load(self, vacancies: list[Vacancy]) -> BulkResult:
+        """
+        Create or update a large number of vacancies using the fastest bulk path of the store.
+
+        The result is the same as of `bulk_add_or_update`, the method is meant for massive imports.
+
+        :param vacancies: List of normalized domain vacancies.
+        :return: Result summary of the bulk operation.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def get_by_source_ids(self, source_name: VacancySource, source_ids: list[str]) -> list[Vacancy]:
+        """
+        Load stored vacancies of a source by their identifiers in the source.
+
+        :param source_name: Source of the vacancies.
+        :param source_ids: Identifiers of the vacancies in the source.
+        :return: Stored vacancies (unknown identifiers are skipped).
+        """
+        pass
+
+    @abc.abstractmethod
+    def iter_vacancies(
+        self, batch_size: int = 1000, updated_since: datetime.datetime | None = None
+    ) -> AsyncIterator[list[Vacancy]]:
+        """
+        Iterate over stored vacancies in batches (e.g. to rebuild the search index).
+
+        :param batch_size: Number of vacancies per batch.
+        :param updated_since: Only vacancies created or updated since this moment, if given.
+        :return: Async iterator of vacancy batches.
+        """
+        pass
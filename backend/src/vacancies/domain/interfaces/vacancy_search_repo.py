@@ -1,7 +1,14 @@
 import abc
+from typing import AsyncIterable
 
 from src.core.domain.entities import BulkResult
-from src.vacancies.domain.entities import Vacancy, VacancySearchQuery
+from src.vacancies.domain.entities import (
+    Vacancy,
+    VacancyFacetQuery,
+    VacancyFacetedResult,
+    VacancySearchQuery,
+    VacancySuggestQuery
+)
 
 
 class IVacancySearchRepository(abc.ABC):
@@ -30,3 +37,36 @@ class IVacancySearchRepository(abc.ABC):
         :return: List of matching search results.
         """
         pass
+
+    @abc.abstractmethod
+    async def get_facets(self, query: VacancyFacetQuery) -> VacancyFacetedResult:
+        """
+        Perform a search and count matching vacancies per filter value in the same request.
+
+        :param query: Search query object with the facet size and the salary histogram interval.
+        :return: Page of matching vacancies with facet counts.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def suggest(self, query: VacancySuggestQuery) -> list[str]:
+        """
+        Suggest vacancy titles or employer names starting with the typed prefix.
+
+        :param query: Prefix, suggested field and number of suggestions.
+        :return: Distinct suggestions ordered by relevance.
+        """
+        pass
+
+    async def bulk_index(self, pages: AsyncIterable[list[Vacancy]], bulk_load: bool = False) -> BulkResult:
+        """
+        Index a large stream of vacancies (e.g. a full reindex).
+
+        Storages with a faster path for massive loads should override it,
+        by default the vacancies are added page by page.
+
+        :param pages: Async iterator of vacancy pages.
+        :param bulk_load: Whether the storage may be tuned for write throughput during the load.
+        :return: Aggregated result summary of the indexing operation.
+        """
+        return BulkResult.merge([await self.bulk_add(page) async for page in pages])
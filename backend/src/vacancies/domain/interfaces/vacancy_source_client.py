@@ -1,7 +1,8 @@
 import abc
-from typing import TypeVar, Generic
+import datetime
+from typing import TypeVar, Generic, AsyncIterator, Collection
 
-from src.vacancies.domain.entities import Vacancy
+from src.vacancies.domain.entities import Vacancy, VacancyPage
 
 TSearchParams = TypeVar("TSearchParams")
 TVacancy = TypeVar("TVacancy")
@@ -23,6 +24,16 @@ class IVacancySourceClient(abc.ABC, Generic[TSearchParams, TVacancy, TVacancyRes
             Fetch all available vacancies for the given parameters.
             Some APIs support only paginated or limited responses; this method
             abstracts away such details and handles complete data collection.
+
+        iter_vacancies(search_params: TSearchParams, published_since: datetime | None) -> AsyncIterator[list[Vacancy]]:
+            Stream all available vacancies page by page instead of materializing the full result set.
+            Optionally only the vacancies published since the given moment are streamed.
+
+        iter_vacancy_pages(search_params: TSearchParams, completed_pages: Collection[str]) -> AsyncIterator[VacancyPage]:
+            Stream all available vacancies as pages with stable keys, skipping the already completed pages.
+
+        enrich_vacancies(vacancies: list[Vacancy]) -> list[Vacancy]:
+            Complete vacancies from search results with their details (full description, skills).
     """
 
     @abc.abstractmethod
@@ -42,4 +53,45 @@ class IVacancySourceClient(abc.ABC, Generic[TSearchParams, TVacancy, TVacancyRes
         """
         pass
 
+    @abc.abstractmethod
+    def iter_vacancies(
+        self,
+        search_params: TSearchParams,
+        published_since: datetime.datetime | None = None
+    ) -> AsyncIterator[list[Vacancy]]:
+        """
+        Stream all available vacancies for the given parameters page by page.
+
+        Implementations are expected to be async generators that prefetch upcoming pages
+        while the consumer processes the current one, so memory usage depends on the page size
+        and not on the size of the whole result set.
 
+        If `published_since` is given, only vacancies published at or after that moment are streamed
+        and implementations should avoid requesting pages that contain only older vacancies.
+        """
+        pass
+
+    @abc.abstractmethod
+    def iter_vacancy_pages(
+        self,
+        search_params: TSearchParams,
+        completed_pages: Collection[str] = ()
+    ) -> AsyncIterator[VacancyPage]:
+        """
+        Stream all available vacancies for the given parameters as keyed pages.
+
+        Page keys must be stable across runs of the same query, so that a restarted
+        collection can checkpoint pages and skip those listed in `completed_pages`.
+        """
+        pass
+
+    async def enrich_vacancies(self, vacancies: list[Vacancy]) -> list[Vacancy]:
+        """
+        Complete vacancies received from search results with their full details.
+
+        Sources whose search results are already complete don't need to override it.
+
+        :param vacancies: Vacancies from search results.
+        :return: Vacancies in the same order, enriched where details are available.
+        """
+        return vacancies
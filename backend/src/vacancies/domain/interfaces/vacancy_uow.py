@@ -1,5 +1,6 @@
 import abc
 
+from src.vacancies.domain.interfaces.vacancy_outbox_repo import IVacancyOutboxRepository
 from src.vacancies.domain.interfaces.vacancy_repo import IVacancyRepository
 
 
@@ -12,6 +13,7 @@ class IVacancyUnitOfWork(abc.ABC):
     """
 
     vacancies: IVacancyRepository
+    outbox: IVacancyOutboxRepository
 
     async def __aenter__(self):
         """
@@ -3,7 +3,7 @@ import uuid
 
 import uuid6
 
-from sqlalchemy import UUID, String, Integer, Text, Boolean, DateTime, UniqueConstraint
+from sqlalchemy import UUID, BigInteger, String, Integer, Text, Boolean, DateTime, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -42,6 +42,8 @@ class VacancyDB(Base):
     is_archived: Mapped[bool] = mapped_column(Boolean, default=False, index=True, nullable=False)
     type: Mapped[str | None] = mapped_column(String(length=100), nullable=True)
     meta: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # SHA-256 of the mapped content, used to skip no-op updates
+    fingerprint: Mapped[str | None] = mapped_column(String(length=64), nullable=True)
     # Dates
     published_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, index=True
@@ -56,3 +58,15 @@ class VacancyDB(Base):
     __table_args__ = (
         UniqueConstraint('source_name', 'source_id', name='uq_vacancy_source'),
     )
+
+
+class VacancyOutboxDB(Base):
+    """Change of a vacancy pending synchronization with the search storage"""
+    __tablename__ = 'vacancy_outbox'
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # No foreign key: events must not block the removal of vacancies
+    vacancy_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -1,17 +1,33 @@
+import datetime
+import json
 import logging
-from typing import Any, Sequence
+import uuid
+from typing import AsyncIterator
 
-from sqlalchemy.dialects.postgresql import insert
+import uuid6
+from sqlalchemy import Boolean, bindparam, column, delete, func, literal_column, select, table, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, Insert, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.domain.entities import BulkResult
+from src.utils.datetimes import get_timezone_now
 from src.vacancies.application.mappers.vacancies import VacancyDomainToDTOMapper
-from src.vacancies.domain.entities import Vacancy
+from src.vacancies.config import vacancy_storage_config
+from src.vacancies.domain.dtos import VacancyCreateDTO
+from src.vacancies.domain.entities import Vacancy, VacancyOutboxBatch, VacancySource
+from src.vacancies.domain.interfaces.vacancy_outbox_repo import IVacancyOutboxRepository
 from src.vacancies.domain.interfaces.vacancy_repo import IVacancyRepository
-from src.vacancies.infrastructure.db.orm import VacancyDB
+from src.vacancies.infrastructure.db.orm import VacancyDB, VacancyOutboxDB
 
 logger = logging.getLogger(__name__)
 
+# asyncpg (PostgreSQL wire protocol) allows at most 32767 bind parameters per statement
+PG_MAX_BIND_PARAMS = 32767
+# Session-local table receiving COPY data before it is merged into `vacancies`
+VACANCY_STAGING_TABLE = "vacancies_staging"
+# Namespace (the first key) of the transaction-level advisory locks taken on vacancies by outbox relays
+VACANCY_RELAY_LOCK_NAMESPACE = 7301
+
 
 class PGVacancyRepository(IVacancyRepository):
     """
@@ -22,16 +38,21 @@ class PGVacancyRepository(IVacancyRepository):
 
     Attributes:
         session (AsyncSession): Active SQLAlchemy asynchronous session.
+        chunk_size (int): Maximum number of rows per upsert statement.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, chunk_size: int | None = None) -> None:
         """
         Initialize the repository with an active database session.
 
         :param session: Async SQLAlchemy session used for executing queries.
+        :param chunk_size: Maximum number of rows per upsert statement (from the config by default).
+            It is capped so that a statement never exceeds the bind parameter limit.
         """
         super().__init__()
         self.session = session
+        max_chunk_size = PG_MAX_BIND_PARAMS // len(VacancyDB.__table__.columns)
+        self.chunk_size = max(1, min(chunk_size or vacancy_storage_config.VACANCY_UPSERT_CHUNK_SIZE, max_chunk_size))
         self._mapper = VacancyDomainToDTOMapper()
 
     async def bulk_add_or_update(self, vacancies: list[Vacancy]) -> BulkResult:
@@ -40,13 +61,195 @@ class PGVacancyRepository(IVacancyRepository):
 
         Uses PostgreSQL `ON CONFLICT DO UPDATE` to either create new records
         or update existing ones based on (source_name, source_id).
+        Existing rows whose content fingerprint didn't change are not touched at all
+        (no new row version, no `updated_at` bump) and are reported as unchanged.
+        Every created or updated row gets an outbox event in the same transaction.
+
+        The rows are written in chunks of `chunk_size` within the session's transaction,
+        which keeps every statement under the bind parameter limit and its compilation cheap.
+        Duplicates of the same (source_name, source_id) are collapsed to the last occurrence
+        (a single statement can't affect a row twice) and reported as skipped.
 
         :param vacancies: List of normalized Vacancy domain models.
-        :return: BulkResult summarizing the number of created and updated rows.
+        :return: BulkResult summarizing the number of created, updated and unchanged rows.
+        """
+        unique_vacancies = list({
+            (vacancy.source_name, vacancy.source_id): vacancy for vacancy in self._mapper.map(vacancies)
+        }.values())
+        results = []
+        for start in range(0, len(unique_vacancies), self.chunk_size):
+            results.append(await self._upsert_chunk(unique_vacancies[start:start + self.chunk_size]))
+        result = BulkResult.merge(results)
+        result.skipped = len(vacancies) - len(unique_vacancies)
+        return result
+
+    async def _upsert_chunk(self, vacancies: list[VacancyCreateDTO]) -> BulkResult:
+        """
+        Insert or update a chunk of vacancies with a single statement.
+
+        :param vacancies: Vacancies with unique (source_name, source_id), no more than `chunk_size`.
+        :return: BulkResult of the chunk.
         """
-        vacancies = self._mapper.map(vacancies)
         stmt = insert(VacancyDB).values([vacancy.model_dump() for vacancy in vacancies])
-        stmt = stmt.on_conflict_do_update(
+        return await self._execute_upsert(stmt, total=len(vacancies))
+
+    async def get_by_source_ids(self, source_name: VacancySource, source_ids: list[str]) -> list[Vacancy]:
+        """
+        Load stored vacancies of a source by their identifiers in the source.
+
+        The lookup uses the (source_name, source_id) unique index and is split into chunks
+        kept under the bind parameter limit.
+
+        :param source_name: Source of the vacancies.
+        :param source_ids: Identifiers of the vacancies in the source.
+        :return: Vacancies restored from `meta` (unknown identifiers are skipped).
+        """
+        ids = list({int(source_id) for source_id in source_ids})
+        chunk_size = PG_MAX_BIND_PARAMS - 1
+        vacancies = []
+        for start in range(0, len(ids), chunk_size):
+            stmt = select(VacancyDB.meta).where(
+                VacancyDB.source_name == source_name,
+                VacancyDB.source_id.in_(ids[start:start + chunk_size])
+            )
+            result = await self.session.execute(stmt)
+            vacancies.extend(self._restore_vacancy(meta) for meta in result.scalars())
+        return vacancies
+
+    async def iter_vacancies(
+        self, batch_size: int = 1000, updated_since: datetime.datetime | None = None
+    ) -> AsyncIterator[list[Vacancy]]:
+        """
+        Iterate over stored vacancies in batches using keyset pagination by id.
+
+        Every batch is a separate short query, so the iteration neither keeps a server-side
+        cursor open nor slows down with depth like OFFSET does.
+
+        :param batch_size: Number of vacancies per batch.
+        :param updated_since: Only vacancies created or updated since this moment, if given.
+        :return: Async iterator of vacancy batches restored from `meta`.
+        """
+        last_id = None
+        while True:
+            stmt = select(VacancyDB.id, VacancyDB.meta).order_by(VacancyDB.id).limit(batch_size)
+            if updated_since is not None:
+                stmt = stmt.where(VacancyDB.updated_at >= updated_since)
+            if last_id is not None:
+                stmt = stmt.where(VacancyDB.id > last_id)
+            rows = (await self.session.execute(stmt)).all()
+            if not rows:
+                return
+            last_id = rows[-1].id
+            yield [self._restore_vacancy(row.meta) for row in rows]
+            if len(rows) < batch_size:
+                return
+
+    @staticmethod
+    def _restore_vacancy(meta: dict) -> Vacancy:
+        """
+        Restore a domain vacancy from the `meta` column holding its dump.
+
+        :param meta: Dumped domain vacancy.
+        :return: Domain vacancy.
+        """
+        return Vacancy.model_validate(meta, by_alias=True, by_name=True)
+
+    async def bulk_load(self, vacancies: list[Vacancy]) -> BulkResult:
+        """
+        Bulk load vacancy records using binary COPY through a staging table.
+
+        The vacancies are streamed with COPY into a temporary table (dropped on commit)
+        and merged into `vacancies` with a single `INSERT ... SELECT ... ON CONFLICT DO UPDATE`,
+        keeping the same semantics as `bulk_add_or_update`: rows with an unchanged fingerprint
+        are not touched and duplicates are collapsed to the last occurrence.
+        COPY neither has a bind parameter limit nor builds huge statements, which makes it
+        much faster for large imports (e.g. full-market backfills).
+
+        :param vacancies: List of normalized Vacancy domain models.
+        :return: BulkResult summarizing the number of created, updated and unchanged rows.
+        """
+        unique_vacancies = list({
+            (vacancy.source_name, vacancy.source_id): vacancy for vacancy in self._mapper.map(vacancies)
+        }.values())
+        if not unique_vacancies:
+            return BulkResult(success=0, failed=0, total=0, skipped=len(vacancies))
+
+        columns = [table_column.name for table_column in VacancyDB.__table__.columns]
+        await self.session.execute(text(
+            f"CREATE TEMPORARY TABLE {VACANCY_STAGING_TABLE} (LIKE {VacancyDB.__tablename__}) ON COMMIT DROP"
+        ))
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            VACANCY_STAGING_TABLE,
+            records=self._build_copy_records(unique_vacancies, columns),
+            columns=columns
+        )
+
+        staging = table(VACANCY_STAGING_TABLE, *[column(name) for name in columns])
+        stmt = insert(VacancyDB).from_select(columns, select(staging))
+        result = await self._execute_upsert(stmt, total=len(unique_vacancies))
+        await self.session.execute(text(f"DROP TABLE {VACANCY_STAGING_TABLE}"))
+
+        result.skipped = len(vacancies) - len(unique_vacancies)
+        return result
+
+    @staticmethod
+    def _build_copy_records(vacancies: list[VacancyCreateDTO], columns: list[str]) -> list[tuple]:
+        """
+        Convert vacancies into COPY records.
+
+        Values computed by the ORM defaults (id, timestamps) are filled in explicitly,
+        and JSONB values are passed serialized as the driver expects.
+
+        :param vacancies: Vacancies to load.
+        :param columns: Column order of the records.
+        :return: List of records.
+        """
+        now = get_timezone_now()
+        records = []
+        for vacancy in vacancies:
+            values = vacancy.model_dump()
+            values.setdefault("id", uuid6.uuid6())
+            values["created_at"] = values.get("created_at") or now
+            values.setdefault("updated_at", now)
+            values["meta"] = json.dumps(values["meta"], default=str) if values["meta"] is not None else None
+            records.append(tuple(values.get(name) for name in columns))
+        return records
+
+    async def _execute_upsert(self, stmt: Insert, total: int) -> BulkResult:
+        """
+        Execute an insert as an upsert and count created and updated rows on the server.
+
+        The upsert is wrapped into a CTE returning whether each affected row was inserted
+        (`xmax = 0`: the row version wasn't produced by an update), and only the aggregated
+        counts are sent back instead of every affected row. The affected rows are also
+        recorded in the outbox by the same statement.
+
+        :param stmt: INSERT statement into `vacancies`.
+        :param total: Number of inserted records.
+        :return: BulkResult with count of created, updated and unchanged records.
+        """
+        upserted = self._on_conflict_update(stmt).returning(
+            VacancyDB.id, literal_column("xmax = 0", Boolean).label("inserted")
+        ).cte("upserted")
+        outbox = insert(VacancyOutboxDB).from_select(["vacancy_id"], select(upserted.c.id)).cte("outbox")
+        counts_stmt = select(
+            func.count().filter(upserted.c.inserted).label("created"),
+            func.count().filter(~upserted.c.inserted).label("updated"),
+        ).add_cte(outbox)
+        counts = (await self.session.execute(counts_stmt)).one()
+        return self._build_bulk_result(counts.created, counts.updated, total=total)
+
+    @staticmethod
+    def _on_conflict_update(stmt: Insert) -> Insert:
+        """
+        Turn an insert into an upsert updating rows whose content fingerprint changed.
+
+        :param stmt: INSERT statement into `vacancies`.
+        :return: Upsert statement.
+        """
+        return stmt.on_conflict_do_update(
             index_elements=["source_name", "source_id"],
             set_={
                 "url": stmt.excluded.url,
@@ -66,31 +269,112 @@ class PGVacancyRepository(IVacancyRepository):
                 "is_archived": stmt.excluded.is_archived,
                 "type": stmt.excluded.type,
                 "meta": stmt.excluded.meta,
+                "fingerprint": stmt.excluded.fingerprint,
+                # ON CONFLICT DO UPDATE doesn't apply the ORM `onupdate` default
+                "updated_at": func.now(),
             },
-        ).returning(VacancyDB.id, VacancyDB.updated_at, VacancyDB.created_at)
-        result = await self.session.execute(stmt)
-        rows = result.fetchall()
-        return self._build_bulk_result(rows, total=len(vacancies))
+            where=VacancyDB.fingerprint.is_distinct_from(stmt.excluded.fingerprint),
+        )
 
     @staticmethod
-    def _build_bulk_result(rows: Sequence[Any], total: int) -> BulkResult:
+    def _build_bulk_result(created: int, updated: int, total: int) -> BulkResult:
         """
-        Determine how many records were created vs updated.
+        Build the result of an upsert.
 
-        Compares `created_at` and `updated_at` timestamps to distinguish between insert and update operations.
+        Rows skipped by the fingerprint condition are neither created nor updated and are counted as unchanged.
 
-        :param rows: List of returned rows with created_at and updated_at fields.
+        :param created: Number of inserted rows.
+        :param updated: Number of updated rows.
         :param total: Total number of records processed.
-        :return: BulkResult with count of successful and failed operations.
-        """
-        created, updated = 0, 0
-        for row in rows:
-            if row.updated_at != row.created_at:
-                updated += 1
-            else:
-                created += 1
+        :return: BulkResult with count of created, updated and unchanged records.
+        """
+        unchanged = total - (created + updated)
         return BulkResult(
-            success=created + updated,
-            failed=total - (created + updated),
-            total=total
+            success=total,
+            failed=0,
+            total=total,
+            created=created,
+            updated=updated,
+            unchanged=unchanged
+        )
+
+
+class PGVacancyOutboxRepository(IVacancyOutboxRepository):
+    """
+    PostgreSQL implementation of the vacancy outbox.
+
+    Events are written by `PGVacancyRepository` and claimed with `FOR UPDATE SKIP LOCKED`,
+    so they stay locked until the relaying transaction is committed or rolled back.
+
+    Row locks only cover events, while several events of the same vacancy may be claimed
+    by concurrent relays: a relay holding an older state of a vacancy could index it after
+    another relay has indexed the newer one. The vacancies of a batch are therefore also locked
+    with transaction-level advisory locks, and events of vacancies being relayed by another
+    transaction are left for a later batch. Advisory locks don't block the writers of `vacancies`.
+
+    Attributes:
+        session (AsyncSession): Active SQLAlchemy asynchronous session.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the repository with an active database session.
+
+        :param session: Async SQLAlchemy session used for executing queries.
+        """
+        super().__init__()
+        self.session = session
+
+    async def claim_batch(self, limit: int) -> VacancyOutboxBatch:
+        """
+        Lock the oldest pending events and load the current state of the changed vacancies.
+
+        The state of a vacancy is loaded only after its advisory lock is acquired, so it's never older
+        than the state indexed by a relay which has already committed.
+
+        :param limit: Maximum number of events to claim (kept under the bind parameter limit).
+        :return: Claimed events with the changed vacancies, each vacancy only once.
+        """
+        events_stmt = (
+            select(VacancyOutboxDB.id, VacancyOutboxDB.vacancy_id)
+            .order_by(VacancyOutboxDB.id)
+            .limit(min(limit, PG_MAX_BIND_PARAMS))
+            .with_for_update(skip_locked=True)
         )
+        events = (await self.session.execute(events_stmt)).all()
+        if not events:
+            return VacancyOutboxBatch()
+
+        vacancy_ids = await self._lock_vacancies(list({event.vacancy_id for event in events}))
+        if not vacancy_ids:
+            return VacancyOutboxBatch()
+        result = await self.session.execute(select(VacancyDB.meta).where(VacancyDB.id.in_(vacancy_ids)))
+        return VacancyOutboxBatch(
+            event_ids=[event.id for event in events if event.vacancy_id in vacancy_ids],
+            vacancies=[PGVacancyRepository._restore_vacancy(meta) for meta in result.scalars()]
+        )
+
+    async def _lock_vacancies(self, vacancy_ids: list[uuid.UUID]) -> set[uuid.UUID]:
+        """
+        Try to take the relay advisory locks of the vacancies until the end of the transaction.
+
+        :param vacancy_ids: Identifiers of the vacancies.
+        :return: Identifiers of the vacancies whose locks have been acquired.
+        """
+        stmt = text(
+            "SELECT vacancy_id FROM unnest(:vacancy_ids) AS vacancy_id "
+            "WHERE pg_try_advisory_xact_lock(:namespace, hashtext(vacancy_id::text))"
+        ).bindparams(
+            bindparam("vacancy_ids", value=vacancy_ids, type_=ARRAY(UUID(as_uuid=True))),
+            namespace=VACANCY_RELAY_LOCK_NAMESPACE
+        )
+        return set((await self.session.execute(stmt)).scalars())
+
+    async def delete(self, event_ids: list[int]) -> None:
+        """
+        Delete processed events.
+
+        :param event_ids: Identifiers of the processed events.
+        """
+        if event_ids:
+            await self.session.execute(delete(VacancyOutboxDB).where(VacancyOutboxDB.id.in_(event_ids)))
@@ -2,7 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.engine import async_session_maker
 from src.vacancies.domain.interfaces.vacancy_uow import IVacancyUnitOfWork
-from src.vacancies.infrastructure.db.repositories import PGVacancyRepository
+from src.vacancies.infrastructure.db.repositories import PGVacancyOutboxRepository, PGVacancyRepository
 
 
 class PGVacancyUnitOfWork(IVacancyUnitOfWork):
@@ -16,6 +16,7 @@ class PGVacancyUnitOfWork(IVacancyUnitOfWork):
         session_factory: A callable that returns an AsyncSession.
         session: Active asynchronous session for database interactions.
         vacancies: Repository for vacancy-related database operations.
+        outbox: Repository of vacancy changes pending synchronization with the search storage.
     """
 
     def __init__(self, session_factory=async_session_maker):
@@ -32,6 +33,7 @@ class PGVacancyUnitOfWork(IVacancyUnitOfWork):
         """
         self.session: AsyncSession = self.session_factory()
         self.vacancies = PGVacancyRepository(self.session)
+        self.outbox = PGVacancyOutboxRepository(self.session)
         return await super().__aenter__()
 
     async def __aexit__(self, *args):
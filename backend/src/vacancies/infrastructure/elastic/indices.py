@@ -1,31 +1,119 @@
 from elasticsearch import AsyncElasticsearch
 
 from src.core.config import settings
+from src.utils.datetimes import get_timezone_now
 from src.vacancies.infrastructure.elastic.mappings import VACANCY_INDEX_MAPPING
 
+# Vacancies are stored in versioned indices (`vacancies_<timestamp>`) and always accessed
+# through the alias, so a rebuilt index can replace the current one without downtime.
+VACANCY_INDEX_ALIAS = "vacancies"
 
-async def create_vacancy_index():
+
+def get_versioned_index_name() -> str:
+    """
+    Generate a name for a new version of the vacancy index.
+
+    :return: Index name such as `vacancies_20250420153000`.
     """
-    Create the Elasticsearch index for storing vacancies.
+    return f"{VACANCY_INDEX_ALIAS}_{get_timezone_now().strftime('%Y%m%d%H%M%S')}"
 
-    Uses the predefined VACANCY_MAPPING and creates the index 'vacancies'.
-    If the index already exists, the operation will be ignored.
 
-    :return: Result of the Elasticsearch index creation.
+async def create_vacancy_index(with_alias: bool = True) -> str | None:
+    """
+    Create a new version of the Elasticsearch index for storing vacancies.
+
+    Uses the predefined VACANCY_INDEX_MAPPING. With `with_alias` the index is created behind
+    the 'vacancies' alias, unless the alias (or a legacy index with that name) already exists.
+    Without it a standalone index is created to be filled and switched to by a reindex.
+
+    :param with_alias: Whether the index is created behind the alias.
+    :return: Name of the created index or None if the vacancy index already exists.
     """
     async with AsyncElasticsearch(settings.ELASTICSEARCH_HOSTS) as es:
-        result = await es.indices.create(index="vacancies", body=VACANCY_INDEX_MAPPING, ignore=400)
-        return result
+        if with_alias and await es.indices.exists(index=VACANCY_INDEX_ALIAS):
+            return None
+        index = get_versioned_index_name()
+        body = dict(VACANCY_INDEX_MAPPING)
+        if with_alias:
+            body["aliases"] = {VACANCY_INDEX_ALIAS: {}}
+        await es.indices.create(index=index, body=body)
+        return index
+
+
+async def get_vacancy_indices(es: AsyncElasticsearch) -> list[str]:
+    """
+    Get the concrete indices currently serving vacancies.
+
+    :param es: Elasticsearch client.
+    :return: Indices behind the alias, or the legacy concrete 'vacancies' index.
+    """
+    if await es.indices.exists_alias(name=VACANCY_INDEX_ALIAS):
+        response = await es.indices.get_alias(name=VACANCY_INDEX_ALIAS)
+        return list(response.keys())
+    if await es.indices.exists(index=VACANCY_INDEX_ALIAS):
+        return [VACANCY_INDEX_ALIAS]
+    return []
+
+
+async def reindex_vacancy_index(dest_index: str) -> dict:
+    """
+    Copy all documents of the current vacancy index into another index with the reindex API.
+
+    The copy runs inside the cluster in parallel slices, which is faster than streaming
+    from the database but only applies mapping changes, not changes of document contents.
+
+    :param dest_index: Name of the new index.
+    :return: Result of the Elasticsearch reindex operation.
+    """
+    async with AsyncElasticsearch(settings.ELASTICSEARCH_HOSTS) as es:
+        return await es.reindex(
+            source={"index": VACANCY_INDEX_ALIAS},
+            dest={"index": dest_index},
+            slices="auto",
+            wait_for_completion=True,
+            refresh=True,
+            request_timeout=None
+        )
+
+
+async def switch_vacancy_index(new_index: str, delete_old: bool = True) -> list[str]:
+    """
+    Atomically point the 'vacancies' alias to a new index.
+
+    A legacy concrete index named 'vacancies' is removed in the same atomic operation,
+    since the alias can't coexist with an index of the same name.
+
+    :param new_index: Name of the index to switch to.
+    :param delete_old: Whether previous indices are deleted after the switch.
+    :return: Names of the previous indices.
+    """
+    async with AsyncElasticsearch(settings.ELASTICSEARCH_HOSTS) as es:
+        old_indices = [index for index in await get_vacancy_indices(es) if index != new_index]
+        actions: list[dict] = [{"add": {"index": new_index, "alias": VACANCY_INDEX_ALIAS}}]
+        for index in old_indices:
+            if index == VACANCY_INDEX_ALIAS:
+                actions.append({"remove_index": {"index": index}})
+            else:
+                actions.append({"remove": {"index": index, "alias": VACANCY_INDEX_ALIAS}})
+        await es.indices.update_aliases(actions=actions)
+        if delete_old:
+            for index in old_indices:
+                if index != VACANCY_INDEX_ALIAS:
+                    await es.indices.delete(index=index, ignore_unavailable=True)
+        return old_indices
 
 
 async def delete_vacancy_index():
     """
-    Delete the Elasticsearch index 'vacancies'.
+    Delete all Elasticsearch indices serving vacancies.
 
     Useful for resetting the search database or during cleanup in test environments.
 
-    :return: Result of the Elasticsearch index deletion.
+    :return: Result of the Elasticsearch index deletion or None if there is nothing to delete.
     """
     async with AsyncElasticsearch(settings.ELASTICSEARCH_HOSTS) as es:
-        result = await es.indices.delete(index="vacancies")
+        indices = await get_vacancy_indices(es)
+        if not indices:
+            return None
+        result = await es.indices.delete(index=",".join(indices))
         return result
@@ -1,11 +1,19 @@
+from src.utils.hashing import get_content_fingerprint
 from src.vacancies.domain.entities import Vacancy
+from src.vacancies.infrastructure.elastic.indices import VACANCY_INDEX_ALIAS
 
 
 class VacancyDomainToElasticMapper:
     """
     Maps internal domain vacancy models to Elasticsearch-compatible document structures.
+
+    Args:
+        index (str): Index (or alias) the documents are written to.
     """
 
+    def __init__(self, index: str = VACANCY_INDEX_ALIAS):
+        self.index = index
+
     def map(self, vacancies: list[Vacancy]) -> list[dict]:
         """
         Convert domain vacancies to Elasticsearch documents.
@@ -23,9 +31,10 @@ class VacancyDomainToElasticMapper:
         :return: Elasticsearch-compatible document.
         """
         doc = self._map_vacancy_to_document(vacancy)
+        doc["fingerprint"] = get_content_fingerprint(doc)
         return {
             "_op_type": "index",
-            "_index": "vacancies",
+            "_index": self.index,
             "_id": doc["id"],
             "_source": doc,
         }
@@ -82,6 +91,7 @@ class VacancyDomainToElasticMapper:
                 "requirement": vacancy.requirement,
                 "responsibility": vacancy.responsibility
             },
+            "key_skills": vacancy.key_skills,
             "has_test": vacancy.has_test,
             "is_archived": vacancy.archived,
             "published_at": vacancy.published_at,
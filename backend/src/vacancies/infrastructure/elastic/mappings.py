@@ -1,3 +1,8 @@
+# Exact-match (filter, aggregation) variant of a text field
+KEYWORD_SUBFIELD = {"keyword": {"type": "keyword", "ignore_above": 256}}
+# Prefix (autocomplete) variant of a text field with 2- and 3-gram shingles
+SUGGEST_SUBFIELD = {"suggest": {"type": "search_as_you_type"}}
+
 VACANCY_INDEX_MAPPING = {
     "mappings": {
         "properties": {
@@ -9,7 +14,7 @@ VACANCY_INDEX_MAPPING = {
                     "name": {"type": "keyword"},
                 }
             },
-            "name": {"type": "text"},
+            "name": {"type": "text", "fields": SUGGEST_SUBFIELD},
             "url": {"type": "keyword"},
             "description": {"type": "text"},
             "area": {
@@ -35,7 +40,7 @@ VACANCY_INDEX_MAPPING = {
                 "type": "object",
                 "properties": {
                     "id": {"type": "keyword"},
-                    "name": {"type": "text"},
+                    "name": {"type": "text", "fields": KEYWORD_SUBFIELD | SUGGEST_SUBFIELD},
                     "trusted": {"type": "boolean"},
                     "url": {"type": "keyword"}
                 }
@@ -53,21 +58,21 @@ VACANCY_INDEX_MAPPING = {
                 "type": "object",
                 "properties": {
                     "id": {"type": "keyword"},
-                    "name": {"type": "text"}
+                    "name": {"type": "text", "fields": KEYWORD_SUBFIELD}
                 }
             },
             "employment": {
                 "type": "object",
                 "properties": {
                     "id": {"type": "keyword"},
-                    "name": {"type": "text"}
+                    "name": {"type": "text", "fields": KEYWORD_SUBFIELD}
                 }
             },
             "schedule": {
                 "type": "object",
                 "properties": {
                     "id": {"type": "keyword"},
-                    "name": {"type": "text"}
+                    "name": {"type": "text", "fields": KEYWORD_SUBFIELD}
                 }
             },
             "snippet": {
@@ -77,10 +82,12 @@ VACANCY_INDEX_MAPPING = {
                     "responsibility": {"type": "text"}
                 }
             },
+            "key_skills": {"type": "keyword"},
             "has_test": {"type": "boolean"},
             "is_archived": {"type": "boolean"},
             "published_at": {"type": "date"},
-            "created_at": {"type": "date"}
+            "created_at": {"type": "date"},
+            "fingerprint": {"type": "keyword", "index": False}
         }
     }
 }
@@ -1,10 +1,64 @@
-from elasticsearch import helpers
+import asyncio
+import base64
+import binascii
+import contextlib
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+
+from elasticsearch import NotFoundError, helpers
 
 from src.core.domain.entities import BulkResult
 from src.core.infrastructure.clients.elastic import get_elastic_client
+from src.utils.cache import TTLCache
+from src.utils.hashing import get_content_fingerprint
+from src.vacancies.config import vacancy_storage_config
+from src.vacancies.domain.exceptions import InvalidSearchCursor
 from src.vacancies.domain.interfaces.vacancy_search_repo import IVacancySearchRepository
+from src.vacancies.infrastructure.elastic.indices import VACANCY_INDEX_ALIAS
 from src.vacancies.infrastructure.elastic.mappers import VacancyDomainToElasticMapper
-from src.vacancies.domain.entities import Vacancy, VacancySearchQuery
+from src.vacancies.domain.entities import (
+    FacetBucket,
+    Vacancy,
+    VacancyFacetQuery,
+    VacancyFacetedResult,
+    VacancySearchQuery,
+    VacancySuggestQuery
+)
+
+# How long a search cursor stays valid between page requests
+SEARCH_CURSOR_KEEP_ALIVE = "5m"
+# Document fields behind the sort options of the search query
+SORT_FIELDS = {
+    "published_at": "published_at",
+    "salary_from": "salary.from",
+    "salary_to": "salary.to",
+}
+# Text fields suggested by the autocomplete
+SUGGEST_FIELDS = {
+    "name": "name",
+    "employer": "employer.name",
+}
+
+# Suggestions for hot prefixes shared by all repositories of the process:
+# (field, normalized prefix, size) -> suggestions
+_suggestions_cache: TTLCache[tuple[str, str, int], list[str]] = TTLCache(
+    max_size=vacancy_storage_config.VACANCY_SUGGEST_CACHE_SIZE,
+    ttl=vacancy_storage_config.VACANCY_SUGGEST_CACHE_TTL_SECONDS
+)
+
+# Keyword fields counted by the term facets
+TERM_FACET_FIELDS = {
+    "area": "area.name",
+    "employer": "employer.name.keyword",
+    "experience": "experience.name.keyword",
+    "employment": "employment.name.keyword",
+    "schedule": "schedule.name.keyword",
+}
+# Numeric fields counted by the histogram facets
+HISTOGRAM_FACET_FIELDS = {
+    "salary_from": "salary.from",
+    "salary_to": "salary.to",
+}
 
 
 class ESVacancySearchRepository(IVacancySearchRepository):
@@ -13,75 +67,443 @@ class ESVacancySearchRepository(IVacancySearchRepository):
 
     Provides full-text search and bulk insert capabilities for vacancies using Elasticsearch.
 
+    Documents are sent by several concurrent streaming bulk workers, so large loads are
+    bounded by the cluster rather than by a single serial request stream.
+
     Attributes:
         es_client: Async Elasticsearch client instance.
+        index: Index (or alias) the repository works with.
+        chunk_size: Maximum number of documents per bulk request.
+        max_chunk_bytes: Maximum size of a bulk request body in bytes.
+        concurrency: Number of bulk requests sent in parallel.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        index: str = VACANCY_INDEX_ALIAS,
+        chunk_size: int = vacancy_storage_config.VACANCY_INDEX_CHUNK_SIZE,
+        max_chunk_bytes: int = vacancy_storage_config.VACANCY_INDEX_MAX_CHUNK_BYTES,
+        concurrency: int = vacancy_storage_config.VACANCY_INDEX_CONCURRENCY
+    ):
         """
         Initialize the search repository with an Elasticsearch client.
+
+        :param index: Index (or alias) to work with, e.g. a new index being filled by a reindex.
+        :param chunk_size: Maximum number of documents per bulk request.
+        :param max_chunk_bytes: Maximum size of a bulk request body in bytes.
+        :param concurrency: Number of bulk requests sent in parallel.
         """
         self.es_client = get_elastic_client()
-        self._mapper = VacancyDomainToElasticMapper()
+        self.index = index
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.concurrency = max(1, concurrency)
+        self._mapper = VacancyDomainToElasticMapper(index=index)
 
     async def bulk_add(self, vacancies: list[Vacancy]) -> BulkResult:
         """
         Insert or update multiple vacancies in Elasticsearch.
 
+        Documents whose content fingerprint matches the indexed one are not sent again,
+        which avoids re-indexing and segment merges for unchanged vacancies.
+
         :param vacancies: List of domain-level Vacancy models.
-        :return: BulkResult with counts of successful and failed operations.
+        :return: BulkResult with counts of successful and unchanged operations and details of failed ones.
+        """
+        documents = self._mapper.map(vacancies)
+        indexed_fingerprints = await self._get_indexed_fingerprints([doc["_id"] for doc in documents])
+        changed_documents = [
+            doc for doc in documents
+            if indexed_fingerprints.get(doc["_id"]) != doc["_source"]["fingerprint"]
+        ]
+        unchanged = len(documents) - len(changed_documents)
+        result = await self._index_documents(self._iter_list(changed_documents))
+        result.success += unchanged
+        result.total = len(documents)
+        result.unchanged = unchanged
+        return result
+
+    async def bulk_index(self, pages: AsyncIterable[list[Vacancy]], bulk_load: bool = False) -> BulkResult:
+        """
+        Index a large stream of vacancies (e.g. a full reindex).
+
+        Documents are mapped lazily and sent without checking the indexed fingerprints.
+        In the bulk load mode refreshes and replicas of the index are disabled during the load
+        and restored afterwards, which considerably speeds up indexing of large volumes.
+
+        :param pages: Async iterator of vacancy pages.
+        :param bulk_load: Whether index settings are tuned for write throughput during the load.
+        :return: BulkResult with counts of successful operations and details of failed ones.
+        """
+        documents = (document async for page in pages for document in self._mapper.map(page))
+        index_settings = self._bulk_load_settings() if bulk_load else contextlib.nullcontext()
+        async with index_settings:
+            return await self._index_documents(documents)
+
+    async def _index_documents(self, documents: AsyncIterable[dict]) -> BulkResult:
+        """
+        Send documents to Elasticsearch with several concurrent streaming bulk workers.
+
+        Every worker consumes a shared queue and groups documents into requests limited
+        by `chunk_size` and `max_chunk_bytes`. Documents rejected with 429 are retried
+        with backoff, other per-document errors are collected into `failed`.
+
+        :param documents: Bulk actions to send.
+        :return: Aggregated BulkResult of all workers.
+        """
+        # Keeps every worker supplied with a full chunk without materializing the whole stream
+        queue: asyncio.Queue[dict | None] = asyncio.Queue(maxsize=self.chunk_size * self.concurrency)
+        results: list[BulkResult] = []
+
+        async def produce() -> None:
+            async for document in documents:
+                await queue.put(document)
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        async def drain() -> AsyncIterator[dict]:
+            while (document := await queue.get()) is not None:
+                yield document
+
+        async def consume() -> None:
+            created, updated, failed = 0, 0, []
+            async for ok, item in helpers.async_streaming_bulk(
+                self.es_client,
+                drain(),
+                chunk_size=self.chunk_size,
+                max_chunk_bytes=self.max_chunk_bytes,
+                max_retries=vacancy_storage_config.VACANCY_INDEX_MAX_RETRIES,
+                raise_on_error=False
+            ):
+                operation = next(iter(item.values()))
+                if not ok:
+                    failed.append({
+                        "id": operation.get("_id"),
+                        "status": operation.get("status"),
+                        "error": operation.get("error")
+                    })
+                elif operation.get("result") == "created":
+                    created += 1
+                else:
+                    updated += 1
+            results.append(BulkResult(
+                success=created + updated,
+                failed=failed,
+                total=created + updated + len(failed),
+                created=created,
+                updated=updated
+            ))
+
+        async with asyncio.TaskGroup() as task_group:
+            task_group.create_task(produce())
+            for _ in range(self.concurrency):
+                task_group.create_task(consume())
+        return BulkResult.merge(results)
+
+    @contextlib.asynccontextmanager
+    async def _bulk_load_settings(self) -> AsyncIterator[None]:
+        """
+        Disable refreshes and replicas of the index for the duration of a bulk load.
+
+        The original settings are restored (and the index is refreshed) even if the load fails.
+        """
+        names = ["index.refresh_interval", "index.number_of_replicas"]
+        response = await self.es_client.indices.get_settings(index=self.index, name=names, flat_settings=True)
+        original = next(iter(response.values()), {}).get("settings", {})
+        await self.es_client.indices.put_settings(
+            index=self.index, settings={"index.refresh_interval": "-1", "index.number_of_replicas": 0}
+        )
+        try:
+            yield
+        finally:
+            # Settings which weren't set explicitly are reset to their defaults
+            await self.es_client.indices.put_settings(
+                index=self.index, settings={name: original.get(name) for name in names}
+            )
+            await self.es_client.indices.refresh(index=self.index)
+
+    @staticmethod
+    async def _iter_list(documents: Iterable[dict]) -> AsyncIterator[dict]:
+        """
+        Wrap documents already in memory into an async iterator.
+
+        :param documents: Bulk actions.
+        :return: Async iterator over the actions.
         """
-        vacancies = self._mapper.map(vacancies)
-        success, failed = await helpers.async_bulk(self.es_client, vacancies)
-        return BulkResult(success=success, failed=failed, total=len(vacancies))
+        for document in documents:
+            yield document
+
+    async def _get_indexed_fingerprints(self, ids: list[str]) -> dict[str, str]:
+        """
+        Fetch content fingerprints of already indexed documents.
+
+        :param ids: Document identifiers.
+        :return: Mapping of document id to its fingerprint (missing documents are omitted).
+        """
+        if not ids:
+            return {}
+        response = await self.es_client.mget(index=self.index, ids=ids, source_includes=["fingerprint"])
+        return {
+            doc["_id"]: doc["_source"].get("fingerprint")
+            for doc in response["docs"]
+            if doc.get("found")
+        }
 
     async def search(self, query: VacancySearchQuery):
         """
-        Execute a search query in the 'vacancies' index.
+        Execute a search query in the vacancy index.
 
         Builds a bool query using provided filters such as area, employer, experience, employment type, schedule,
         test requirement, archive status, and published date range.
 
+        Shallow pages are requested with `from`/`size`. In the cursor mode the results are paged
+        with a point in time and `search_after`, which costs the same at any depth and isn't limited
+        by `index.max_result_window`; the token of the next page is returned as `next_cursor`.
+
         :param query: Structured search query.
         :return: Raw Elasticsearch response containing matched documents.
+        :raises InvalidSearchCursor: If the cursor is malformed, expired or belongs to another query.
+        """
+        body = {
+            "query": self._build_query(query),
+            "size": query.size
+        }
+        sort = [{SORT_FIELDS[query.sort_by]: {"order": query.sort_order}}] if query.sort_by else []
+        if query.paginate_by == "cursor" or query.cursor:
+            return await self._search_after(query, body, sort)
+
+        body["from"] = query.page * query.size
+        if sort:
+            body["sort"] = sort
+        response = await self.es_client.search(index=self.index, body=body)
+        return response
+
+    async def get_facets(self, query: VacancyFacetQuery) -> VacancyFacetedResult:
+        """
+        Execute a search query and count matching vacancies per filter value in the same request.
+
+        Term facets are counted over the keyword fields, salaries are grouped into a histogram.
+        Aggregations run over all matching documents, not only the returned page.
+
+        :param query: Structured search query with the facet size and the salary histogram interval.
+        :return: Page of matching vacancies with facet counts.
+        """
+        body = {
+            "query": self._build_query(query),
+            "from": query.page * query.size,
+            "size": query.size,
+            "track_total_hits": True,
+            "aggs": self._build_facet_aggregations(query.facet_size, query.salary_interval)
+        }
+        if query.sort_by:
+            body["sort"] = [{SORT_FIELDS[query.sort_by]: {"order": query.sort_order}}]
+        response = await self.es_client.search(index=self.index, body=body)
+        aggregations = response.get("aggregations", {})
+        return VacancyFacetedResult(
+            total=response["hits"]["total"]["value"],
+            hits=response["hits"]["hits"],
+            facets={
+                name: [
+                    FacetBucket(value=bucket["key"], count=bucket["doc_count"])
+                    for bucket in aggregations.get(name, {}).get("buckets", [])
+                ]
+                for name in TERM_FACET_FIELDS | HISTOGRAM_FACET_FIELDS
+            }
+        )
+
+    @staticmethod
+    def _build_facet_aggregations(facet_size: int, salary_interval: int) -> dict:
+        """
+        Build the aggregations of the facet request.
+
+        :param facet_size: Maximum number of values per term facet.
+        :param salary_interval: Width of the salary histogram intervals.
+        :return: Aggregations keyed by the facet name.
+        """
+        aggregations = {
+            name: {"terms": {"field": field, "size": facet_size}}
+            for name, field in TERM_FACET_FIELDS.items()
+        }
+        aggregations |= {
+            name: {"histogram": {"field": field, "interval": salary_interval, "min_doc_count": 1}}
+            for name, field in HISTOGRAM_FACET_FIELDS.items()
+        }
+        return aggregations
+
+    async def suggest(self, query: VacancySuggestQuery) -> list[str]:
+        """
+        Suggest vacancy titles or employer names starting with the typed prefix.
+
+        The prefix is matched against the `search_as_you_type` subfield (and its shingles),
+        so no full-text scoring of the whole index happens on every keystroke. Only the
+        suggested field is fetched and total hits aren't counted. Suggestions for hot prefixes
+        are served from an in-process cache.
+
+        :param query: Prefix, suggested field and number of suggestions.
+        :return: Distinct suggestions ordered by relevance.
+        """
+        prefix = " ".join(query.prefix.lower().split())
+        cache_key = (query.field, prefix, query.size)
+        if (suggestions := _suggestions_cache.get(cache_key)) is not None:
+            return suggestions
+
+        field = SUGGEST_FIELDS[query.field]
+        suggest_field = f"{field}.suggest"
+        body = {
+            "query": {
+                "multi_match": {
+                    "query": prefix,
+                    "type": "bool_prefix",
+                    "fields": [suggest_field, f"{suggest_field}._2gram", f"{suggest_field}._3gram"]
+                }
+            },
+            # Several vacancies often share a title, so more hits are requested to fill the suggestions
+            "size": query.size * 3,
+            "_source": [field],
+            "track_total_hits": False
+        }
+        if query.field == "employer":
+            body["collapse"] = {"field": f"{field}.keyword"}
+        response = await self.es_client.search(index=self.index, body=body)
+
+        suggestions, seen = [], set()
+        for hit in response["hits"]["hits"]:
+            value = hit["_source"]
+            for key in field.split("."):
+                value = (value or {}).get(key)
+            if value and value.lower() not in seen:
+                seen.add(value.lower())
+                suggestions.append(value)
+        suggestions = suggestions[:query.size]
+        _suggestions_cache.set(cache_key, suggestions)
+        return suggestions
+
+    async def _search_after(self, query: VacancySearchQuery, body: dict, sort: list[dict]) -> dict:
+        """
+        Fetch the next page of results using a point in time and `search_after`.
+
+        The point in time keeps the view of the index stable between pages; `_shard_doc`
+        makes the sort order total, so no document is skipped or repeated.
+        The point in time is closed once the last page has been returned.
+
+        :param query: Structured search query.
+        :param body: Search request body with the query and the page size.
+        :param sort: Requested sort order.
+        :return: Elasticsearch response with `next_cursor` (None on the last page).
+        """
+        query_fingerprint = self._get_query_fingerprint(query)
+        if query.cursor:
+            cursor = self._decode_cursor(query.cursor)
+            if cursor.get("query") != query_fingerprint:
+                raise InvalidSearchCursor()
+            pit_id, body["search_after"] = cursor["pit"], cursor["search_after"]
+        else:
+            pit = await self.es_client.open_point_in_time(index=self.index, keep_alive=SEARCH_CURSOR_KEEP_ALIVE)
+            pit_id = pit["id"]
+
+        body["pit"] = {"id": pit_id, "keep_alive": SEARCH_CURSOR_KEEP_ALIVE}
+        body["sort"] = (sort or [{"_score": {"order": "desc"}}]) + [{"_shard_doc": {"order": "asc"}}]
+        try:
+            response = await self.es_client.search(body=body)
+        except NotFoundError:
+            raise InvalidSearchCursor()
+
+        # The point in time id may change between requests
+        pit_id = response.get("pit_id", pit_id)
+        hits = response["hits"]["hits"]
+        next_cursor = None
+        if len(hits) == query.size:
+            next_cursor = self._encode_cursor({
+                "pit": pit_id, "search_after": hits[-1]["sort"], "query": query_fingerprint
+            })
+        else:
+            await self.es_client.close_point_in_time(id=pit_id)
+        return {**response, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _get_query_fingerprint(query: VacancySearchQuery) -> str:
+        """
+        Fingerprint of the query a cursor was issued for (pagination parameters excluded).
+
+        :param query: Structured search query.
+        :return: Short fingerprint.
+        """
+        return get_content_fingerprint(
+            query.model_dump(mode="json", exclude={"cursor", "page", "paginate_by"})
+        )[:16]
+
+    @staticmethod
+    def _encode_cursor(cursor: dict[str, Any]) -> str:
+        """
+        Encode the pagination state into an opaque URL-safe token.
+
+        :param cursor: Pagination state.
+        :return: Cursor token.
+        """
+        return base64.urlsafe_b64encode(json.dumps(cursor, separators=(",", ":")).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(token: str) -> dict[str, Any]:
+        """
+        Decode a cursor token.
+
+        :param token: Cursor token.
+        :return: Pagination state.
+        :raises InvalidSearchCursor: If the token is malformed.
+        """
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(token.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidSearchCursor()
+        if not isinstance(cursor, dict) or not {"pit", "search_after"} <= cursor.keys():
+            raise InvalidSearchCursor()
+        return cursor
+
+    @staticmethod
+    def _build_query(query: VacancySearchQuery) -> dict:
+        """
+        Build the Elasticsearch query for the search filters.
+
+        Only the full-text query contributes to the score. Every other condition is an exact
+        predicate in the filter context: it isn't scored and is cached by the node query cache.
+        Date ranges are rounded to whole days, so equal filters produce equal (cacheable) clauses.
+
+        :param query: Structured search query.
+        :return: Bool query.
         """
         must_clauses = []
+        filter_clauses = []
 
         if query.query:
             must_clauses.append({"match": {"name": query.query}})
-        if query.area:
-            must_clauses.append({"match": {"area.name": query.area}})
-        if query.employer:
-            must_clauses.append({"match": {"employer.name": query.employer}})
-        if query.experience:
-            must_clauses.append({"match": {"experience.name": query.experience}})
-        if query.employment:
-            must_clauses.append({"match": {"employment.name": query.employment}})
-        if query.schedule:
-            must_clauses.append({"match": {"schedule.name": query.schedule}})
-        if query.has_test is not None:
-            must_clauses.append({"term": {"has_test": query.has_test}})
-        if query.is_archived is not None:
-            must_clauses.append({"term": {"is_archived": query.is_archived}})
+        for field, value in (
+            ("area.name", query.area),
+            ("employer.name.keyword", query.employer),
+            ("experience.name.keyword", query.experience),
+            ("employment.name.keyword", query.employment),
+            ("schedule.name.keyword", query.schedule),
+        ):
+            # Empty parameters (e.g. `?area=`) don't filter
+            if value:
+                filter_clauses.append({"term": {field: value}})
+        for field, flag in (
+            ("has_test", query.has_test),
+            ("is_archived", query.is_archived),
+        ):
+            if flag is not None:
+                filter_clauses.append({"term": {field: flag}})
         if query.published_from or query.published_to:
             range_filter = {}
             if query.published_from:
-                range_filter["gte"] = query.published_from.isoformat()
+                range_filter["gte"] = f"{query.published_from.isoformat()}||/d"
             if query.published_to:
-                range_filter["lte"] = query.published_to.isoformat()
-            must_clauses.append({"range": {"published_at": range_filter}})
+                # Rounded up to the end of the day, so the whole last day is included
+                range_filter["lte"] = f"{query.published_to.isoformat()}||/d"
+            filter_clauses.append({"range": {"published_at": range_filter}})
 
-        body = {
-            "query": {
-                "bool": {
-                    "must": must_clauses
-                }
-            },
-            "from": query.page * query.size,
-            "size": query.size
+        return {
+            "bool": {
+                "must": must_clauses,
+                "filter": filter_clauses
+            }
         }
-
-        if query.sort_by:
-            body["sort"] = [{query.sort_by: {"order": query.sort_order}}]
-        response = await self.es_client.search(index="vacancies", body=body)
-        return response
@@ -0,0 +1,77 @@
+import datetime
+import uuid
+
+from src.core.infrastructure.clients.redis import get_redis_client
+from src.vacancies.domain.entities import CollectionJob
+from src.vacancies.domain.exceptions import CollectionJobNotFound
+from src.vacancies.domain.interfaces.collection_job_storage import ICollectionJobStorage
+
+
+class RedisCollectionJobStorage(ICollectionJobStorage):
+    """
+    Redis-based implementation of ICollectionJobStorage.
+
+    Jobs are stored as JSON under `collection_job:<id>` and the keys of their completed pages
+    in a set under `collection_job:<id>:pages`, so a checkpoint writes a single page key and
+    the fixed-size job document instead of re-serializing all the completed pages.
+    Both keys expire after `ttl` since the last checkpoint, so abandoned jobs don't accumulate.
+
+    Args:
+        ttl (datetime.timedelta): Lifetime of a job state (default: 7 days).
+    """
+
+    def __init__(self, ttl: datetime.timedelta = datetime.timedelta(days=7)):
+        self.redis = get_redis_client()
+        self.ttl = ttl
+
+    async def get(self, job_id: uuid.UUID) -> CollectionJob:
+        """
+        Get a collection job by its identifier.
+
+        :param job_id: Job identifier.
+        :return: Collection job.
+        :raises CollectionJobNotFound: If the job doesn't exist (or has expired).
+        """
+        value = await self.redis.get(self._get_key(job_id))
+        if not value:
+            raise CollectionJobNotFound(detail=f"Collection job {job_id} not found")
+        return CollectionJob.model_validate_json(value)
+
+    async def save(self, job: CollectionJob) -> None:
+        """
+        Create or overwrite the state of a collection job.
+
+        :param job: Collection job.
+        """
+        await self.redis.set(self._get_key(job.id), job.model_dump_json(), ex=self.ttl)
+
+    async def get_completed_pages(self, job_id: uuid.UUID) -> set[str]:
+        """
+        Get the keys of the pages completed by a collection job.
+
+        :param job_id: Job identifier.
+        :return: Keys of the completed pages.
+        """
+        return set(await self.redis.smembers(self._get_pages_key(job_id)))
+
+    async def complete_page(self, job: CollectionJob, page_key: str) -> None:
+        """
+        Checkpoint a completed page and overwrite the state of its collection job (a single round trip).
+
+        :param job: Collection job (with the counters already updated).
+        :param page_key: Key of the completed page.
+        """
+        pages_key = self._get_pages_key(job.id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(pages_key, page_key)
+            pipe.expire(pages_key, self.ttl)
+            pipe.set(self._get_key(job.id), job.model_dump_json(), ex=self.ttl)
+            await pipe.execute()
+
+    @staticmethod
+    def _get_key(job_id: uuid.UUID) -> str:
+        return f"collection_job:{job_id}"
+
+    @staticmethod
+    def _get_pages_key(job_id: uuid.UUID) -> str:
+        return f"collection_job:{job_id}:pages"
@@ -0,0 +1,38 @@
+import datetime
+
+from src.core.infrastructure.clients.redis import get_redis_client
+from src.vacancies.domain.interfaces.sync_state_storage import ISyncStateStorage
+
+
+class RedisSyncStateStorage(ISyncStateStorage):
+    """
+    Redis-based implementation of ISyncStateStorage.
+
+    High-water marks are stored as ISO 8601 strings under `vacancy_sync:<profile>:high_water_mark`.
+    """
+
+    def __init__(self):
+        self.redis = get_redis_client()
+
+    async def get_high_water_mark(self, profile: str) -> datetime.datetime | None:
+        """
+        Get the latest publication date processed for the profile.
+
+        :param profile: Name of the search profile.
+        :return: High-water mark or None if the profile has never been synchronized.
+        """
+        value = await self.redis.get(self._get_key(profile))
+        return datetime.datetime.fromisoformat(value) if value else None
+
+    async def set_high_water_mark(self, profile: str, value: datetime.datetime) -> None:
+        """
+        Persist the latest publication date processed for the profile.
+
+        :param profile: Name of the search profile.
+        :param value: New high-water mark.
+        """
+        await self.redis.set(self._get_key(profile), value.isoformat())
+
+    @staticmethod
+    def _get_key(profile: str) -> str:
+        return f"vacancy_sync:{profile}:high_water_mark"
@@ -1,14 +1,27 @@
+import datetime
 import logging
+import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 
 from src.auth.presentation.dependencies import TokenAuthDep
+from src.auth.presentation.permissions import access_control
 from src.crud.router import CRUDRouter
+from src.integrations.infrastructure.external_api.headhunter.schemas.request import HHVacancySearchParams
+from src.utils.datetimes import get_timezone_now
+from src.vacancies.application.use_cases.collection_jobs import create_collection_job
 from src.vacancies.domain.dtos import VacancyCreateDTO, VacancyUpdateDTO, VacancyReadDTO
-from src.vacancies.domain.entities import VacancySearchQuery
+from src.vacancies.domain.entities import (
+    CollectionJob,
+    VacancyFacetQuery,
+    VacancyFacetedResult,
+    VacancySearchQuery,
+    VacancySuggestQuery
+)
 from src.vacancies.infrastructure.db.crud import VacancyService
-from src.vacancies.presentation.dependencies import VacancySearchRepoDep
+from src.vacancies.presentation.dependencies import CollectionJobStorageDep, VacancySearchRepoDep
+from src.vacancies.presentation.tasks import run_collection_job_task
 
 logger = logging.getLogger(__name__)
 
@@ -19,13 +32,83 @@ vacancy_api_router = APIRouter()
 async def search(
     query: Annotated[VacancySearchQuery, Query()],
     search_repo: VacancySearchRepoDep,
-    auth: TokenAuthDep
+    auth: TokenAuthDep,
+    response: Response
 ):
     """
     Search for vacancies using full-text filters and parameters.
+
+    With `paginate_by=cursor` the token of the next page is returned in the `X-Next-Cursor` header
+    (absent on the last page); pass it back as `cursor` with the same filters.
+    """
+    search_response = await search_repo.search(query)
+    if next_cursor := search_response.get("next_cursor"):
+        response.headers["X-Next-Cursor"] = next_cursor
+    return search_response["hits"]["hits"]
+
+
+@vacancy_api_router.get("/facets")
+async def get_facets(
+    query: Annotated[VacancyFacetQuery, Query()],
+    search_repo: VacancySearchRepoDep,
+    auth: TokenAuthDep
+) -> VacancyFacetedResult:
+    """
+    Search for vacancies and count them per area, employer, experience, employment, schedule and salary range.
+
+    Facets are computed in the same request as the page of hits, so a filter sidebar needs a single call.
+    """
+    return await search_repo.get_facets(query)
+
+
+@vacancy_api_router.get("/autocomplete")
+async def autocomplete(
+    query: Annotated[VacancySuggestQuery, Query()],
+    search_repo: VacancySearchRepoDep,
+    auth: TokenAuthDep
+) -> list[str]:
+    """
+    Suggest vacancy titles or employer names for the typed prefix (search-as-you-type).
+    """
+    return await search_repo.suggest(query)
+
+
+@vacancy_api_router.post("/jobs")
+@access_control(superuser=True)
+async def start_collection_job(
+    search_params: HHVacancySearchParams,
+    job_storage: CollectionJobStorageDep,
+    auth: TokenAuthDep
+) -> CollectionJob:
+    """
+    Start a checkpointed collection of all HeadHunter vacancies matching the parameters (admin action).
+    """
+    if not search_params.date_to:
+        # A fixed date window keeps page checkpoints valid between retries
+        now = get_timezone_now().replace(microsecond=0)
+        update = {"date_to": now.isoformat()}
+        if search_params.period:
+            # The API doesn't allow combining `period` with explicit dates
+            update |= {"date_from": (now - datetime.timedelta(days=search_params.period)).isoformat(), "period": None}
+        search_params = search_params.model_copy(update=update)
+    job = await create_collection_job(
+        search_params.model_dump(mode="json", exclude_none=True, exclude_unset=True), job_storage
+    )
+    run_collection_job_task.delay(str(job.id))
+    return job
+
+
+@vacancy_api_router.get("/jobs/{job_id}")
+@access_control(superuser=True)
+async def get_collection_job(
+    job_id: uuid.UUID,
+    job_storage: CollectionJobStorageDep,
+    auth: TokenAuthDep
+) -> CollectionJob:
+    """
+    Get the progress of a collection job (admin action).
     """
-    response = await search_repo.search(query)
-    return response["hits"]["hits"]
+    return await job_storage.get(job_id)
 
 
 class VacancyCRUDRouter(CRUDRouter):
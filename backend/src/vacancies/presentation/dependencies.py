@@ -2,10 +2,14 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from src.vacancies.domain.interfaces.collection_job_storage import ICollectionJobStorage
+from src.vacancies.domain.interfaces.sync_state_storage import ISyncStateStorage
 from src.vacancies.domain.interfaces.vacancy_search_repo import IVacancySearchRepository
 from src.vacancies.domain.interfaces.vacancy_uow import IVacancyUnitOfWork
 from src.vacancies.infrastructure.db.unit_of_work import PGVacancyUnitOfWork
 from src.vacancies.infrastructure.elastic.repositories import ESVacancySearchRepository
+from src.vacancies.infrastructure.redis.collection_job_storage import RedisCollectionJobStorage
+from src.vacancies.infrastructure.redis.sync_state_storage import RedisSyncStateStorage
 
 
 def get_vacancy_uow() -> IVacancyUnitOfWork:
@@ -31,4 +35,23 @@ def get_vacancy_search_repo() -> IVacancySearchRepository:
     return ESVacancySearchRepository()
 
 
+def get_sync_state_storage() -> ISyncStateStorage:
+    """
+    Dependency provider for the incremental synchronization state storage.
+
+    :return: An instance of ISyncStateStorage (RedisSyncStateStorage).
+    """
+    return RedisSyncStateStorage()
+
+
+def get_collection_job_storage() -> ICollectionJobStorage:
+    """
+    Dependency provider for the collection job storage.
+
+    :return: An instance of ICollectionJobStorage (RedisCollectionJobStorage).
+    """
+    return RedisCollectionJobStorage()
+
+
 VacancySearchRepoDep = Annotated[IVacancySearchRepository, Depends(get_vacancy_search_repo)]
+CollectionJobStorageDep = Annotated[ICollectionJobStorage, Depends(get_collection_job_storage)]
@@ -1,15 +1,44 @@
 import logging
+import uuid
+from typing import Literal
 
 from asgiref.sync import async_to_sync
 from celery import shared_task
 
+from src.core.domain.entities import BulkResult
 from src.integrations.infrastructure.external_api.headhunter.schemas.request import HHVacancySearchParams
 from src.integrations.presentation.dependencies import get_headhunter_adapter
-from src.vacancies.application.use_cases.vacancy_collector import collect_vacancies
-from src.vacancies.presentation.dependencies import get_vacancy_search_repo, get_vacancy_uow
+from src.utils.datetimes import get_timezone_now
+from src.vacancies.application.use_cases.collection_jobs import run_collection_job
+from src.vacancies.application.use_cases.vacancy_collector import collect_vacancies, collect_vacancies_streaming
+from src.vacancies.application.use_cases.vacancy_outbox import relay_vacancy_outbox
+from src.vacancies.application.use_cases.vacancy_reindex import reindex_vacancies
+from src.vacancies.application.use_cases.vacancy_sync import collect_new_vacancies
+from src.vacancies.domain.exceptions import CollectionJobNotFound, SearchIndexingFailed
+from src.vacancies.domain.interfaces.vacancy_repo import VacancyWriteMode
+from src.vacancies.infrastructure.elastic.indices import (
+    create_vacancy_index,
+    reindex_vacancy_index,
+    switch_vacancy_index
+)
+from src.vacancies.infrastructure.elastic.repositories import ESVacancySearchRepository
+from src.vacancies.presentation.dependencies import (
+    get_collection_job_storage,
+    get_sync_state_storage,
+    get_vacancy_search_repo,
+    get_vacancy_uow
+)
 
 logger = logging.getLogger(__name__)
 
+# Search profiles synchronized incrementally, the key identifies the profile's high-water mark
+SEARCH_PROFILES: dict[str, HHVacancySearchParams] = {
+    "python_backend_moscow": HHVacancySearchParams(
+        text='Backend python developer',
+        area=['1'],  # Moscow
+    ),
+}
+
 
 @shared_task
 def collect_vacancies_task() -> dict:
@@ -18,7 +47,7 @@ def collect_vacancies_task() -> dict:
 
     This background task performs the following:
     - Queries HeadHunter API with specific search parameters.
-    - Saves data in both relational DB and ElasticSearch.
+    - Saves data in the relational DB and schedules its indexing in ElasticSearch.
     - Returns a summary of processed results.
 
     :return: Dictionary containing the number of processed items for each storage layer.
@@ -35,6 +64,175 @@ def collect_vacancies_task() -> dict:
         python_backend_params,
         get_headhunter_adapter(),
         get_vacancy_uow(),
-        get_vacancy_search_repo()
+        None
+    )
+    relay_vacancy_outbox_task.delay()
+    return {key: value.model_dump(mode="json") for key, value in result.items()}
+
+
+@shared_task
+def collect_all_vacancies_task(enrich: bool = False, write_mode: VacancyWriteMode = "upsert") -> dict:
+    """
+    Celery task to collect all vacancies matching the query from HeadHunter.
+
+    Unlike `collect_vacancies_task`, every result page is requested. Vacancies are streamed
+    into the relational DB in fixed-size batches while the next pages are fetched,
+    indexing in ElasticSearch is left to the outbox relay.
+
+    :param enrich: Whether vacancies are completed with their details (one extra request per vacancy).
+    :param write_mode: How vacancies are written to the relational DB (`copy` for full-market backfills).
+    :return: Dictionary containing the number of processed items for each storage layer.
+    """
+    python_backend_params = HHVacancySearchParams(
+        text='Backend python developer',
+        area=['1'],  # Moscow,
+        order_by='publication_time'
+    )
+    result = async_to_sync(collect_vacancies_streaming)(
+        python_backend_params,
+        get_headhunter_adapter(),
+        get_vacancy_uow(),
+        None,
+        enrich=enrich,
+        write_mode=write_mode
+    )
+    relay_vacancy_outbox_task.delay()
+    return {key: value.model_dump(mode="json") for key, value in result.items()}
+
+
+@shared_task
+def collect_new_vacancies_task(profile: str = "python_backend_moscow") -> dict:
+    """
+    Celery task to incrementally collect vacancies of a search profile from HeadHunter.
+
+    Only vacancies published since the previous run of the profile are requested,
+    so the task is cheap enough to be scheduled frequently. New vacancies are enriched
+    with their full description and key skills.
+
+    :param profile: Name of the search profile from `SEARCH_PROFILES`.
+    :return: Dictionary containing the number of processed items for each storage layer.
+    """
+    result = async_to_sync(collect_new_vacancies)(
+        profile,
+        SEARCH_PROFILES[profile],
+        get_headhunter_adapter(),
+        get_vacancy_uow(),
+        None,
+        get_sync_state_storage(),
+        enrich=True
     )
+    relay_vacancy_outbox_task.delay()
     return {key: value.model_dump(mode="json") for key, value in result.items()}
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    dont_autoretry_for=(CollectionJobNotFound,),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    max_retries=5
+)
+def run_collection_job_task(self, job_id: str) -> dict:
+    """
+    Celery task to run a checkpointed collection job of HeadHunter vacancies.
+
+    A failed attempt (timeout, 429, storage error) is retried with exponential backoff,
+    and every retry resumes the job from its last checkpoint instead of starting over.
+
+    :param job_id: Identifier of the collection job.
+    :return: Dictionary with the final state of the job.
+    """
+    job = async_to_sync(run_collection_job)(
+        uuid.UUID(job_id),
+        get_headhunter_adapter(),
+        get_vacancy_uow(),
+        None,
+        get_collection_job_storage(),
+        HHVacancySearchParams.model_validate
+    )
+    relay_vacancy_outbox_task.delay()
+    return job.model_dump(mode="json")
+
+
+@shared_task(
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    max_retries=10
+)
+def relay_vacancy_outbox_task(batch_size: int = 1000) -> dict:
+    """
+    Celery task to index vacancy changes recorded in the outbox in ElasticSearch.
+
+    Collection tasks only write the relational DB (the outbox is filled in the same transaction)
+    and schedule this task, so a slow or unavailable ElasticSearch doesn't fail the collection.
+    Failed attempts are retried with exponential backoff; unprocessed events are kept in the outbox.
+
+    :param batch_size: Maximum number of outbox events indexed at once.
+    :return: Dictionary with the aggregated indexing result.
+    """
+    result = async_to_sync(relay_vacancy_outbox)(
+        get_vacancy_uow(),
+        get_vacancy_search_repo(),
+        batch_size=batch_size
+    )
+    return result.model_dump(mode="json")
+
+
+@shared_task
+def reindex_vacancies_task(source: Literal["database", "index"] = "database", delete_old: bool = True) -> dict:
+    """
+    Celery task to rebuild the ElasticSearch vacancy index without downtime (blue/green).
+
+    A new version of the index is created with the current mapping and filled either from
+    the relational DB (picks up mapping and document changes) or from the current index with
+    the reindex API (mapping changes only). The 'vacancies' alias is then switched to the new
+    index atomically, and vacancies changed during the rebuild are indexed once more.
+    Searches are served by the previous index until the switch.
+
+    :param source: Where documents are taken from.
+    :param delete_old: Whether previous indices are deleted after the switch.
+    :return: Dictionary with the new and previous indices and indexing results.
+    """
+    return async_to_sync(_rebuild_vacancy_index)(source, delete_old)
+
+
+async def _rebuild_vacancy_index(source: Literal["database", "index"], delete_old: bool) -> dict:
+    """
+    Fill a new version of the vacancy index and switch the alias to it.
+
+    :param source: Where documents are taken from.
+    :param delete_old: Whether previous indices are deleted after the switch.
+    :return: Dictionary with the new and previous indices and indexing results.
+    """
+    new_index = await create_vacancy_index(with_alias=False)
+    started_at = get_timezone_now()
+    if source == "index":
+        response = await reindex_vacancy_index(new_index)
+        failures = response.get("failures", [])
+        result = BulkResult(
+            success=response["created"] + response["updated"],
+            failed=failures,
+            total=response["total"],
+            created=response["created"],
+            updated=response["updated"]
+        )
+        if failures:
+            # The alias keeps pointing to the previous index
+            raise SearchIndexingFailed(index=new_index, failed=len(failures))
+    else:
+        result = await reindex_vacancies(get_vacancy_uow(), ESVacancySearchRepository(index=new_index))
+
+    previous_indices = await switch_vacancy_index(new_index, delete_old=delete_old)
+    logger.info(f"Vacancy index switched to {new_index}, previous indices: {previous_indices}")
+    # Changes written to the previous index during the rebuild
+    catch_up_result = await reindex_vacancies(
+        get_vacancy_uow(), get_vacancy_search_repo(), updated_since=started_at
+    )
+    return {
+        "index": new_index,
+        "previous_indices": previous_indices,
+        "search_db": result.model_dump(mode="json"),
+        "catch_up": catch_up_result.model_dump(mode="json")
+    }
@@ -0,0 +1,57 @@
+import json
+
+from src.integrations.infrastructure.http.interfaces import IAsyncHttpClient
+
+
+class FakeResponse:
+
+    def __init__(self, status: int = 200, headers: dict | None = None, body: dict | None = None):
+        self.status = status
+        self.headers = headers or {}
+        self.body = body or {}
+        self.released = False
+
+    async def json(self) -> dict:
+        return self.body
+
+    async def read(self) -> bytes:
+        return json.dumps(self.body).encode()
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    def release(self) -> None:
+        self.released = True
+
+
+class FakeHttpClient(IAsyncHttpClient):
+    """
+    HTTP client replaying the given responses (or raising the given exceptions) in order.
+    """
+
+    def __init__(self, responses: list[FakeResponse | Exception]):
+        self.responses = list(responses)
+        self.requests: list[dict] = []
+
+    async def _respond(self, method: str, **kwargs):
+        self.requests.append({"method": method, **kwargs})
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def get(self, url: str, **kwargs):
+        return await self._respond("GET", url=url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self._respond("POST", url=url, **kwargs)
+
+    async def put(self, url: str, **kwargs):
+        return await self._respond("PUT", url=url, **kwargs)
+
+    async def delete(self, url: str, **kwargs):
+        return await self._respond("DELETE", url=url, **kwargs)
+
+    async def patch(self, url: str, **kwargs):
+        return await self._respond("PATCH", url=url, **kwargs)
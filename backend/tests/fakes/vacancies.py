@@ -1,7 +1,26 @@
+import datetime
+from typing import AsyncIterator, Collection
+
 from src.core.domain.entities import BulkResult
-from src.vacancies.domain.entities import Vacancy, VacancySearchQuery
+from src.vacancies.domain.entities import (
+    CollectionJob,
+    FacetBucket,
+    Vacancy,
+    VacancyFacetQuery,
+    VacancyFacetedResult,
+    VacancyOutboxBatch,
+    VacancyPage,
+    VacancySearchQuery,
+    VacancySource,
+    VacancySuggestQuery
+)
+from src.vacancies.domain.exceptions import CollectionJobNotFound
+from src.vacancies.domain.interfaces.collection_job_storage import ICollectionJobStorage
+from src.vacancies.domain.interfaces.sync_state_storage import ISyncStateStorage
+from src.vacancies.domain.interfaces.vacancy_outbox_repo import IVacancyOutboxRepository
 from src.vacancies.domain.interfaces.vacancy_repo import IVacancyRepository
 from src.vacancies.domain.interfaces.vacancy_search_repo import IVacancySearchRepository
+from src.vacancies.domain.interfaces.vacancy_source_client import IVacancySourceClient
 from src.vacancies.domain.interfaces.vacancy_uow import IVacancyUnitOfWork
 
 
@@ -9,6 +28,9 @@ class FakeVacancyRepository(IVacancyRepository):
 
     def __init__(self):
         self._vacancies = []
+        # (event id, vacancy key) pairs of the outbox
+        self.outbox_events: list[tuple[int, tuple]] = []
+        self._last_event_id = 0
 
     async def bulk_add_or_update(self, vacancies: list[Vacancy]) -> BulkResult:
         created, updated = 0, 0
@@ -21,6 +43,8 @@ class FakeVacancyRepository(IVacancyRepository):
             else:
                 self._vacancies.append(vacancy)
                 created += 1
+            self._last_event_id += 1
+            self.outbox_events.append((self._last_event_id, (vacancy.source_name, vacancy.source_id)))
         total = len(vacancies)
         return BulkResult(
             success=created + updated,
@@ -28,12 +52,44 @@ class FakeVacancyRepository(IVacancyRepository):
             total=total
         )
 
+    async def bulk_load(self, vacancies: list[Vacancy]) -> BulkResult:
+        return await self.bulk_add_or_update(vacancies)
+
+    async def get_by_source_ids(self, source_name: VacancySource, source_ids: list[str]) -> list[Vacancy]:
+        return [v for v in self._vacancies if v.source_name == source_name and v.source_id in source_ids]
+
+    async def iter_vacancies(
+        self, batch_size: int = 1000, updated_since: datetime.datetime | None = None
+    ) -> AsyncIterator[list[Vacancy]]:
+        for start in range(0, len(self._vacancies), batch_size):
+            yield self._vacancies[start:start + batch_size]
+
+
+class FakeVacancyOutboxRepository(IVacancyOutboxRepository):
+
+    def __init__(self, vacancies: FakeVacancyRepository):
+        self._vacancies = vacancies
+
+    async def claim_batch(self, limit: int) -> VacancyOutboxBatch:
+        events = self._vacancies.outbox_events[:limit]
+        keys = {key for _, key in events}
+        return VacancyOutboxBatch(
+            event_ids=[event_id for event_id, _ in events],
+            vacancies=[v for v in self._vacancies._vacancies if (v.source_name, v.source_id) in keys]
+        )
+
+    async def delete(self, event_ids: list[int]) -> None:
+        self._vacancies.outbox_events = [
+            event for event in self._vacancies.outbox_events if event[0] not in event_ids
+        ]
+
 
 class FakeVacancyUnitOfWork(IVacancyUnitOfWork):
     users: IVacancyRepository
 
     def __init__(self):
         self.vacancies = FakeVacancyRepository()
+        self.outbox = FakeVacancyOutboxRepository(self.vacancies)
         self.committed = False
 
     async def _commit(self):
@@ -53,7 +109,7 @@ class FakeSearchVacancyRepository(IVacancySearchRepository):
         for vacancy in vacancies:
             for i, v in enumerate(self._vacancies):
                 if v.source_id == vacancy.source_id and v.source_name == vacancy.source_name:
-                    v[i] = vacancy
+                    self._vacancies[i] = vacancy
                     updated += 1
                     break
             else:
@@ -71,3 +127,99 @@ class FakeSearchVacancyRepository(IVacancySearchRepository):
             if query.query.lower() in vacancy.name.lower():
                 return {"hits": {"hits": [vacancy]}}
         return {"hits": {"hits": []}}
+
+    async def suggest(self, query: VacancySuggestQuery) -> list[str]:
+        suggestions = []
+        for vacancy in self._vacancies:
+            value = vacancy.name if query.field == "name" else vacancy.employer and vacancy.employer.name
+            if value and value.lower().startswith(query.prefix.lower()) and value not in suggestions:
+                suggestions.append(value)
+        return suggestions[:query.size]
+
+    async def get_facets(self, query: VacancyFacetQuery) -> VacancyFacetedResult:
+        matched = [
+            vacancy for vacancy in self._vacancies
+            if not query.query or query.query.lower() in vacancy.name.lower()
+        ]
+        areas: dict[str, int] = {}
+        for vacancy in matched:
+            if vacancy.area and vacancy.area.name:
+                areas[vacancy.area.name] = areas.get(vacancy.area.name, 0) + 1
+        return VacancyFacetedResult(
+            total=len(matched),
+            hits=[vacancy.model_dump() for vacancy in matched[:query.size]],
+            facets={"area": [FacetBucket(value=value, count=count) for value, count in areas.items()][:query.facet_size]}
+        )
+
+
+class FakeVacancySourceClient(IVacancySourceClient):
+
+    def __init__(self, pages: list[list[Vacancy]]):
+        self._pages = pages
+        self.fetched_pages = 0
+        self.enriched_ids: list[str] = []
+
+    async def get_vacancies(self, search_params) -> list[Vacancy]:
+        return self._pages[0] if self._pages else []
+
+    async def get_all_vacancies(self, search_params) -> list[Vacancy]:
+        return [vacancy for page in self._pages for vacancy in page]
+
+    async def iter_vacancies(
+        self, search_params, published_since: datetime.datetime | None = None
+    ) -> AsyncIterator[list[Vacancy]]:
+        for page in self._pages:
+            self.fetched_pages += 1
+            if published_since is not None:
+                page = [vacancy for vacancy in page if vacancy.published_datetime >= published_since]
+            yield page
+
+    async def iter_vacancy_pages(
+        self, search_params, completed_pages: Collection[str] = ()
+    ) -> AsyncIterator[VacancyPage]:
+        for page_num, page in enumerate(self._pages):
+            if str(page_num) in completed_pages:
+                continue
+            self.fetched_pages += 1
+            yield VacancyPage(key=str(page_num), vacancies=page)
+
+    async def enrich_vacancies(self, vacancies: list[Vacancy]) -> list[Vacancy]:
+        self.enriched_ids.extend(vacancy.source_id for vacancy in vacancies)
+        return [
+            vacancy.model_copy(update={"full_description": f"Details of {vacancy.name}", "key_skills": []})
+            for vacancy in vacancies
+        ]
+
+
+class FakeSyncStateStorage(ISyncStateStorage):
+
+    def __init__(self):
+        self._high_water_marks: dict[str, datetime.datetime] = {}
+
+    async def get_high_water_mark(self, profile: str) -> datetime.datetime | None:
+        return self._high_water_marks.get(profile)
+
+    async def set_high_water_mark(self, profile: str, value: datetime.datetime) -> None:
+        self._high_water_marks[profile] = value
+
+
+class FakeCollectionJobStorage(ICollectionJobStorage):
+
+    def __init__(self):
+        self._jobs: dict = {}
+        self._completed_pages: dict = {}
+
+    async def get(self, job_id) -> CollectionJob:
+        if job_id not in self._jobs:
+            raise CollectionJobNotFound()
+        return self._jobs[job_id].model_copy(deep=True)
+
+    async def save(self, job: CollectionJob) -> None:
+        self._jobs[job.id] = job.model_copy(deep=True)
+
+    async def get_completed_pages(self, job_id) -> set[str]:
+        return set(self._completed_pages.get(job_id, []))
+
+    async def complete_page(self, job: CollectionJob, page_key: str) -> None:
+        self._completed_pages.setdefault(job.id, []).append(page_key)
+        await self.save(job)
@@ -4,6 +4,7 @@ from starlette.middleware import Middleware
 
 from src.auth.presentation.middlewares import SecurityMiddleware
 from src.main import app
+from src.vacancies.domain.entities import Vacancy, VacancySource
 from src.vacancies.presentation.dependencies import get_vacancy_search_repo
 from tests.fakes.vacancies import FakeSearchVacancyRepository
 
@@ -34,3 +35,34 @@ async def test_search_vacancies(client: httpx.AsyncClient):
         app.dependency_overrides = {}
         app.user_middleware.append(Middleware(SecurityMiddleware))
         app.middleware_stack = app.build_middleware_stack()
+
+
+@pytest.mark.asyncio
+async def test_get_vacancy_facets(client: httpx.AsyncClient):
+    """
+    Test the vacancy facets endpoint without authentication.
+
+    Temporarily disables security middleware and overrides the search repository
+    with a fake implementation to verify that hits and facets are returned together.
+    """
+    app.user_middleware = [
+        m for m in app.user_middleware if m.cls.__name__ != "SecurityMiddleware"
+    ]
+    app.middleware_stack = app.build_middleware_stack()
+
+    try:
+        fake_repo = FakeSearchVacancyRepository()
+        await fake_repo.bulk_add([
+            Vacancy(source_id="1", source_name=VacancySource.HEADHUNTER, name="Python developer", area={"name": "Москва"}),
+            Vacancy(source_id="2", source_name=VacancySource.HEADHUNTER, name="Python QA", area={"name": "Москва"}),
+        ])
+        app.dependency_overrides[get_vacancy_search_repo] = lambda: fake_repo
+
+        response = await client.get(f"/api/vacancies/facets", params={"query": "python"})
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+        assert response.json()["facets"]["area"] == [{"value": "Москва", "count": 2}]
+    finally:
+        app.dependency_overrides = {}
+        app.user_middleware.append(Middleware(SecurityMiddleware))
+        app.middleware_stack = app.build_middleware_stack()
@@ -10,6 +10,7 @@ from src.users.domain.dtos import UserCreateDTO
 TABLES_TO_TRUNCATE = [
     "users",
     "vacancies",
+    "vacancy_outbox",
 ]
 
 
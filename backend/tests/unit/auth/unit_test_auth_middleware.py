@@ -0,0 +1,70 @@
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from src.auth.domain.entities import TokenData, TokenType
+from src.auth.infrastructure.services.jwt import JWTAuth
+from src.auth.infrastructure.transports.header import HeaderTransport
+from src.auth.presentation import middlewares as middlewares_module
+from src.auth.presentation.middlewares import AuthMiddleware, SecurityMiddleware
+from src.users.domain.entities import UserCreate
+from src.users.domain.interfaces.user_uow import IUserUnitOfWork
+
+
+@pytest.mark.asyncio
+async def test_auth_middleware_refreshes_access_token(monkeypatch, fake_user_uow: IUserUnitOfWork):
+    """
+    Test the pure ASGI auth middleware stack.
+
+    Ensures that:
+    - An expired access token is silently refreshed with a valid refresh token,
+    - The user the token belongs to is injected into `request.state.user`,
+    - The new access token is added to the response,
+    - Anonymous requests to protected paths are rejected by the security middleware.
+    """
+    # Arrange
+    user = await fake_user_uow.users.add(UserCreate(email="user@example.com", hashed_password="hashed"))
+    token_data = TokenData(
+        user_id=user.id, exp=datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=15)
+    )
+    token_provider = MagicMock()
+    token_provider.read_token = MagicMock(side_effect=lambda token: token_data if token != "expired" else None)
+    token_provider.create_access_token = MagicMock(return_value="new-access")
+    token_storage = AsyncMock()
+    token_storage.is_token_active = AsyncMock(return_value=True)
+
+    async def get_token_auth(request=None, response=None):
+        transports = {
+            TokenType.ACCESS: [HeaderTransport("Authorization", "Bearer")],
+            TokenType.REFRESH: [HeaderTransport("X-Refresh-Token", "Bearer")],
+        }
+        return JWTAuth(token_provider, transports, token_storage, request=request, response=response)
+
+    monkeypatch.setattr(middlewares_module, "get_token_auth", get_token_auth)
+    monkeypatch.setattr(middlewares_module, "PGUserUnitOfWork", lambda **kwargs: fake_user_uow)
+    app = FastAPI()
+
+    @app.get("/api/users/me")
+    async def me(request: Request):
+        return {"id": request.state.user.id}
+
+    @app.get("/api/vacancies/jobs")
+    async def jobs():
+        return []
+
+    app.add_middleware(SecurityMiddleware)
+    app.add_middleware(AuthMiddleware)
+    # Act
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(
+            "/api/users/me", headers={"Authorization": "Bearer expired", "X-Refresh-Token": "Bearer refresh"}
+        )
+        anonymous_response = await client.get("/api/vacancies/jobs")
+    # Assert
+    assert response.json() == {"id": user.id}
+    assert response.headers["Authorization"] == "Bearer new-access"
+    token_storage.store_token.assert_awaited_once_with(token_data)
+    assert anonymous_response.status_code == 403
@@ -0,0 +1,115 @@
+import datetime
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from pydantic import SecretStr
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.auth.config import auth_config
+from src.auth.domain.entities import TokenData, TokenType
+from src.auth.infrastructure.services import jwt as jwt_module
+from src.auth.infrastructure.services.jwt import JWTAuth, JWTProvider
+from src.utils.cache import TTLCache
+from src.auth.infrastructure.transports.header import HeaderTransport
+
+
+def _make_auth(request: Request, token_provider: MagicMock, token_storage: AsyncMock) -> JWTAuth:
+    transports = {
+        TokenType.ACCESS: [HeaderTransport("Authorization", "Bearer")],
+        TokenType.REFRESH: [HeaderTransport("X-Refresh-Token", "Bearer")],
+    }
+    return JWTAuth(token_provider, transports, token_storage, request=request)
+
+
+@pytest.mark.asyncio
+async def test_read_token_validates_once_per_request():
+    """
+    Test that a token is decoded and checked in the token storage once per request.
+
+    Ensures that:
+    - Every JWTAuth built for the same request reuses the validation result,
+    - An invalid token is remembered as well,
+    - Revoking the tokens invalidates the remembered results.
+    """
+    # Arrange
+    request = Request({
+        "type": "http",
+        "headers": [(b"authorization", b"Bearer access"), (b"x-refresh-token", b"Bearer refresh")],
+    })
+    token_data = TokenData(
+        user_id=1,
+        exp=datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=15),
+        jti="access-jti"
+    )
+    token_provider = MagicMock()
+    token_provider.read_token = MagicMock(side_effect=lambda token: token_data if token == "access" else None)
+    token_storage = AsyncMock()
+    token_storage.is_token_active = AsyncMock(return_value=True)
+    request.state.user = MagicMock(id=1)
+    # Act
+    results = [
+        await _make_auth(request, token_provider, token_storage).read_token(TokenType.ACCESS) for _ in range(3)
+    ]
+    refresh_results = [
+        await _make_auth(request, token_provider, token_storage).read_token(TokenType.REFRESH) for _ in range(2)
+    ]
+    auth = _make_auth(request, token_provider, token_storage)
+    auth.response = Response()
+    await auth.unset_tokens()
+    token_storage.is_token_active.return_value = False
+    revoked = await auth.read_token(TokenType.ACCESS)
+    # Assert
+    assert results == [token_data] * 3
+    assert refresh_results == [None, None]
+    assert token_provider.read_token.call_count == 3
+    assert token_storage.is_token_active.await_count == 2
+    assert revoked is None
+
+
+def test_read_token_verifies_signature_once(monkeypatch):
+    """
+    Test that a verified token is served from the cache until it expires.
+
+    Ensures that:
+    - The signature of a token is verified only on the first read,
+    - The token is cached no longer than its own lifetime,
+    - Invalid tokens are not cached.
+    """
+    # Arrange
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    # Keys are cached properties loaded from files
+    monkeypatch.setitem(auth_config.__dict__, "JWT_PRIVATE_KEY", SecretStr(private_pem))
+    monkeypatch.setitem(auth_config.__dict__, "JWT_PUBLIC_KEY", SecretStr(public_pem))
+    monkeypatch.setattr(auth_config, "JWT_CACHE_TTL_SECONDS", 3600)
+    cache = TTLCache(max_size=10)
+    monkeypatch.setattr(jwt_module, "_verified_tokens_cache", cache)
+    provider = JWTProvider()
+    decode_calls = []
+    original_decode = provider._decode_jwt
+
+    def decode_jwt(*args, **kwargs):
+        decode_calls.append(args)
+        return original_decode(*args, **kwargs)
+
+    monkeypatch.setattr(provider, "_decode_jwt", decode_jwt)
+    token = provider.create_access_token({"user_id": "1"})
+    # Act
+    results = [provider.read_token(token) for _ in range(3)]
+    tampered = [provider.read_token(token[:-2] + "AA") for _ in range(2)]
+    # Assert
+    assert results[0].user_id == 1 and results.count(results[0]) == 3
+    assert tampered == [None, None]
+    assert len(decode_calls) == 3
+    assert (cache.hits, len(cache)) == (2, 1)
+    expires_at = next(iter(cache._data.values()))[1]
+    assert expires_at - time.monotonic() <= auth_config.ACCESS_TOKEN_EXPIRE_SECONDS
@@ -0,0 +1,82 @@
+import datetime
+
+import pytest
+
+from src.auth.domain.entities import TokenData
+from src.auth.infrastructure.services import redis_token_storage as storage_module
+from src.auth.infrastructure.services.redis_token_storage import RedisTokenStorage
+
+
+class _RecordingPipeline:
+    """
+    Pipeline double recording queued commands and returning preset results.
+    """
+
+    def __init__(self, redis: "_RecordingRedis", transaction: bool):
+        self.redis = redis
+        self.transaction = transaction
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        self.redis.round_trips.append((self.transaction, self.commands))
+        return [self.redis.results.get(name) for name, _, _ in self.commands]
+
+
+class _RecordingRedis:
+
+    def __init__(self, results: dict | None = None):
+        self.results = results or {}
+        self.round_trips = []
+
+    def pipeline(self, transaction: bool = True) -> _RecordingPipeline:
+        return _RecordingPipeline(self, transaction)
+
+
+@pytest.mark.asyncio
+async def test_store_token_in_single_transaction(monkeypatch):
+    """
+    Test that a token is stored, expired JTIs are pruned and the user's set gets a TTL in one round trip.
+    """
+    # Arrange
+    redis = _RecordingRedis()
+    monkeypatch.setattr(storage_module, "get_redis_client", lambda: redis)
+    exp = (datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=15)).replace(microsecond=0)
+    # Act
+    await RedisTokenStorage().store_token(TokenData(user_id=1, exp=exp, jti="jti-1"))
+    # Assert
+    [(transaction, commands)] = redis.round_trips
+    assert transaction
+    assert [name for name, _, _ in commands] == ["setex", "zadd", "zremrangebyscore", "expire", "expire"]
+    assert commands[1][1] == ("user_jtis:1", {"jti-1": exp.timestamp()})
+    assert [kwargs for name, _, kwargs in commands if name == "expire"] == [{"nx": True}, {"gt": True}]
+
+
+@pytest.mark.asyncio
+async def test_revoke_tokens_by_user_in_two_round_trips(monkeypatch):
+    """
+    Test that revoking 500 sessions costs two round trips and covers tokens stored in the legacy set.
+    """
+    # Arrange
+    jtis = [f"jti-{i}" for i in range(500)]
+    redis = _RecordingRedis({"zrange": jtis, "smembers": {"legacy-jti"}})
+    monkeypatch.setattr(storage_module, "get_redis_client", lambda: redis)
+    # Act
+    await RedisTokenStorage().revoke_tokens_by_user("1")
+    # Assert
+    assert len(redis.round_trips) == 2
+    commands = {name: args for name, args, _ in redis.round_trips[1][1]}
+    unlinked = {key for name, args, _ in redis.round_trips[1][1] if name == "unlink" for key in args}
+    assert unlinked == {f"tokens:{jti}" for jti in [*jtis, "legacy-jti"]} | {"user_tokens:1"}
+    assert commands["zrem"] == ("user_jtis:1", *jtis)
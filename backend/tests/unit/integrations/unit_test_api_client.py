@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from src.integrations.infrastructure.http.cache import InMemoryHttpCache
+from src.integrations.infrastructure.http.exceptions import CircuitOpenError
+from src.integrations.infrastructure.http.resilience import CircuitBreaker, RetryPolicy, get_host_rate_limiter
+from src.integrations.infrastructure.http.services.api_client import APIClientService
+from tests.fakes.http import FakeHttpClient, FakeResponse
+
+
+@pytest.mark.asyncio
+async def test_request_retries_transient_failures(monkeypatch):
+    """
+    Test that transient failures are retried with backoff.
+
+    Ensures that:
+    - Timeouts and 503 responses are retried,
+    - `Retry-After` takes precedence over the exponential backoff,
+    - Responses of failed attempts are released,
+    - The first successful response is returned.
+    """
+    # Arrange
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("src.integrations.infrastructure.http.services.api_client.asyncio.sleep", fake_sleep)
+    unavailable = FakeResponse(status=503, headers={"Retry-After": "3"})
+    client = FakeHttpClient([TimeoutError(), unavailable, FakeResponse(status=200)])
+    service = APIClientService(
+        client=client, source_url="https://api.example.com",
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=1), circuit_breaker=CircuitBreaker()
+    )
+    # Act
+    response = await service.request("GET", "/vacancies")
+    # Assert
+    assert response.status == 200
+    assert len(client.requests) == 3
+    assert 0 <= delays[0] <= 1 and delays[1] == 3
+    assert unavailable.released
+
+
+@pytest.mark.asyncio
+async def test_request_fails_fast_when_circuit_is_open(monkeypatch):
+    """
+    Test that the circuit opens after consecutive failures and rejects further requests.
+    """
+    # Arrange
+    async def fake_sleep(delay):
+        pass
+
+    monkeypatch.setattr("src.integrations.infrastructure.http.services.api_client.asyncio.sleep", fake_sleep)
+    client = FakeHttpClient([FakeResponse(status=502) for _ in range(3)])
+    service = APIClientService(
+        client=client, source_url="https://api.example.com",
+        retry_policy=RetryPolicy(max_attempts=5), circuit_breaker=CircuitBreaker(failure_threshold=3)
+    )
+    # Act / Assert
+    with pytest.raises(CircuitOpenError):
+        await service.request("GET", "/vacancies")
+    assert len(client.requests) == 3
+    # Non-idempotent requests are not retried
+    client.responses = [FakeResponse(status=503)]
+    service.circuit_breaker = CircuitBreaker()
+    with pytest.raises(RuntimeError):
+        await service.request("POST", "/token")
+
+
+@pytest.mark.asyncio
+async def test_request_revalidates_cached_responses():
+    """
+    Test conditional requests through the response cache.
+
+    Ensures that:
+    - A stale entry is revalidated with `If-None-Match`,
+    - A 304 answer is served with the cached body,
+    - A fresh entry (`max-age`) is served without a request.
+    """
+    # Arrange
+    client = FakeHttpClient([
+        FakeResponse(status=200, headers={"ETag": '"v1"'}, body={"items": [1]}),
+        FakeResponse(status=304, headers={"ETag": '"v1"', "Cache-Control": "max-age=60"}),
+    ])
+    service = APIClientService(
+        client=client, source_url="https://api.example.com",
+        circuit_breaker=CircuitBreaker(), cache=InMemoryHttpCache()
+    )
+    # Act
+    responses = [await service.request("GET", "/areas", params={"page": 0}) for _ in range(3)]
+    # Assert
+    assert [await response.json() for response in responses] == [{"items": [1]}] * 3
+    assert len(client.requests) == 2
+    assert "If-None-Match" not in client.requests[0]["headers"]
+    assert client.requests[1]["headers"]["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_host_rate_limiter_applies_stricter_rate(caplog):
+    """
+    Test that clients of the same host requesting different rates share the stricter limit.
+
+    Ensures that:
+    - A single limiter is shared by the host,
+    - A lower requested rate narrows the shared limiter, a higher one doesn't widen it,
+    - The mismatch is reported.
+    """
+    # Act
+    limiter = get_host_rate_limiter("rates.example.com", 10)
+    narrowed = get_host_rate_limiter("rates.example.com", 2)
+    widened = get_host_rate_limiter("rates.example.com", 20)
+    # Assert
+    assert limiter is narrowed is widened
+    assert limiter.max_rate == limiter.rate == 2
+    assert limiter.capacity == 2
+    assert "rates.example.com" in caplog.text
+
+
+def test_host_rate_limiter_applies_stricter_rate_in_every_loop():
+    """
+    Test that the stricter rate is applied to the limiters of later event loops too
+    (e.g. Celery tasks running each one in a new loop), not only where the mismatch was first reported.
+    """
+    # Arrange
+    async def get_limiter():
+        get_host_rate_limiter("loops.example.com", 10)
+        return get_host_rate_limiter("loops.example.com", 2)
+
+    # Act
+    first = asyncio.run(get_limiter())
+    second = asyncio.run(get_limiter())
+    # Assert
+    assert first is not second
+    assert first.max_rate == second.max_rate == 2
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from src.integrations.infrastructure.external_api.headhunter import adapter as adapter_module
+from src.integrations.infrastructure.external_api.headhunter.adapter import HeadHunterAdapter
+from src.integrations.infrastructure.external_api.headhunter.schemas.request import HHVacancySearchParams
+from src.integrations.infrastructure.external_api.headhunter.schemas.response import (
+    HHKeySkill,
+    HHVacancy,
+    HHVacancyDetail,
+    HHVacancyResponse
+)
+from src.utils.cache import TTLCache
+from src.vacancies.domain.entities import Vacancy, VacancySource
+
+
+def _make_page(page: int, pages: int, found: int, per_page: int = 100) -> HHVacancyResponse:
+    items = [HHVacancy(id=str(page * per_page + i), name=f"Vacancy {page}-{i}") for i in range(2)]
+    return HHVacancyResponse(found=found, pages=pages, page=page, per_page=per_page, items=items)
+
+
+@pytest.mark.asyncio
+async def test_get_all_vacancies_concurrent(monkeypatch):
+    """
+    Test that all pages are fetched concurrently within the configured limit.
+
+    Ensures that:
+    - The number of simultaneous requests never exceeds `max_concurrency`,
+    - Pages are requested only once,
+    - The caller's search parameters are not mutated,
+    - The result preserves page order even if later pages finish first.
+    """
+    # Arrange
+    adapter = HeadHunterAdapter(token=None, max_concurrency=2, requests_per_second=1000)
+    in_flight, max_in_flight, requested_pages = 0, 0, []
+
+    async def fake_get_vacancy_response(search_params: HHVacancySearchParams) -> HHVacancyResponse:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        requested_pages.append(search_params.page)
+        # Later pages respond faster to make sure the order is restored
+        await asyncio.sleep(0.01 * (5 - search_params.page))
+        in_flight -= 1
+        return _make_page(search_params.page, pages=5, found=450)
+
+    monkeypatch.setattr(adapter, "_get_vacancy_response", fake_get_vacancy_response)
+    search_params = HHVacancySearchParams(text="python", per_page=10)
+    # Act
+    vacancies = await adapter.get_all_vacancies(search_params)
+    # Assert
+    assert sorted(requested_pages) == [0, 1, 2, 3, 4]
+    assert max_in_flight <= 2
+    assert [vacancy.source_id for vacancy in vacancies] == [
+        str(page * 100 + i) for page in range(5) for i in range(2)
+    ]
+    assert search_params.per_page == 10
+
+
+def test_count_pages_respects_depth_limit():
+    """
+    Test that the number of pages never exceeds the API depth limit of 2000 results.
+    """
+    assert HeadHunterAdapter._count_pages(_make_page(0, pages=50, found=5000)) == 20
+    assert HeadHunterAdapter._count_pages(_make_page(0, pages=2, found=150)) == 2
+    assert HeadHunterAdapter._count_pages(_make_page(0, pages=0, found=0)) == 0
+
+
+@pytest.mark.asyncio
+async def test_iter_vacancy_pages_skips_completed_pages(monkeypatch):
+    """
+    Test that keyed pages are stable across runs and completed pages are not requested again.
+    """
+    # Arrange
+    adapter = HeadHunterAdapter(token=None, requests_per_second=1000)
+    requested_pages = []
+
+    async def fake_get_vacancy_response(search_params: HHVacancySearchParams) -> HHVacancyResponse:
+        requested_pages.append(search_params.page)
+        return _make_page(search_params.page, pages=4, found=350)
+
+    monkeypatch.setattr(adapter, "_get_vacancy_response", fake_get_vacancy_response)
+    search_params = HHVacancySearchParams(text="python")
+    first_run_keys = [page.key async for page in adapter.iter_vacancy_pages(search_params)]
+    requested_pages.clear()
+    # Act
+    pages = [page async for page in adapter.iter_vacancy_pages(search_params, set(first_run_keys[:2]))]
+    # Assert
+    assert len(set(first_run_keys)) == 4
+    assert [page.key for page in pages] == first_run_keys[2:]
+    # The first page is always requested as the probe
+    assert requested_pages == [0, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_enrich_vacancies_fetches_changed_details_only(monkeypatch):
+    """
+    Test enrichment of search results with vacancy details.
+
+    Ensures that:
+    - Details are fetched concurrently within `detail_concurrency`,
+    - The HTML description is converted to text and preferred over the snippet,
+    - Details of unchanged vacancies are reused, failed ones are skipped.
+    """
+    # Arrange
+    monkeypatch.setattr(adapter_module, "_vacancy_details_cache", TTLCache(max_size=100))
+    adapter = HeadHunterAdapter(token=None, detail_concurrency=2)
+    in_flight, max_in_flight, requested_ids = 0, 0, []
+
+    async def fake_get_vacancy_detail(vacancy_id: str) -> HHVacancyDetail:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        requested_ids.append(vacancy_id)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if vacancy_id == "3":
+            raise TimeoutError()
+        return HHVacancyDetail(
+            id=vacancy_id, description=f"<p>Full <b>description</b> {vacancy_id}</p>",
+            key_skills=[HHKeySkill(name="Python")]
+        )
+
+    monkeypatch.setattr(adapter, "_get_vacancy_detail", fake_get_vacancy_detail)
+    vacancies = HeadHunterAdapter._map_vacancy_response(_make_page(0, pages=1, found=2))
+    vacancies += [Vacancy(source_id="3", source_name=VacancySource.HEADHUNTER, requirement="Snippet")]
+    # Act
+    enriched = await adapter.enrich_vacancies(vacancies)
+    requested_ids.clear()
+    changed = [vacancies[0].model_copy(update={"name": "Renamed"}), vacancies[1]]
+    await adapter.enrich_vacancies(changed)
+    # Assert
+    assert max_in_flight <= 2
+    assert [vacancy.description for vacancy in enriched] == ["Full description 0", "Full description 1", "Snippet"]
+    assert enriched[0].key_skills == ["Python"]
+    assert requested_ids == ["0"]
@@ -0,0 +1,72 @@
+import datetime
+
+import pytest
+
+from src.integrations.infrastructure.external_api.headhunter.schemas.request import HHVacancySearchParams
+from src.integrations.infrastructure.external_api.headhunter.sharding import HHSearchShardPlanner
+
+START = datetime.datetime(2025, 3, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=3)))
+
+
+def _make_counter(published: list[tuple[datetime.datetime, str]]):
+    """
+    Build a fake `found` counter over a list of (published_at, area) pairs.
+    """
+    async def count_found(params: HHVacancySearchParams) -> int:
+        date_from = datetime.datetime.fromisoformat(params.date_from)
+        date_to = datetime.datetime.fromisoformat(params.date_to)
+        return sum(
+            1 for published_at, area in published
+            if date_from <= published_at <= date_to and (not params.area or area in params.area)
+        )
+    return count_found
+
+
+@pytest.mark.asyncio
+async def test_plan_splits_date_window_under_cap():
+    """
+    Test that a large query is split into contiguous date windows under the cap.
+
+    Ensures that:
+    - Every shard contains no more than `max_results` vacancies,
+    - No vacancy is lost or counted twice,
+    - Shards are ordered by the date window.
+    """
+    # Arrange
+    published = [(START + datetime.timedelta(minutes=5 * i), "1") for i in range(9000)]
+    planner = HHSearchShardPlanner(_make_counter(published), max_results=2000)
+    params = HHVacancySearchParams(
+        text="python",
+        date_from=START.isoformat(),
+        date_to=(START + datetime.timedelta(days=32)).isoformat()
+    )
+    # Act
+    shards = await planner.plan(params)
+    # Assert
+    assert all(shard.found <= 2000 for shard in shards)
+    assert sum(shard.found for shard in shards) == 9000
+    windows = [(shard.params.date_from, shard.params.date_to) for shard in shards]
+    assert windows == sorted(windows)
+    assert params.date_from == START.isoformat()
+
+
+@pytest.mark.asyncio
+async def test_plan_splits_areas_when_window_is_exhausted():
+    """
+    Test that list filters are split once the date window can't be narrowed any further.
+    """
+    # Arrange
+    published = [(START, str(area)) for area in range(1, 5) for _ in range(1500)]
+    planner = HHSearchShardPlanner(
+        _make_counter(published), max_results=2000, min_window=datetime.timedelta(days=1)
+    )
+    params = HHVacancySearchParams(
+        area=["1", "2", "3", "4"],
+        date_from=START.isoformat(),
+        date_to=(START + datetime.timedelta(hours=1)).isoformat()
+    )
+    # Act
+    shards = await planner.plan(params)
+    # Assert
+    assert [shard.params.area for shard in shards] == [["1"], ["2"], ["3"], ["4"]]
+    assert [shard.pages for shard in shards] == [150, 150, 150, 150]
@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.users.domain.entities import UserCreate, UserUpdate
+from src.users.infrastructure.cache.repositories import CachedUserRepository
+from src.users.infrastructure.cache.user_cache import (
+    NO_PASSWORD_HASH,
+    InMemoryUserCache,
+    RedisUserCache,
+    TieredUserCache,
+    strip_credentials
+)
+from tests.fakes.users import FakeUserRepository
+
+
+@pytest.mark.asyncio
+async def test_cached_user_repository_invalidates_changed_users():
+    """
+    Test user lookups by primary key through the cache.
+
+    Ensures that:
+    - Repeated lookups are served from the cache,
+    - A user changed in the transaction isn't cached again before the commit,
+    - Changed users are invalidated once the transaction is committed.
+    """
+    # Arrange
+    repository = FakeUserRepository()
+    user = await repository.add(UserCreate(email="user@example.com", hashed_password="hashed"))
+    repository.get_by_pk = AsyncMock(wraps=repository.get_by_pk)
+    cache = InMemoryUserCache(max_size=10, ttl=60)
+    cached_repository = CachedUserRepository(repository, cache)
+    # Act
+    first, second = await cached_repository.get_by_pk(user.id), await cached_repository.get_by_pk(user.id)
+    lookups = repository.get_by_pk.await_count
+    await cached_repository.update(UserUpdate(id=user.id, is_superuser=True))
+    during_transaction = await cached_repository.get_by_pk(user.id)
+    cached_during_transaction = await cache.get(user.id)
+    await cached_repository.invalidate_changed()
+    after_commit = await cached_repository.get_by_pk(user.id)
+    # Assert
+    assert first == second and lookups == 1
+    assert during_transaction.is_superuser and cached_during_transaction is None
+    assert after_commit.is_superuser and await cache.get(user.id) == after_commit
+
+
+@pytest.mark.asyncio
+async def test_tiered_user_cache_fills_faster_caches():
+    """
+    Test that a user found in a slower cache is copied into the faster one.
+    """
+    # Arrange
+    repository = FakeUserRepository()
+    user = await repository.add(UserCreate(email="user@example.com", hashed_password="hashed"))
+    local_cache, shared_cache = InMemoryUserCache(), InMemoryUserCache()
+    await shared_cache.set(user)
+    cache = TieredUserCache(local_cache, shared_cache)
+    # Act
+    cached = await cache.get(user.id)
+    await cache.delete(user.id)
+    # Assert
+    assert cached == strip_credentials(user)
+    assert await local_cache.get(user.id) is None and await shared_cache.get(user.id) is None
+
+
+class _DictRedis:
+    """
+    Redis client stub keeping string values in a dictionary.
+    """
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.values[key] = value
+
+
+@pytest.mark.asyncio
+async def test_user_cache_doesnt_keep_password_hash(monkeypatch):
+    """
+    Test that the password hash never reaches the user caches.
+
+    Ensures that:
+    - Redis entries don't contain the hash,
+    - Users served by the cached repository have no hash, whether cached or not.
+    """
+    # Arrange
+    repository = FakeUserRepository()
+    user = await repository.add(UserCreate(email="user@example.com", hashed_password="secret-hash"))
+    redis_cache = RedisUserCache()
+    monkeypatch.setattr(redis_cache, "redis", _DictRedis())
+    cached_repository = CachedUserRepository(repository, redis_cache)
+    # Act
+    loaded = await cached_repository.get_by_pk(user.id)
+    cached = await cached_repository.get_by_pk(user.id)
+    # Assert
+    assert "secret-hash" not in "".join(redis_cache.redis.values.values())
+    assert loaded.hashed_password == cached.hashed_password == NO_PASSWORD_HASH
+    assert cached.email == user.email
@@ -0,0 +1,48 @@
+from src.core.domain.entities import BulkResult
+from src.vacancies.application.mappers.vacancies import VacancyDomainToDTOMapper
+from src.vacancies.domain.entities import Vacancy, VacancySource
+from src.vacancies.infrastructure.elastic.mappers import VacancyDomainToElasticMapper
+
+
+def _make_vacancy(name: str = "Python developer") -> Vacancy:
+    return Vacancy(
+        source_id="1",
+        source_name=VacancySource.HEADHUNTER,
+        name=name,
+        alternate_url="https://hh.ru/vacancy/1",
+        published_at="2025-03-01T10:00:00+03:00",
+        has_test=False
+    )
+
+
+def test_vacancy_fingerprint_tracks_content_changes():
+    """
+    Test that the content fingerprint is stable for equal content and changes with it.
+
+    Ensures that:
+    - Equal vacancies produce equal fingerprints for both the database and the search index,
+    - Any content change produces a new fingerprint.
+    """
+    # Arrange
+    db_mapper, es_mapper = VacancyDomainToDTOMapper(), VacancyDomainToElasticMapper()
+    vacancy, same_vacancy = _make_vacancy(), _make_vacancy()
+    changed_vacancy = _make_vacancy(name="Senior Python developer")
+    # Act
+    db_fingerprints = [db_mapper.map_one(v).fingerprint for v in (vacancy, same_vacancy, changed_vacancy)]
+    es_fingerprints = [es_mapper.map_one(v)["_source"]["fingerprint"] for v in (vacancy, same_vacancy, changed_vacancy)]
+    # Assert
+    assert len(db_fingerprints[0]) == 64
+    assert db_fingerprints[0] == db_fingerprints[1] != db_fingerprints[2]
+    assert es_fingerprints[0] == es_fingerprints[1] != es_fingerprints[2]
+
+
+def test_bulk_result_merge_sums_change_counters():
+    """
+    Test that created/updated/unchanged counters are aggregated only when reported.
+    """
+    result = BulkResult.merge([
+        BulkResult(success=3, total=3, created=1, updated=1, unchanged=1),
+        BulkResult(success=2, total=2, created=0, updated=0, unchanged=2),
+    ])
+    assert (result.created, result.updated, result.unchanged, result.total) == (1, 1, 3, 5)
+    assert BulkResult.merge([BulkResult(success=1, total=1)]).unchanged is None
@@ -0,0 +1,139 @@
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.vacancies.application.mappers.vacancies import VacancyDomainToDTOMapper
+from src.vacancies.domain.entities import Vacancy, VacancySource
+from src.vacancies.infrastructure.db.orm import VacancyDB
+from src.vacancies.infrastructure.db.repositories import (
+    PG_MAX_BIND_PARAMS,
+    PGVacancyOutboxRepository,
+    PGVacancyRepository
+)
+
+
+class _RecordingSession:
+    """
+    Session stub recording executed statements and reporting every row as created.
+    """
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.statements.append(compiled)
+        counts = SimpleNamespace(created=len(compiled.params) // len(VacancyDB.__table__.columns), updated=0)
+        return SimpleNamespace(one=lambda: counts)
+
+
+def _make_vacancies(count: int) -> list[Vacancy]:
+    return [
+        Vacancy(
+            source_id=str(i),
+            source_name=VacancySource.HEADHUNTER,
+            name=f"Vacancy {i}",
+            alternate_url=f"https://hh.ru/vacancy/{i}",
+            published_at="2025-03-01T10:00:00+03:00",
+            has_test=False
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_or_update_splits_statements_into_chunks():
+    """
+    Test that the upsert is split into statements under the bind parameter limit.
+
+    Ensures that:
+    - The configured chunk size is capped by the bind parameter limit,
+    - Every statement stays under the limit,
+    - Duplicates are collapsed and chunk results are aggregated.
+    """
+    # Arrange
+    session = _RecordingSession()
+    repository = PGVacancyRepository(session, chunk_size=100_000)
+    vacancies = _make_vacancies(2500)
+    # Act
+    result = await repository.bulk_add_or_update(vacancies + vacancies[:10])
+    # Assert
+    assert repository.chunk_size < 2500
+    assert len(session.statements) == 2
+    assert all(len(compiled.params) <= PG_MAX_BIND_PARAMS for compiled in session.statements)
+    assert "xmax = 0" in session.statements[0].string
+    assert (result.total, result.created, result.skipped) == (2500, 2500, 10)
+
+
+def test_build_copy_records_follows_column_order():
+    """
+    Test that COPY records match the table columns and fill in the ORM defaults.
+    """
+    # Arrange
+    columns = [table_column.name for table_column in VacancyDB.__table__.columns]
+    vacancies = VacancyDomainToDTOMapper().map(_make_vacancies(2))
+    # Act
+    records = PGVacancyRepository._build_copy_records(vacancies, columns)
+    # Assert
+    assert all(len(record) == len(columns) for record in records)
+    values = dict(zip(columns, records[0]))
+    assert values["id"] is not None and values["created_at"] == values["updated_at"]
+    assert (values["source_name"], values["source_id"]) == (VacancySource.HEADHUNTER.value, 0)
+    assert json.loads(values["meta"]) == vacancies[0].meta
+    assert values["fingerprint"] == vacancies[0].fingerprint
+
+
+class _OutboxSession:
+    """
+    Session stub of a relay whose advisory lock of a vacancy is held by a concurrent relay.
+    """
+
+    def __init__(self, events: list[tuple[int, uuid.UUID]], locked_ids: set[uuid.UUID], metas: dict):
+        self.events = events
+        self.locked_ids = locked_ids
+        self.metas = metas
+        self.statements = []
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.statements.append(compiled.string)
+        if "pg_try_advisory_xact_lock" in compiled.string:
+            vacancy_ids = [
+                vacancy_id for vacancy_id in compiled.params["vacancy_ids"] if vacancy_id not in self.locked_ids
+            ]
+            return SimpleNamespace(scalars=lambda: vacancy_ids)
+        if "vacancy_outbox" in compiled.string:
+            rows = [SimpleNamespace(id=event_id, vacancy_id=vacancy_id) for event_id, vacancy_id in self.events]
+            return SimpleNamespace(all=lambda: rows)
+        metas = [self.metas[vacancy_id] for vacancy_id in compiled.params["id_1"]]
+        return SimpleNamespace(scalars=lambda: metas)
+
+
+@pytest.mark.asyncio
+async def test_claim_batch_skips_vacancies_relayed_concurrently():
+    """
+    Test that events of a vacancy locked by another relay are left for a later batch.
+
+    Ensures that:
+    - The state of a vacancy is only loaded once its advisory lock is acquired,
+    - Events of vacancies locked by a concurrent relay are neither returned nor deleted.
+    """
+    # Arrange
+    free_id, locked_id = uuid.uuid4(), uuid.uuid4()
+    vacancy = _make_vacancies(1)[0]
+    session = _OutboxSession(
+        events=[(1, free_id), (2, locked_id), (3, free_id)],
+        locked_ids={locked_id},
+        metas={free_id: vacancy.model_dump(mode="json")}
+    )
+    repository = PGVacancyOutboxRepository(session)
+    # Act
+    batch = await repository.claim_batch(limit=10)
+    # Assert
+    assert "FOR UPDATE SKIP LOCKED" in session.statements[0]
+    assert "pg_try_advisory_xact_lock" in session.statements[1]
+    assert batch.event_ids == [1, 3]
+    assert batch.vacancies == [vacancy]
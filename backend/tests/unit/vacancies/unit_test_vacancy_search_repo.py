@@ -0,0 +1,252 @@
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from elasticsearch import helpers
+
+from src.utils.cache import TTLCache
+from src.vacancies.domain.entities import (
+    Vacancy,
+    VacancyFacetQuery,
+    VacancySearchQuery,
+    VacancySource,
+    VacancySuggestQuery
+)
+from src.vacancies.domain.exceptions import InvalidSearchCursor
+from src.vacancies.infrastructure.elastic import indices as indices_module
+from src.vacancies.infrastructure.elastic import repositories as repositories_module
+from src.vacancies.infrastructure.elastic.repositories import ESVacancySearchRepository
+
+
+async def _iter_pages(pages: list[list[Vacancy]]):
+    for page in pages:
+        yield page
+
+
+@pytest.mark.asyncio
+async def test_bulk_index_streams_documents_concurrently(monkeypatch):
+    """
+    Test parallel streaming indexing of a large stream of vacancies.
+
+    Ensures that:
+    - Several bulk requests are in flight at once, none larger than `chunk_size`,
+    - Per-document errors are collected into `failed`,
+    - Refreshes and replicas are disabled during the load and restored afterwards.
+    """
+    # Arrange
+    es_client = MagicMock()
+    es_client.indices.get_settings = AsyncMock(return_value={
+        "vacancies": {"settings": {"index.number_of_replicas": "1"}}
+    })
+    es_client.indices.put_settings = AsyncMock()
+    es_client.indices.refresh = AsyncMock()
+    monkeypatch.setattr(repositories_module, "get_elastic_client", lambda: es_client)
+    in_flight, max_in_flight, chunk_sizes = 0, 0, []
+
+    async def fake_streaming_bulk(client, actions, chunk_size, **kwargs):
+        nonlocal in_flight, max_in_flight
+        chunk = []
+        async for action in actions:
+            chunk.append(action)
+            if len(chunk) < chunk_size:
+                continue
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            chunk_sizes.append(len(chunk))
+            for doc in chunk:
+                failed = doc["_source"]["name"] == "Broken"
+                yield not failed, {"index": {"_id": doc["_id"], "status": 400 if failed else 201, "result": "created"}}
+            chunk = []
+        chunk_sizes.append(len(chunk))
+        for doc in chunk:
+            yield True, {"index": {"_id": doc["_id"], "status": 201, "result": "created"}}
+
+    monkeypatch.setattr(helpers, "async_streaming_bulk", fake_streaming_bulk)
+    repository = ESVacancySearchRepository(chunk_size=10, concurrency=3)
+    pages = [
+        [
+            Vacancy(source_id=str(page * 50 + i), source_name=VacancySource.HEADHUNTER, name="Python")
+            for i in range(50)
+        ]
+        for page in range(4)
+    ]
+    pages[0][0] = pages[0][0].model_copy(update={"name": "Broken"})
+    # Act
+    result = await repository.bulk_index(_iter_pages(pages), bulk_load=True)
+    # Assert
+    assert max_in_flight > 1
+    assert max(chunk_sizes) <= 10
+    assert (result.total, result.created) == (200, 199)
+    assert [(failure["id"].endswith("0"), failure["status"]) for failure in result.failed] == [(True, 400)]
+    disabled, restored = [call.kwargs["settings"] for call in es_client.indices.put_settings.await_args_list]
+    assert disabled == {"index.refresh_interval": "-1", "index.number_of_replicas": 0}
+    assert restored == {"index.refresh_interval": None, "index.number_of_replicas": "1"}
+    es_client.indices.refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_switch_vacancy_index_replaces_legacy_index(monkeypatch):
+    """
+    Test that the alias switch is a single atomic operation replacing the previous index.
+
+    Ensures that:
+    - A legacy concrete 'vacancies' index is removed in the same alias update,
+    - Previous versioned indices are detached from the alias and deleted.
+    """
+    # Arrange
+    es_client = MagicMock()
+    es_client.__aenter__ = AsyncMock(return_value=es_client)
+    es_client.__aexit__ = AsyncMock(return_value=None)
+    es_client.indices.exists_alias = AsyncMock(return_value=False)
+    es_client.indices.exists = AsyncMock(return_value=True)
+    es_client.indices.update_aliases = AsyncMock()
+    es_client.indices.delete = AsyncMock()
+    monkeypatch.setattr(indices_module, "AsyncElasticsearch", lambda hosts: es_client)
+    # Act
+    first_previous = await indices_module.switch_vacancy_index("vacancies_1")
+    es_client.indices.exists_alias.return_value = True
+    es_client.indices.get_alias = AsyncMock(return_value={"vacancies_1": {"aliases": {"vacancies": {}}}})
+    second_previous = await indices_module.switch_vacancy_index("vacancies_2")
+    # Assert
+    first_actions, second_actions = [
+        call.kwargs["actions"] for call in es_client.indices.update_aliases.await_args_list
+    ]
+    assert first_previous == ["vacancies"] and second_previous == ["vacancies_1"]
+    assert first_actions == [
+        {"add": {"index": "vacancies_1", "alias": "vacancies"}},
+        {"remove_index": {"index": "vacancies"}}
+    ]
+    assert second_actions == [
+        {"add": {"index": "vacancies_2", "alias": "vacancies"}},
+        {"remove": {"index": "vacancies_1", "alias": "vacancies"}}
+    ]
+    es_client.indices.delete.assert_awaited_once_with(index="vacancies_1", ignore_unavailable=True)
+
+
+@pytest.mark.asyncio
+async def test_search_pages_with_cursor(monkeypatch):
+    """
+    Test cursor pagination of search results with a point in time and `search_after`.
+
+    Ensures that:
+    - The first page opens a point in time and returns a cursor,
+    - The next page continues after the last hit with a stable tiebreaker sort,
+    - The point in time is closed on the last page,
+    - A cursor can't be reused with other filters.
+    """
+    # Arrange
+    es_client = MagicMock()
+    es_client.open_point_in_time = AsyncMock(return_value={"id": "pit-1"})
+    es_client.close_point_in_time = AsyncMock()
+    es_client.search = AsyncMock(side_effect=[
+        {"pit_id": "pit-2", "hits": {"hits": [{"_id": "1", "sort": [5, 10]}, {"_id": "2", "sort": [4, 11]}]}},
+        {"pit_id": "pit-2", "hits": {"hits": [{"_id": "3", "sort": [3, 12]}]}},
+    ])
+    monkeypatch.setattr(repositories_module, "get_elastic_client", lambda: es_client)
+    repository = ESVacancySearchRepository()
+    query = VacancySearchQuery(query="python", sort_by="published_at", size=2, paginate_by="cursor")
+    # Act
+    first_page = await repository.search(query)
+    last_page = await repository.search(query.model_copy(update={"cursor": first_page["next_cursor"]}))
+    # Assert
+    first_body, last_body = [call.kwargs["body"] for call in es_client.search.await_args_list]
+    assert "from" not in first_body and "search_after" not in first_body
+    assert first_body["sort"] == [{"published_at": {"order": "desc"}}, {"_shard_doc": {"order": "asc"}}]
+    assert last_body["pit"]["id"] == "pit-2" and last_body["search_after"] == [4, 11]
+    assert last_page["next_cursor"] is None
+    es_client.close_point_in_time.assert_awaited_once_with(id="pit-2")
+    with pytest.raises(InvalidSearchCursor):
+        await repository.search(VacancySearchQuery(query="java", size=2, cursor=first_page["next_cursor"]))
+
+
+def test_build_query_scores_only_full_text():
+    """
+    Test that only the full-text query is scored and filters are exact cacheable predicates.
+
+    Empty keyword parameters don't filter, while a False flag does.
+    """
+    # Arrange
+    query = VacancySearchQuery(
+        query="python",
+        area="",
+        employer="Yandex",
+        experience="",
+        schedule="Удаленная работа",
+        has_test=False,
+        published_from=datetime.date(2025, 3, 1),
+        published_to=datetime.date(2025, 3, 31)
+    )
+    # Act
+    es_query = ESVacancySearchRepository._build_query(query)
+    # Assert
+    assert es_query["bool"]["must"] == [{"match": {"name": "python"}}]
+    assert es_query["bool"]["filter"] == [
+        {"term": {"employer.name.keyword": "Yandex"}},
+        {"term": {"schedule.name.keyword": "Удаленная работа"}},
+        {"term": {"has_test": False}},
+        {"range": {"published_at": {"gte": "2025-03-01||/d", "lte": "2025-03-31||/d"}}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_facets_counts_in_single_request(monkeypatch):
+    """
+    Test that hits and all facets are fetched with a single search request.
+    """
+    # Arrange
+    es_client = MagicMock()
+    es_client.search = AsyncMock(return_value={
+        "hits": {"total": {"value": 42}, "hits": [{"_id": "1"}]},
+        "aggregations": {
+            "area": {"buckets": [{"key": "Москва", "doc_count": 30}, {"key": "Казань", "doc_count": 12}]},
+            "salary_from": {"buckets": [{"key": 100000.0, "doc_count": 7}]},
+        }
+    })
+    monkeypatch.setattr(repositories_module, "get_elastic_client", lambda: es_client)
+    repository = ESVacancySearchRepository()
+    # Act
+    result = await repository.get_facets(VacancyFacetQuery(query="python", area="Москва", facet_size=5))
+    # Assert
+    es_client.search.assert_awaited_once()
+    body = es_client.search.await_args.kwargs["body"]
+    assert body["aggs"]["employer"] == {"terms": {"field": "employer.name.keyword", "size": 5}}
+    assert body["aggs"]["salary_to"]["histogram"]["field"] == "salary.to"
+    assert result.total == 42 and result.hits == [{"_id": "1"}]
+    assert [(bucket.value, bucket.count) for bucket in result.facets["area"]] == [("Москва", 30), ("Казань", 12)]
+    assert result.facets["salary_from"][0].count == 7
+    assert result.facets["schedule"] == []
+
+
+@pytest.mark.asyncio
+async def test_suggest_matches_prefix_and_caches_hot_prefixes(monkeypatch):
+    """
+    Test autocomplete suggestions.
+
+    Ensures that:
+    - The prefix is matched against the `search_as_you_type` subfield without counting total hits,
+    - Duplicate titles are collapsed into a single suggestion,
+    - A repeated prefix (in any case) is served from the cache without a request.
+    """
+    # Arrange
+    monkeypatch.setattr(repositories_module, "_suggestions_cache", TTLCache(max_size=10))
+    es_client = MagicMock()
+    es_client.search = AsyncMock(return_value={"hits": {"hits": [
+        {"_source": {"name": "Python developer"}},
+        {"_source": {"name": "python developer"}},
+        {"_source": {"name": "Python QA"}},
+    ]}})
+    monkeypatch.setattr(repositories_module, "get_elastic_client", lambda: es_client)
+    repository = ESVacancySearchRepository()
+    # Act
+    suggestions = await repository.suggest(VacancySuggestQuery(prefix="Pyth", size=5))
+    cached = await repository.suggest(VacancySuggestQuery(prefix="pyth ", size=5))
+    # Assert
+    es_client.search.assert_awaited_once()
+    body = es_client.search.await_args.kwargs["body"]
+    assert body["query"]["multi_match"]["type"] == "bool_prefix"
+    assert body["query"]["multi_match"]["fields"][0] == "name.suggest"
+    assert body["track_total_hits"] is False
+    assert suggestions == cached == ["Python developer", "Python QA"]
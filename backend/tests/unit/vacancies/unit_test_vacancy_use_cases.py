@@ -1,11 +1,24 @@
+import datetime
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 from src.integrations.infrastructure.external_api.mappers.vacancies import VacancyExternalToDomainMapper
-from src.vacancies.application.use_cases.vacancy_collector import collect_all_vacancies
-from src.vacancies.domain.entities import Vacancy, VacancySource
+from src.vacancies.application.use_cases.collection_jobs import create_collection_job, run_collection_job
+from src.vacancies.application.use_cases.vacancy_collector import collect_all_vacancies, collect_vacancies_streaming
+from src.vacancies.application.use_cases.vacancy_outbox import relay_vacancy_outbox
+from src.vacancies.application.use_cases.vacancy_reindex import reindex_vacancies
+from src.vacancies.application.use_cases.vacancy_sync import collect_new_vacancies
+from src.vacancies.domain.entities import CollectionJobStatus, Vacancy, VacancySource
+from src.vacancies.domain.exceptions import SearchIndexingFailed
 from src.core.domain.entities import BulkResult
-from tests.fakes.vacancies import FakeVacancyUnitOfWork, FakeSearchVacancyRepository
+from tests.fakes.vacancies import (
+    FakeCollectionJobStorage,
+    FakeSearchVacancyRepository,
+    FakeSyncStateStorage,
+    FakeVacancySourceClient,
+    FakeVacancyUnitOfWork
+)
 
 
 @pytest.mark.asyncio
@@ -51,3 +64,255 @@ async def test_collect_all_vacancies(monkeypatch):
         "database": db_result,
         "search_db": search_result
     }
+
+
+@pytest.mark.asyncio
+async def test_collect_vacancies_streaming():
+    """
+    Test streaming collection of vacancies in fixed-size batches.
+
+    Ensures that:
+    - Every page produced by the client is stored,
+    - Pages are re-grouped into batches of the requested size,
+    - Partial results are aggregated per storage.
+    """
+    # Arrange
+    pages = [
+        [Vacancy(source_id=str(page * 3 + i), source_name=VacancySource.HEADHUNTER) for i in range(3)]
+        for page in range(5)
+    ]
+    client = FakeVacancySourceClient(pages)
+    uow = FakeVacancyUnitOfWork()
+    search_repo = FakeSearchVacancyRepository()
+    stored_batches = []
+    original_bulk_add_or_update = uow.vacancies.bulk_add_or_update
+
+    async def tracking_bulk_add_or_update(vacancies):
+        stored_batches.append(len(vacancies))
+        return await original_bulk_add_or_update(vacancies)
+
+    uow.vacancies.bulk_add_or_update = tracking_bulk_add_or_update
+    # Act
+    result = await collect_vacancies_streaming(
+        search_params={"query": "python"},
+        client=client,
+        uow=uow,
+        search_repo=search_repo,
+        batch_size=4
+    )
+    # Assert
+    assert client.fetched_pages == 5
+    assert stored_batches == [4, 4, 4, 3]
+    assert len(uow.vacancies._vacancies) == 15
+    assert result == {
+        "database": BulkResult(success=15, failed=0, total=15),
+        "search_db": BulkResult(success=15, failed=0, total=15)
+    }
+
+
+@pytest.mark.asyncio
+async def test_collect_vacancies_streaming_keeps_stored_details():
+    """
+    Test that a collection without enrichment doesn't drop the details of enriched vacancies.
+
+    Ensures that:
+    - Vacancies stored with details keep them when collected from search results only,
+    - Vacancies without stored details are saved as they come.
+    """
+    # Arrange
+    page = [
+        Vacancy(source_id=str(i), source_name=VacancySource.HEADHUNTER, name="Python developer")
+        for i in range(2)
+    ]
+    uow = FakeVacancyUnitOfWork()
+    await uow.vacancies.bulk_add_or_update([
+        page[0].model_copy(update={"full_description": "<p>Full description</p>", "key_skills": ["Python"]})
+    ])
+    search_repo = FakeSearchVacancyRepository()
+    # Act
+    await collect_vacancies_streaming(
+        search_params={"query": "python"},
+        client=FakeVacancySourceClient([page]),
+        uow=uow,
+        search_repo=search_repo
+    )
+    # Assert
+    stored = {vacancy.source_id: vacancy for vacancy in uow.vacancies._vacancies}
+    assert stored["0"].full_description == "<p>Full description</p>"
+    assert stored["0"].key_skills == ["Python"]
+    assert stored["1"].full_description is None
+    assert search_repo._vacancies[0].full_description == "<p>Full description</p>"
+
+
+@pytest.mark.asyncio
+async def test_collect_vacancies_streaming_enriches_changed_vacancies_only():
+    """
+    Test that details are only fetched for vacancies whose stored details are missing or outdated.
+
+    Ensures that:
+    - New vacancies and vacancies stored without details are enriched,
+    - Vacancies whose search result didn't change reuse the stored details,
+    - Modified vacancies are enriched again.
+    """
+    # Arrange
+    vacancies = [
+        Vacancy(source_id=str(i), source_name=VacancySource.HEADHUNTER, name=f"Developer {i}")
+        for i in range(4)
+    ]
+    uow = FakeVacancyUnitOfWork()
+    await collect_vacancies_streaming({"query": "python"}, FakeVacancySourceClient([vacancies[2:3]]), uow, None)
+    await collect_vacancies_streaming(
+        {"query": "python"}, FakeVacancySourceClient([vacancies[:2]]), uow, None, enrich=True
+    )
+    vacancies[1] = vacancies[1].model_copy(update={"name": "Senior developer 1"})
+    client = FakeVacancySourceClient([vacancies])
+    # Act
+    await collect_vacancies_streaming({"query": "python"}, client, uow, None, enrich=True)
+    # Assert
+    assert client.enriched_ids == ["1", "2", "3"]
+    stored = {vacancy.source_id: vacancy for vacancy in uow.vacancies._vacancies}
+    assert stored["0"].full_description == "Details of Developer 0"
+    assert stored["1"].full_description == "Details of Senior developer 1"
+
+
+@pytest.mark.asyncio
+async def test_collect_new_vacancies_moves_high_water_mark():
+    """
+    Test incremental collection of vacancies by a search profile.
+
+    Ensures that:
+    - The first run collects everything and stores the latest publication date,
+    - The next run requests only vacancies published after the high-water mark minus the overlap,
+    - The high-water mark is never moved backwards.
+    """
+    # Arrange
+    start = datetime.datetime(2025, 3, 1, tzinfo=datetime.timezone.utc)
+    pages = [[
+        Vacancy(
+            source_id=str(i),
+            source_name=VacancySource.HEADHUNTER,
+            published_at=(start + datetime.timedelta(hours=i)).isoformat()
+        )
+        for i in range(6)
+    ]]
+    client = FakeVacancySourceClient(pages)
+    state_storage = FakeSyncStateStorage()
+    # Act
+    first_result = await collect_new_vacancies(
+        "python", {"query": "python"}, client, FakeVacancyUnitOfWork(), FakeSearchVacancyRepository(),
+        state_storage
+    )
+    await state_storage.set_high_water_mark("python", start + datetime.timedelta(hours=4))
+    second_result = await collect_new_vacancies(
+        "python", {"query": "python"}, client, FakeVacancyUnitOfWork(), FakeSearchVacancyRepository(),
+        state_storage, overlap=datetime.timedelta(minutes=90)
+    )
+    # Assert
+    assert first_result["database"].total == 6
+    assert second_result["database"].total == 3
+    assert await state_storage.get_high_water_mark("python") == start + datetime.timedelta(hours=5)
+
+
+@pytest.mark.asyncio
+async def test_run_collection_job_resumes_from_checkpoint():
+    """
+    Test that a failed collection job is resumed from its last checkpoint.
+
+    Ensures that:
+    - Pages saved before the failure are checkpointed and the job is marked as failed,
+    - The next attempt requests only the remaining pages,
+    - Statistics are aggregated across attempts.
+    """
+    # Arrange
+    pages = [
+        [Vacancy(source_id=str(page * 2 + i), source_name=VacancySource.HEADHUNTER) for i in range(2)]
+        for page in range(4)
+    ]
+    client = FakeVacancySourceClient(pages)
+    uow = FakeVacancyUnitOfWork()
+    search_repo = FakeSearchVacancyRepository()
+    job_storage = FakeCollectionJobStorage()
+    job = await create_collection_job({"query": "python"}, job_storage)
+    original_bulk_add = search_repo.bulk_add
+
+    async def failing_bulk_add(vacancies):
+        if vacancies[0].source_id == "4":
+            raise ConnectionError("Elasticsearch is unavailable")
+        return await original_bulk_add(vacancies)
+
+    search_repo.bulk_add = failing_bulk_add
+    # Act
+    with pytest.raises(ConnectionError):
+        await run_collection_job(job.id, client, uow, search_repo, job_storage, dict)
+    failed_job = await job_storage.get(job.id)
+    search_repo.bulk_add = original_bulk_add
+    client.fetched_pages = 0
+    completed_job = await run_collection_job(job.id, client, uow, search_repo, job_storage, dict)
+    # Assert
+    assert failed_job.status == CollectionJobStatus.FAILED
+    assert failed_job.completed_pages_count == 2
+    assert client.fetched_pages == 2
+    assert completed_job.status == CollectionJobStatus.COMPLETED
+    assert completed_job.attempts == 2
+    assert completed_job.completed_pages_count == 4
+    assert await job_storage.get_completed_pages(job.id) == {"0", "1", "2", "3"}
+    assert completed_job.statistics["search_db"].success == 8
+
+
+@pytest.mark.asyncio
+async def test_relay_vacancy_outbox_indexes_coalesced_changes():
+    """
+    Test deferred indexing of vacancies through the outbox.
+
+    Ensures that:
+    - Collection without a search repository only writes the database,
+    - The relay indexes every changed vacancy once, in its latest state,
+    - Processed events are removed from the outbox.
+    """
+    # Arrange
+    vacancies = [Vacancy(source_id=str(i), source_name=VacancySource.HEADHUNTER, name="Python") for i in range(3)]
+    renamed = vacancies[0].model_copy(update={"name": "Senior Python"})
+    client = FakeVacancySourceClient([vacancies, [renamed]])
+    uow, search_repo = FakeVacancyUnitOfWork(), FakeSearchVacancyRepository()
+    collection_result = await collect_vacancies_streaming({"query": "python"}, client, uow, None, batch_size=3)
+    # Act
+    result = await relay_vacancy_outbox(uow, search_repo)
+    # Assert
+    assert collection_result["search_db"].skipped == 4
+    assert sorted(vacancy.name for vacancy in search_repo._vacancies) == ["Python", "Python", "Senior Python"]
+    assert uow.vacancies.outbox_events == []
+    assert result.total == 3
+
+
+@pytest.mark.asyncio
+async def test_relay_vacancy_outbox_keeps_events_on_failure():
+    """
+    Test that events stay in the outbox when indexing fails.
+    """
+    # Arrange
+    uow = FakeVacancyUnitOfWork()
+    await uow.vacancies.bulk_add_or_update([Vacancy(source_id="1", source_name=VacancySource.HEADHUNTER)])
+    search_repo = AsyncMock()
+    search_repo.bulk_add.return_value = BulkResult(success=0, failed=1, total=1)
+    # Act
+    with pytest.raises(SearchIndexingFailed):
+        await relay_vacancy_outbox(uow, search_repo)
+    # Assert
+    assert len(uow.vacancies.outbox_events) == 1
+
+
+@pytest.mark.asyncio
+async def test_reindex_vacancies_streams_database_into_search():
+    """
+    Test that a reindex indexes every stored vacancy batch by batch.
+    """
+    # Arrange
+    uow, search_repo = FakeVacancyUnitOfWork(), FakeSearchVacancyRepository()
+    await uow.vacancies.bulk_add_or_update([
+        Vacancy(source_id=str(i), source_name=VacancySource.HEADHUNTER) for i in range(5)
+    ])
+    # Act
+    result = await reindex_vacancies(uow, search_repo, batch_size=2)
+    # Assert
+    assert len(search_repo._vacancies) == 5
+    assert (result.success, result.total) == (5, 5)